@@ -8,14 +8,16 @@ Shell-based administrative interface for managing MOOdBBS database and system.
 import os
 import sys
 import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
+from rich.prompt import Confirm, IntPrompt, Prompt
 from rich.table import Table
 from rich import box
 
+
 console = Console()
 
 DB_PATH = "data/moodbbs.db"
@@ -50,6 +52,9 @@ class MOOdBBSAdmin:
         menu_table.add_row("7", "View Moodlet Statistics")
         menu_table.add_row("8", "View Quest Statistics")
         menu_table.add_row("9", "Run Migrations")
+        menu_table.add_row("l", "View LLM Call Report")
+        menu_table.add_row("e", "Export Data (JSONL/CSV)")
+        menu_table.add_row("i", "Import Data (JSONL/CSV)")
         menu_table.add_row("q", "Quit")
 
         panel = Panel(
@@ -98,6 +103,7 @@ class MOOdBBSAdmin:
                 ("active_moodlets", "Active Moodlets"),
                 ("quests", "Quests"),
                 ("quest_completions", "Quest Completions"),
+                ("quest_templates", "Quest Templates"),
                 ("mood_events", "Mood Events"),
                 ("user_profile", "User Profiles"),
                 ("favorite_locations", "Favorite Locations"),
@@ -487,6 +493,89 @@ class MOOdBBSAdmin:
         console.print()
         Prompt.ask("[yellow]Press Enter to continue[/yellow]")
 
+    def view_llm_stats(self):
+        """View LLM parse latency and failure statistics."""
+        console.clear()
+        console.print("\n[cyan bold]LLM Call Report[/cyan bold]\n")
+
+        if not os.path.exists(DB_PATH):
+            console.print("[red]✗ Database does not exist[/red]")
+            Prompt.ask("[yellow]Press Enter to continue[/yellow]")
+            return
+
+        days = IntPrompt.ask("[cyan]Days to include[/cyan]", default=7)
+        while days < 1:
+            console.print("[prompt.invalid]Please enter at least 1 day")
+            days = IntPrompt.ask("[cyan]Days to include[/cyan]", default=7)
+
+        from src.database.db import Database
+
+        try:
+            report = Database(DB_PATH).get_llm_call_report(days=days)
+        except sqlite3.OperationalError:
+            console.print("[yellow]No llm_calls table yet (run migrations)[/yellow]")
+            report = None
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            report = None
+
+        if report == []:
+            console.print(f"[dim]No LLM calls in the last {days} days[/dim]")
+        elif report:
+            table = Table(title=f"Latency (last {days} days)", box=box.ROUNDED)
+            table.add_column("Kind", style="cyan")
+            table.add_column("Model", style="cyan")
+            table.add_column("Prompt", justify="right", style="dim")
+            table.add_column("Source", style="dim")
+            table.add_column("Calls", justify="right", style="yellow")
+            table.add_column("p50 ms", justify="right", style="green")
+            table.add_column("p95 ms", justify="right", style="green")
+            table.add_column("Max ms", justify="right", style="dim")
+            table.add_column("Failed", justify="right", style="red")
+            table.add_column("Prompt tok", justify="right", style="dim")
+            table.add_column("Tok/s", justify="right", style="dim")
+
+            for row in report:
+                table.add_row(
+                    row['kind'],
+                    row['model'],
+                    f"v{row['prompt_version']}",
+                    row['source'],
+                    str(row['count']),
+                    f"{row['p50_ms']:.0f}",
+                    f"{row['p95_ms']:.0f}",
+                    f"{row['max_ms']:.0f}",
+                    f"{row['failure_rate']:.0%}",
+                    f"{row['avg_prompt_tokens']:.0f}" if row['avg_prompt_tokens'] is not None else "-",
+                    f"{row['tokens_per_second']:.1f}" if row['tokens_per_second'] is not None else "-"
+                )
+            console.print(table)
+
+            parses = [row for row in report if row['kind'] == 'parse']
+            total = sum(row['count'] for row in parses)
+            if total:
+                cached = sum(row['count'] for row in parses if row['source'] == 'cache')
+                rules = sum(row['count'] for row in parses if row['source'] == 'rules')
+                console.print(f"\nParses: {total}  "
+                              f"[green]cache hits {cached / total:.0%}[/green]  "
+                              f"[green]rule fast path {rules / total:.0%}[/green]")
+
+            outcomes = {}
+            for row in report:
+                for outcome, count in row['outcomes'].items():
+                    outcomes[outcome] = outcomes.get(outcome, 0) + count
+
+            outcome_table = Table(title="Outcomes", box=box.ROUNDED)
+            outcome_table.add_column("Outcome", style="cyan")
+            outcome_table.add_column("Count", justify="right", style="yellow")
+            for outcome, count in sorted(outcomes.items(), key=lambda item: item[1], reverse=True):
+                outcome_table.add_row(outcome, str(count))
+            console.print()
+            console.print(outcome_table)
+
+        console.print()
+        Prompt.ask("[yellow]Press Enter to continue[/yellow]")
+
     def run_migrations(self):
         """Run database migrations."""
         console.clear()
@@ -510,6 +599,71 @@ class MOOdBBSAdmin:
         console.print()
         Prompt.ask("[yellow]Press Enter to continue[/yellow]")
 
+    def export_data(self):
+        """Stream quests, templates or completions to a JSONL/CSV file."""
+        console.clear()
+        console.print("\n[cyan bold]Export Data[/cyan bold]\n")
+
+        if not os.path.exists(DB_PATH):
+            console.print("[red]✗ Database does not exist[/red]")
+            Prompt.ask("[yellow]Press Enter to continue[/yellow]")
+            return
+
+        from src.database.bulk_io import BulkTransfer, RECORD_KINDS
+
+        kind = Prompt.ask("[yellow]What to export[/yellow]", choices=list(RECORD_KINDS), default="quests")
+        default_path = f"data/export_{kind}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        path = Prompt.ask("[yellow]Output file (.jsonl or .csv)[/yellow]", default=default_path)
+
+        try:
+            start = time.perf_counter()
+            count = BulkTransfer(DB_PATH).export_records(kind, path)
+            elapsed = time.perf_counter() - start
+            console.print(f"[green]✓ Exported {count} {kind} to {path}[/green] [dim]({elapsed:.2f}s)[/dim]")
+        except Exception as e:
+            console.print(f"[red]✗ Export failed: {e}[/red]")
+
+        console.print()
+        Prompt.ask("[yellow]Press Enter to continue[/yellow]")
+
+    def import_data(self):
+        """Stream quests, templates or completions from a JSONL/CSV file."""
+        console.clear()
+        console.print("\n[cyan bold]Import Data[/cyan bold]\n")
+
+        if not os.path.exists(DB_PATH):
+            console.print("[red]✗ Database does not exist[/red]")
+            console.print("[yellow]Create database first (option 2)[/yellow]")
+            Prompt.ask("[yellow]Press Enter to continue[/yellow]")
+            return
+
+        from src.database.bulk_io import BulkTransfer, RECORD_KINDS
+
+        kind = Prompt.ask("[yellow]What to import[/yellow]", choices=list(RECORD_KINDS), default="templates")
+        path = Prompt.ask("[yellow]Input file (.jsonl or .csv)[/yellow]")
+
+        if not os.path.exists(path):
+            console.print(f"[red]✗ File not found: {path}[/red]")
+            Prompt.ask("[yellow]Press Enter to continue[/yellow]")
+            return
+
+        console.print("[dim]Records with an existing id will be replaced. The import is all-or-nothing.[/dim]")
+        if not Confirm.ask(f"Import {kind} from {path}?", default=False):
+            console.print("[dim]Cancelled[/dim]")
+            Prompt.ask("[yellow]Press Enter to continue[/yellow]")
+            return
+
+        try:
+            start = time.perf_counter()
+            count = BulkTransfer(DB_PATH).import_records(kind, path)
+            elapsed = time.perf_counter() - start
+            console.print(f"[green]✓ Imported {count} {kind}[/green] [dim]({elapsed:.2f}s)[/dim]")
+        except Exception as e:
+            console.print(f"[red]✗ Import failed, nothing was changed: {e}[/red]")
+
+        console.print()
+        Prompt.ask("[yellow]Press Enter to continue[/yellow]")
+
     def run(self):
         """Main admin loop."""
         while self.running:
@@ -534,6 +688,12 @@ class MOOdBBSAdmin:
                 self.view_quest_stats()
             elif choice == '9':
                 self.run_migrations()
+            elif choice == 'l':
+                self.view_llm_stats()
+            elif choice == 'e':
+                self.export_data()
+            elif choice == 'i':
+                self.import_data()
             elif choice == 'q':
                 self.running = False
             else:
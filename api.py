@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""MOOdBBS HTTP API Launcher."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.api.server import main
+
+if __name__ == "__main__":
+    main()
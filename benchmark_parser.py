@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark LLMQuestParser against the fake Ollama server.
+
+Measures throughput (sequential vs. concurrent), streaming time to first
+field, cache hit rates and timeout/circuit-breaker behavior, all offline.
+
+Usage:
+    python benchmark_parser.py [--count 20] [--latency 0.2] [--token-delay 0.01]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+from rich.console import Console
+from rich.table import Table
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.llm_quest_parser import LLMQuestParser, REQUIRED_FIELDS
+from src.services.parse_cache import ParseCache
+from tests.fake_ollama import FakeOllamaServer
+
+console = Console()
+
+
+def make_parser(server, **kwargs):
+    """Parser with its own session and breaker so scenarios don't interact."""
+    kwargs.setdefault("breaker", CircuitBreaker())
+    return LLMQuestParser(ollama_host=server.url, session=requests.Session(), **kwargs)
+
+
+def ideas(count):
+    return [f"Quest idea number {i}" for i in range(count)]
+
+
+def bench_throughput(server, count):
+    """Sequential parse_quest vs. parse_many."""
+    rows = []
+
+    parser = make_parser(server)
+    start = time.perf_counter()
+    ok = sum(1 for idea in ideas(count) if parser.parse_quest(idea))
+    elapsed = time.perf_counter() - start
+    rows.append(("sequential", count, ok, elapsed))
+
+    for concurrency in (4, 8):
+        parser = make_parser(server)
+        start = time.perf_counter()
+        ok = sum(1 for _, _, data in parser.parse_many(ideas(count), max_concurrency=concurrency) if data)
+        elapsed = time.perf_counter() - start
+        rows.append((f"parse_many x{concurrency}", count, ok, elapsed))
+
+    table = Table(title="Throughput")
+    table.add_column("Mode")
+    table.add_column("Parses", justify="right")
+    table.add_column("OK", justify="right")
+    table.add_column("Total (s)", justify="right")
+    table.add_column("Parses/s", justify="right")
+    for mode, n, ok, elapsed in rows:
+        table.add_row(mode, str(n), str(ok), f"{elapsed:.2f}", f"{n / elapsed:.1f}")
+    console.print(table)
+
+
+def bench_streaming(server, count):
+    """Time to first field and to completion, blocking vs. streaming."""
+    table = Table(title="Streaming")
+    table.add_column("Mode")
+    table.add_column("First field p50 (ms)", justify="right")
+    table.add_column("Done p50 (ms)", justify="right")
+
+    for label, stream, stop_after in (
+        ("blocking", False, REQUIRED_FIELDS),
+        ("streaming, all fields", True, ("title", "description", "category", "xp_reward",
+                                         "renewal_type", "constraint_type", "constraint_note", "time_note")),
+        ("streaming, required only", True, REQUIRED_FIELDS),
+    ):
+        parser = make_parser(server, stream=stream)
+        first, done = [], []
+        for idea in ideas(count):
+            start = time.perf_counter()
+            marks = []
+            parser.parse_quest(idea, on_field=lambda k, v: marks.append(time.perf_counter()), stop_after=stop_after)
+            done.append((time.perf_counter() - start) * 1000)
+            if marks:
+                first.append((marks[0] - start) * 1000)
+        table.add_row(
+            label,
+            f"{statistics.median(first):.0f}" if first else "-",
+            f"{statistics.median(done):.0f}"
+        )
+    console.print(table)
+
+
+def bench_cache(server, count):
+    """Hit rate and latency with half the inputs repeated (differently cased)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        parser = make_parser(server, cache=ParseCache(str(Path(tmp) / "cache.db")))
+        inputs = ideas(count // 2) + [idea.upper() for idea in ideas(count // 2)]
+
+        miss_times, hit_times = [], []
+        for idea in inputs:
+            hits_before = parser.cache.hits
+            start = time.perf_counter()
+            parser.parse_quest(idea)
+            elapsed = (time.perf_counter() - start) * 1000
+            (hit_times if parser.cache.hits > hits_before else miss_times).append(elapsed)
+
+        total = parser.cache.hits + parser.cache.misses
+        table = Table(title="Cache")
+        table.add_column("Lookups", justify="right")
+        table.add_column("Hit rate", justify="right")
+        table.add_column("Miss p50 (ms)", justify="right")
+        table.add_column("Hit p50 (ms)", justify="right")
+        table.add_row(
+            str(total),
+            f"{parser.cache.hits / total:.0%}",
+            f"{statistics.median(miss_times):.1f}" if miss_times else "-",
+            f"{statistics.median(hit_times):.3f}" if hit_times else "-"
+        )
+        console.print(table)
+        parser.cache.close()
+
+
+def bench_failures(server):
+    """Read timeouts, then fail-fast once the breaker opens."""
+    saved_latency = server.latency
+    server.latency = 1.0
+    parser = make_parser(server, timeout=(1.0, 0.25), breaker=CircuitBreaker(failure_threshold=3))
+
+    table = Table(title="Timeouts and circuit breaker")
+    table.add_column("Call", justify="right")
+    table.add_column("Result")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Breaker")
+
+    for i in range(1, 6):
+        start = time.perf_counter()
+        result = parser.parse_quest(f"slow idea {i}")
+        elapsed = (time.perf_counter() - start) * 1000
+        table.add_row(str(i), "ok" if result else "failed", f"{elapsed:.1f}", parser.breaker.state)
+
+    start = time.perf_counter()
+    available = parser.is_available()
+    table.add_row("is_available", str(available), f"{(time.perf_counter() - start) * 1000:.2f}", parser.breaker.state)
+    console.print(table)
+
+    server.latency = saved_latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LLM quest parser against a fake Ollama")
+    parser.add_argument("--count", type=int, default=20, help="parses per scenario")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake prompt evaluation time (s)")
+    parser.add_argument("--token-delay", type=float, default=0.01, help="fake time per streamed chunk (s)")
+    args = parser.parse_args()
+
+    console.print(f"\n[bold cyan]LLM parser benchmark[/bold cyan] "
+                  f"[dim](latency {args.latency}s, {args.token_delay}s/chunk, {args.count} parses)[/dim]\n")
+
+    with FakeOllamaServer(latency=args.latency, token_delay=args.token_delay) as server:
+        bench_throughput(server, args.count)
+        bench_streaming(server, min(args.count, 10))
+        bench_cache(server, args.count)
+        bench_failures(server)
+
+
+if __name__ == "__main__":
+    main()
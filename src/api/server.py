@@ -0,0 +1,528 @@
+"""Local HTTP JSON API over the engine, for Home Assistant and scripts.
+
+Serves the endpoints planned in product/TECHNICAL_REQUIREMENTS.md:
+
+    GET  /api/mood/current      Current mood score, face and modifiers
+    GET  /api/mood/history      Mood events from the last ?days=7 days
+    POST /api/mood/event        Log a mood event
+    GET  /api/quests/active     Active quests
+    POST /api/quests/complete   Complete a quest
+    GET  /api/traits            Active traits
+    GET  /api/stats             Request latency histograms and cache counters
+
+Every engine call runs on one writer thread, so changes are applied one
+at a time and the engine is never used from two threads. GET responses
+are cached as encoded JSON against the engine's state version: until
+something changes they're answered from the event loop without touching
+the engine, however many clients are polling. Changes made by the TUI or
+shell (in other processes) are picked up within sync_interval.
+
+Run standalone:
+
+    python -m src.api.server --host 0.0.0.0 --port 8080
+"""
+
+import argparse
+import asyncio
+import bisect
+import functools
+import json
+import math
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.engine import MOOdBBSEngine
+from src.shell.json_output import to_jsonable
+
+MAX_BODY_BYTES = 64 * 1024
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+# History also changes as days roll out of the window; rebuild at least this often
+HISTORY_TTL = timedelta(minutes=1)
+
+Query = Dict[str, List[str]]
+Handler = Callable[[Query, Any], Awaitable[Tuple[int, bytes]]]
+
+
+class HttpError(Exception):
+    """A request the server can't handle, answered with an error status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class LatencyHistogram:
+    """Request latencies counted into fixed buckets."""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        """Create an empty histogram.
+
+        Args:
+            buckets_ms: Bucket upper bounds in milliseconds, ascending
+        """
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)  # Last bucket: over the top bound
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float):
+        """Count one request."""
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Estimate a percentile.
+
+        Args:
+            pct: Percentile, 0-100
+
+        Returns:
+            Upper bound of the bucket holding it, in milliseconds (the
+            maximum for the overflow bucket), or None with no requests
+        """
+        if not self.count:
+            return None
+        rank = max(math.ceil(self.count * pct / 100), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = self.buckets_ms[index] if index < len(self.buckets_ms) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary and bucket counts, for /api/stats."""
+        buckets = {f"<={bound:g}ms": count for bound, count in zip(self.buckets_ms, self.counts)}
+        buckets[f">{self.buckets_ms[-1]:g}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class _CachedResponse:
+    """An encoded GET response and the state it was built from."""
+    state_version: int
+    valid_until: datetime
+    body: bytes
+
+
+def encode(value: Any) -> bytes:
+    """Encode an engine result as a compact JSON body."""
+    return json.dumps(to_jsonable(value), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _int_param(query: Query, name: str, default: int, low: int, high: int) -> int:
+    """Read an integer query parameter.
+
+    Raises:
+        ValueError: If it isn't an integer from low to high
+    """
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+    if not low <= value <= high:
+        raise ValueError(f"{name} must be between {low} and {high}")
+    return value
+
+
+def _field(body: Dict[str, Any], name: str, kind: type, required: bool = False, default: Any = None) -> Any:
+    """Read a field from a JSON request body.
+
+    Raises:
+        ValueError: If it's missing (when required) or of the wrong type
+    """
+    if body.get(name) is None:
+        if required:
+            raise ValueError(f"{name} is required")
+        return default
+    value = body[name]
+    # bool is an int subclass, but true is not a mood modifier
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        raise ValueError(f"{name} must be {'an integer' if kind is int else 'a string'}")
+    return value
+
+
+def _response(status: int, body: bytes, keep_alive: bool) -> bytes:
+    status = HTTPStatus(status)
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class ApiServer:
+    """Asyncio HTTP server answering the JSON API from an engine."""
+
+    def __init__(
+        self,
+        engine: MOOdBBSEngine,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        idle_timeout: float = 30.0,
+        sync_interval: float = 0.1
+    ):
+        """Create the server; nothing listens until start().
+
+        Args:
+            engine: Engine to serve; from here on only the server's writer
+                thread may use it
+            host: Address to listen on ("0.0.0.0" for the whole LAN)
+            port: Port to listen on (0 picks a free one)
+            idle_timeout: Seconds before an idle keep-alive connection is closed
+            sync_interval: Seconds between checks for changes made to the
+                database by other processes
+        """
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.sync_interval = sync_interval
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: Dict[str, _CachedResponse] = {}
+        self._building: Dict[str, asyncio.Future] = {}
+        self._synced_at: Optional[float] = None
+        self._syncing: Optional[asyncio.Future] = None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="moodbbs-api-writer")
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes: Dict[Tuple[str, str], Handler] = {
+            ("GET", "/api/mood/current"): self._mood_current,
+            ("GET", "/api/mood/history"): self._mood_history,
+            ("POST", "/api/mood/event"): self._mood_event,
+            ("GET", "/api/quests/active"): self._quests_active,
+            ("POST", "/api/quests/complete"): self._quests_complete,
+            ("GET", "/api/traits"): self._traits,
+            ("GET", "/api/stats"): self._stats,
+        }
+
+    async def start(self) -> "ApiServer":
+        """Start listening.
+
+        Returns:
+            self, with port set to the bound port
+        """
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening and let the writer finish its queue."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._writer.shutdown(wait=True)
+
+    # ==================== Engine access ====================
+
+    async def _call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run an engine call on the writer thread, after any queued before it."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer, functools.partial(fn, *args, **kwargs))
+
+    async def _sync(self):
+        """Reload the engine if another process changed the database.
+
+        Checked at most every sync_interval; concurrent requests share one
+        check. A reload bumps the state version, dropping cached responses.
+        """
+        if self._synced_at is not None and time.monotonic() - self._synced_at < self.sync_interval:
+            return
+        if self._syncing is None:
+            self._syncing = asyncio.ensure_future(self._call(self.engine.refresh_if_changed))
+            self._syncing.add_done_callback(self._sync_done)
+        await asyncio.shield(self._syncing)
+
+    def _sync_done(self, future: asyncio.Future):
+        self._synced_at = time.monotonic()
+        self._syncing = None
+
+    async def _cached(self, key: str, build: Callable[[], Tuple[Any, datetime]]) -> bytes:
+        """Get a GET response body, rebuilding it only after a change.
+
+        Concurrent misses for the same key share one rebuild.
+
+        Args:
+            key: Cache key (route plus parameters)
+            build: Runs on the writer thread; returns (value, valid_until)
+
+        Returns:
+            Encoded JSON body
+        """
+        await self._sync()
+        entry = self._cache.get(key)
+        if (
+            entry is not None
+            and entry.state_version == self.engine.state_version
+            and datetime.now(timezone.utc) < entry.valid_until
+        ):
+            self.cache_hits += 1
+            return entry.body
+
+        self.cache_misses += 1
+        pending = self._building.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._rebuild(key, build))
+            self._building[key] = pending
+            pending.add_done_callback(lambda _: self._building.pop(key, None))
+        # A client hanging up mustn't cancel the rebuild other requests wait on
+        return await asyncio.shield(pending)
+
+    async def _rebuild(self, key: str, build: Callable[[], Tuple[Any, datetime]]) -> bytes:
+        entry = await self._call(self._build_entry, build)
+        self._cache[key] = entry
+        return entry.body
+
+    def _build_entry(self, build: Callable[[], Tuple[Any, datetime]]) -> _CachedResponse:
+        # On the writer thread, so nothing can change between these lines
+        state_version = self.engine.state_version
+        value, valid_until = build()
+        return _CachedResponse(state_version, valid_until, encode(value))
+
+    def _snapshot_view(self, view: Callable[[Any], Any]) -> Callable[[], Tuple[Any, datetime]]:
+        """Builder for a response drawn from the dashboard snapshot."""
+        def build():
+            snapshot = self.engine.get_dashboard_snapshot()
+            return view(snapshot), snapshot.valid_until
+        return build
+
+    # ==================== Endpoints ====================
+
+    async def _mood_current(self, query: Query, body: Any) -> Tuple[int, bytes]:
+        return HTTPStatus.OK, await self._cached("mood", self._snapshot_view(lambda snapshot: {
+            "mood_score": snapshot.mood_score,
+            "mood_face": snapshot.mood_face,
+            "modifiers": snapshot.modifiers,
+            "traits": snapshot.traits,
+            "state_version": snapshot.state_version,
+            "as_of": snapshot.built_at,
+        }))
+
+    async def _mood_history(self, query: Query, body: Any) -> Tuple[int, bytes]:
+        days = _int_param(query, "days", default=7, low=1, high=365)
+
+        def build():
+            events = self.engine.get_mood_history(days=days)
+            return {"days": days, "events": events}, datetime.now(timezone.utc) + HISTORY_TTL
+
+        return HTTPStatus.OK, await self._cached(f"history:{days}", build)
+
+    async def _mood_event(self, query: Query, body: Any) -> Tuple[int, bytes]:
+        event_type = _field(body, "event_type", str, required=True).strip()
+        if not event_type:
+            raise ValueError("event_type must not be empty")
+        modifier = _field(body, "modifier", int, required=True)
+        description = _field(body, "description", str, default="")
+        duration_hours = _field(body, "duration_hours", int)
+        if duration_hours is not None and duration_hours <= 0:
+            raise ValueError("duration_hours must be positive")
+
+        event = await self._call(
+            self.engine.log_mood_event, event_type, modifier,
+            description=description, duration_hours=duration_hours
+        )
+        return HTTPStatus.CREATED, encode(event)
+
+    async def _quests_active(self, query: Query, body: Any) -> Tuple[int, bytes]:
+        return HTTPStatus.OK, await self._cached("quests", self._snapshot_view(lambda snapshot: {
+            "quests": snapshot.active_quests,
+            "max_active_quests": snapshot.max_active_quests,
+        }))
+
+    async def _quests_complete(self, query: Query, body: Any) -> Tuple[int, bytes]:
+        quest_id = _field(body, "quest_id", int, required=True)
+        notes = _field(body, "notes", str, default="")
+
+        result = await self._call(self.engine.complete_quest, quest_id, notes=notes)
+        return HTTPStatus.OK, encode(result)
+
+    async def _traits(self, query: Query, body: Any) -> Tuple[int, bytes]:
+        return HTTPStatus.OK, await self._cached("traits", self._snapshot_view(lambda snapshot: {
+            "traits": snapshot.traits,
+        }))
+
+    async def _stats(self, query: Query, body: Any) -> Tuple[int, bytes]:
+        return HTTPStatus.OK, encode({
+            "routes": {route: histogram.to_dict() for route, histogram in sorted(self.latency.items())},
+            "cache": {"hits": self.cache_hits, "misses": self.cache_misses},
+        })
+
+    # ==================== HTTP ====================
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer requests on one connection until it closes or idles out."""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), self.idle_timeout)
+                except HttpError as e:
+                    writer.write(_response(e.status, encode({"error": str(e)}), keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                method, target, keep_alive, body = request
+                started = time.perf_counter()
+                route, status, payload = await self.dispatch(method, target, body)
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                self.latency.setdefault(route, LatencyHistogram()).observe(time.perf_counter() - started)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bool, bytes]]:
+        """Read one request.
+
+        Returns:
+            (method, target, keep_alive, body), or None when the client is done
+
+        Raises:
+            HttpError: For malformed or oversized requests
+        """
+        try:
+            line = await reader.readline()
+            if not line.strip():
+                return None
+            try:
+                method, target, version = line.decode("latin-1").split()
+            except ValueError:
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line") from None
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            # StreamReader's line limit
+            raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Request headers too large") from None
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from None
+        if length > MAX_BODY_BYTES:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body over {MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length > 0 else b""
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+        return method.upper(), target, keep_alive, body
+
+    async def dispatch(self, method: str, target: str, body: bytes = b"") -> Tuple[str, int, bytes]:
+        """Answer one request.
+
+        Args:
+            method: HTTP method
+            target: Request path and query string
+            body: Request body (JSON for POST endpoints)
+
+        Returns:
+            (route name for the latency histograms, status, JSON body)
+        """
+        url = urlsplit(target)
+        handler = self._routes.get((method, url.path))
+        if handler is None:
+            if any(path == url.path for _, path in self._routes):
+                return "other", HTTPStatus.METHOD_NOT_ALLOWED, encode({"error": f"{method} not allowed"})
+            return "other", HTTPStatus.NOT_FOUND, encode({"error": f"No such endpoint: {url.path}"})
+
+        route = f"{method} {url.path}"
+        try:
+            payload = {}
+            if method == "POST":
+                payload = json.loads(body or b"{}")
+                if not isinstance(payload, dict):
+                    raise ValueError("Request body must be a JSON object")
+            status, data = await handler(parse_qs(url.query), payload)
+        except ValueError as e:
+            # Bad JSON, failed validation, or the engine refusing (unknown quest...)
+            return route, HTTPStatus.BAD_REQUEST, encode({"error": str(e)})
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            return route, HTTPStatus.INTERNAL_SERVER_ERROR, encode({"error": "Internal server error"})
+        return route, status, data
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the API server.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="MOOdBBS HTTP JSON API")
+    parser.add_argument("--db", default="data/moodbbs.db", help="database path (default: %(default)s)")
+    parser.add_argument(
+        "--host", default="127.0.0.1",
+        help="address to listen on (default: %(default)s; 0.0.0.0 for the LAN)"
+    )
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    server = ApiServer(MOOdBBSEngine(db_path=args.db), host=args.host, port=args.port)
+
+    async def run():
+        await server.start()
+        print(f"MOOdBBS API listening on http://{server.host}:{server.port}/api/", flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
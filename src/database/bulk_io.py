@@ -0,0 +1,329 @@
+"""Streaming bulk import/export of quests, templates and completions."""
+
+import csv
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Column specs per exportable record kind: (table, [(column, type), ...]).
+# Types: "int", "text", "json" (stored as a JSON string in SQLite).
+RECORD_KINDS: Dict[str, Tuple[str, List[Tuple[str, str]]]] = {
+    "quests": ("quests", [
+        ("id", "int"),
+        ("template_id", "text"),
+        ("title", "text"),
+        ("description", "text"),
+        ("category", "text"),
+        ("difficulty", "text"),
+        ("location", "text"),
+        ("xp_reward", "int"),
+        ("status", "text"),
+        ("renewal_type", "text"),
+        ("renewal_cooldown_days", "int"),
+        ("renewal_active_months", "json"),
+        ("next_eligible_renewal", "text"),
+        ("renewal_count", "int"),
+        ("constraint_type", "text"),
+        ("constraint_note", "text"),
+        ("created_at", "text"),
+        ("completed_at", "text"),
+        ("due_at", "text"),
+    ]),
+    "templates": ("quest_templates", [
+        ("id", "text"),
+        ("title", "text"),
+        ("description", "text"),
+        ("category", "text"),
+        ("difficulty", "text"),
+        ("base_xp", "int"),
+        ("optionality", "text"),
+        ("suggested_locations", "json"),
+        ("duration_estimate", "text"),
+        ("tags", "json"),
+        ("difficulty_factors", "json"),
+        ("renewal_type", "text"),
+        ("renewal_cooldown_days", "int"),
+        ("renewal_active_months", "json"),
+    ]),
+    "completions": ("quest_completions", [
+        ("id", "int"),
+        ("quest_id", "int"),
+        ("completed_at", "text"),
+        ("location_visited", "text"),
+        ("duration_minutes", "int"),
+        ("notes", "text"),
+        ("xp_awarded", "int"),
+    ]),
+}
+
+# Child rows carried as a JSON column of their parent record, as a list of
+# value lists: kind -> (column, child table, foreign key, child columns).
+# A record without the column leaves the existing child rows alone.
+NESTED_COLUMNS: Dict[str, Tuple[str, str, str, List[str]]] = {
+    "completions": ("mood_modifiers", "quest_completion_modifiers", "completion_id", ["event_type", "modifier"]),
+}
+
+FORMATS = ("jsonl", "csv")
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """Work out the file format from an explicit name or the file extension.
+
+    Args:
+        path: File path
+        fmt: Explicit format ("jsonl" or "csv"), or None to use the extension
+
+    Returns:
+        Format name
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt is None:
+        fmt = Path(path).suffix.lstrip(".").lower()
+        if fmt == "json":
+            fmt = "jsonl"
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}' (expected one of: {', '.join(FORMATS)})")
+
+    return fmt
+
+
+class BulkTransfer:
+    """Stream records between SQLite and JSONL/CSV files in bounded memory.
+
+    Exports read with chunked fetchmany() and write row by row; imports
+    read the file lazily and insert with batched executemany() inside a
+    single transaction, so a failed import leaves the database untouched.
+    """
+
+    def __init__(self, db_path: str = "data/moodbbs.db", chunk_size: int = 1000):
+        """Initialize bulk transfer.
+
+        Args:
+            db_path: Path to SQLite database file
+            chunk_size: Rows fetched or inserted per batch
+        """
+        self.db_path = db_path
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def _get_spec(kind: str) -> Tuple[str, List[Tuple[str, str]]]:
+        if kind not in RECORD_KINDS:
+            raise ValueError(f"Unknown record kind '{kind}' (expected one of: {', '.join(RECORD_KINDS)})")
+        return RECORD_KINDS[kind]
+
+    @staticmethod
+    def _select_list(kind: str, table: str, names: List[str]) -> str:
+        """Columns to export, with nested child rows aggregated to a JSON array."""
+        select = list(names)
+        if kind in NESTED_COLUMNS:
+            column, child_table, foreign_key, child_columns = NESTED_COLUMNS[kind]
+            select.append(
+                f"(SELECT json_group_array(json_array({', '.join(child_columns)})) "
+                f"FROM {child_table} WHERE {foreign_key} = {table}.id ORDER BY rowid) AS {column}"
+            )
+        return ", ".join(select)
+
+    # ==================== Export ====================
+
+    def export_records(self, kind: str, path: str, fmt: Optional[str] = None) -> int:
+        """Export all records of a kind to a file.
+
+        Args:
+            kind: "quests", "templates" or "completions"
+            path: Destination file path
+            fmt: "jsonl" or "csv" (defaults to the file extension)
+
+        Returns:
+            Number of records written
+        """
+        table, columns = self._get_spec(kind)
+        fmt = detect_format(path, fmt)
+        select = self._select_list(kind, table, [name for name, _ in columns])
+        if kind in NESTED_COLUMNS:
+            columns = columns + [(NESTED_COLUMNS[kind][0], "json")]
+        names = [name for name, _ in columns]
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        count = 0
+        try:
+            cursor = conn.execute(f"SELECT {select} FROM {table} ORDER BY id")
+
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = None
+                if fmt == "csv":
+                    writer = csv.writer(f)
+                    writer.writerow(names)
+
+                while True:
+                    rows = cursor.fetchmany(self.chunk_size)
+                    if not rows:
+                        break
+
+                    for row in rows:
+                        if writer is not None:
+                            # JSON columns are already JSON text in SQLite
+                            writer.writerow(["" if v is None else v for v in row])
+                        else:
+                            record = {
+                                name: self._decode_json(value) if col_type == "json" else value
+                                for (name, col_type), value in zip(columns, row)
+                            }
+                            f.write(json.dumps(record, ensure_ascii=False))
+                            f.write("\n")
+                    count += len(rows)
+        finally:
+            conn.close()
+
+        return count
+
+    # ==================== Import ====================
+
+    def import_records(self, kind: str, path: str, fmt: Optional[str] = None) -> int:
+        """Import records of a kind from a file, replacing rows with the same id.
+
+        Args:
+            kind: "quests", "templates" or "completions"
+            path: Source file path
+            fmt: "jsonl" or "csv" (defaults to the file extension)
+
+        Returns:
+            Number of records imported
+
+        Raises:
+            ValueError: If a record is malformed (nothing is imported)
+        """
+        table, columns = self._get_spec(kind)
+        fmt = detect_format(path, fmt)
+        names = [name for name, _ in columns]
+        placeholders = ", ".join("?" for _ in names)
+        sql = f"INSERT OR REPLACE INTO {table} ({', '.join(names)}) VALUES ({placeholders})"
+        nested = NESTED_COLUMNS.get(kind)
+        id_index = names.index("id")
+
+        conn = sqlite3.connect(self.db_path)
+        count = 0
+        try:
+            with conn:
+                batch = []
+                children = []  # (parent id, child rows or None) per record in batch
+                for line_number, record in self._read_records(path, fmt):
+                    try:
+                        row = self._to_row(record, columns, fmt)
+                        if nested is not None:
+                            children.append((row[id_index], self._to_child_rows(record, nested, fmt)))
+                    except (TypeError, ValueError) as e:
+                        raise ValueError(f"{path}:{line_number}: {e}") from e
+                    batch.append(row)
+
+                    if len(batch) >= self.chunk_size:
+                        self._insert_batch(conn, sql, batch, nested, children)
+                        count += len(batch)
+                        batch, children = [], []
+
+                if batch:
+                    self._insert_batch(conn, sql, batch, nested, children)
+                    count += len(batch)
+        finally:
+            conn.close()
+
+        return count
+
+    @staticmethod
+    def _insert_batch(
+        conn: sqlite3.Connection,
+        sql: str,
+        batch: List[Tuple],
+        nested: Optional[Tuple[str, str, str, List[str]]],
+        children: List[Tuple[Any, Optional[List[List[Any]]]]]
+    ):
+        """Insert a batch of records, replacing the child rows of those that carry them."""
+        conn.executemany(sql, batch)
+        if nested is None:
+            return
+
+        _, child_table, foreign_key, child_columns = nested
+        replaced = [(parent_id, rows) for parent_id, rows in children if rows is not None]
+        conn.executemany(f"DELETE FROM {child_table} WHERE {foreign_key} = ?", [(parent_id,) for parent_id, _ in replaced])
+        conn.executemany(
+            f"INSERT INTO {child_table} ({foreign_key}, {', '.join(child_columns)}) "
+            f"VALUES ({', '.join('?' for _ in range(len(child_columns) + 1))})",
+            [(parent_id, *row) for parent_id, rows in replaced for row in rows]
+        )
+
+    def _read_records(self, path: str, fmt: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Lazily yield (line_number, record) pairs from a file."""
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            if fmt == "csv":
+                reader = csv.DictReader(f)
+                for record in reader:
+                    yield reader.line_num, record
+            else:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield line_number, json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"{path}:{line_number}: invalid JSON ({e.msg})") from e
+
+    @staticmethod
+    def _decode_json(value: Optional[str]) -> Any:
+        if value is None or value == "":
+            return None
+        return json.loads(value)
+
+    @staticmethod
+    def _to_child_rows(
+        record: Dict[str, Any],
+        nested: Tuple[str, str, str, List[str]],
+        fmt: str
+    ) -> Optional[List[List[Any]]]:
+        """Read a record's nested child rows, or None if it doesn't carry them."""
+        column, _, _, child_columns = nested
+        value = record.get(column) if isinstance(record, dict) else None
+        if value is None or (fmt == "csv" and value == ""):
+            return None
+        if isinstance(value, str):
+            value = json.loads(value)
+
+        if not isinstance(value, list) or not all(
+            isinstance(row, list) and len(row) == len(child_columns) for row in value
+        ):
+            raise ValueError(f"{column} must be a list of [{', '.join(child_columns)}] lists")
+        return value
+
+    @staticmethod
+    def _to_row(record: Dict[str, Any], columns: List[Tuple[str, str]], fmt: str) -> Tuple:
+        """Convert a parsed record to an INSERT parameter tuple."""
+        if not isinstance(record, dict):
+            raise ValueError("record must be an object")
+
+        row = []
+        for name, col_type in columns:
+            value = record.get(name)
+
+            # CSV has no null; treat empty cells as missing
+            if fmt == "csv" and value == "":
+                value = None
+
+            if value is None:
+                row.append(None)
+            elif col_type == "int":
+                row.append(int(value))
+            elif col_type == "json":
+                if fmt == "csv":
+                    json.loads(value)  # Validate, store as-is
+                    row.append(value)
+                else:
+                    row.append(json.dumps(value))
+            else:
+                row.append(str(value))
+
+        return tuple(row)
@@ -1,13 +1,15 @@
 """Database connection and operations for MOOdBBS."""
 
+import math
 import sqlite3
 import json
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from contextlib import contextmanager
 
-from src.domain.quests import Quest, QuestCompletion, RenewalPolicy, QuestSnooze
+from src.domain.quests import Quest, QuestCompletion, QuestTemplate, RenewalPolicy, QuestSnooze
 from src.domain.mood import MoodEvent
 from src.domain.traits import Trait
 from src.domain.user_profile import UserProfile
@@ -23,27 +25,110 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._local = threading.local()
+        # Long-lived connection for PRAGMA data_version (see changed_elsewhere)
+        self._watch: Optional[sqlite3.Connection] = None
+        self._watch_lock = threading.Lock()
+        self._seen_data_version: Optional[int] = None
 
         # Ensure data directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize schema
         self._init_schema()
+        self.mark_seen()
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection context manager."""
+        """Get database connection context manager.
+
+        Inside transaction() (on the same thread) this reuses the
+        transaction's connection, wrapped in a savepoint so a failed
+        operation is undone without ending the transaction.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.execute("SAVEPOINT op")
+            try:
+                yield conn
+                conn.execute("RELEASE op")
+            except Exception:
+                conn.execute("ROLLBACK TO op")
+                conn.execute("RELEASE op")
+                raise
+            return
+
+        before = self._data_version()
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
             conn.commit()
+            if conn.total_changes:
+                self._absorb_own_write(before)
         except Exception:
             conn.rollback()
             raise
         finally:
             conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """Run every operation inside the block in a single transaction.
+
+        Commits once at the end, or rolls everything back if the block
+        raises. Only operations on the calling thread join the
+        transaction; nested calls join the outer one.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+
+        before = self._data_version()
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("BEGIN")
+        self._local.conn = conn
+        try:
+            yield
+            conn.commit()
+            if conn.total_changes:
+                self._absorb_own_write(before)
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            conn.close()
+
+    def _data_version(self) -> int:
+        """SQLite's data_version on the watch connection.
+
+        It changes whenever any other connection (in this process or
+        another) commits to the database file.
+        """
+        with self._watch_lock:
+            if self._watch is None:
+                self._watch = sqlite3.connect(self.db_path, check_same_thread=False)
+            return self._watch.execute("PRAGMA data_version").fetchone()[0]
+
+    def _absorb_own_write(self, before: int):
+        """Count our own commit as seen, unless someone else had written before it."""
+        if before == self._seen_data_version:
+            self._seen_data_version = self._data_version()
+
+    def mark_seen(self):
+        """Treat the database's current contents as known (see changed_elsewhere)."""
+        self._seen_data_version = self._data_version()
+
+    def changed_elsewhere(self) -> bool:
+        """Whether another process (or Database) has written since mark_seen().
+
+        Writes made through this Database don't count. Costs one PRAGMA,
+        so it's cheap enough to call before every read of cached state.
+        """
+        return self._data_version() != self._seen_data_version
+
     def _init_schema(self):
         """Initialize database schema."""
         schema_path = Path(__file__).parent / "schema.sql"
@@ -138,6 +223,27 @@ class Database:
             row = cursor.fetchone()
             return (row['max_id'] or 0) + 1
 
+    def delete_quest(self, quest_id: int):
+        """Delete a quest with its completion records and snoozes."""
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM quests WHERE id = ?", (quest_id,))
+            conn.execute(
+                "DELETE FROM quest_completion_modifiers WHERE completion_id IN "
+                "(SELECT id FROM quest_completions WHERE quest_id = ?)",
+                (quest_id,)
+            )
+            conn.execute("DELETE FROM quest_completions WHERE quest_id = ?", (quest_id,))
+            conn.execute("DELETE FROM quest_snoozes WHERE quest_id = ?", (quest_id,))
+
+    def delete_all_quest_data(self):
+        """Delete all quests, completions and snoozes and reset total XP."""
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM quests")
+            conn.execute("DELETE FROM quest_completions")
+            conn.execute("DELETE FROM quest_completion_modifiers")
+            conn.execute("DELETE FROM quest_snoozes")
+            conn.execute("UPDATE user_stats SET total_xp = 0 WHERE id = 1")
+
     def save_quest_completion(self, completion: QuestCompletion):
         """Save a quest completion record."""
         with self._get_connection() as conn:
@@ -167,15 +273,20 @@ class Database:
             cursor = conn.execute('SELECT * FROM quest_completions')
             rows = cursor.fetchall()
 
-        completions = []
-        for row in rows:
-            # Load mood modifiers for this completion
+            # Load all mood modifiers in one pass, grouped by completion
             cursor = conn.execute('''
-                SELECT event_type, modifier
+                SELECT completion_id, event_type, modifier
                 FROM quest_completion_modifiers
-                WHERE completion_id = ?
-            ''', (row['id'],))
-            modifiers = [(r['event_type'], r['modifier']) for r in cursor.fetchall()]
+            ''')
+            modifiers_by_completion: Dict[int, List[Tuple[str, int]]] = {}
+            for r in cursor.fetchall():
+                modifiers_by_completion.setdefault(r['completion_id'], []).append(
+                    (r['event_type'], r['modifier'])
+                )
+
+        completions = []
+        for row in rows:
+            modifiers = modifiers_by_completion.get(row['id'], [])
 
             completion = QuestCompletion(
                 id=row['id'],
@@ -191,6 +302,81 @@ class Database:
 
         return completions
 
+    def get_completion_history_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[Tuple[str, int]] = None,
+        since: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """Get one page of quest completions, most recent first.
+
+        Uses keyset pagination over (completed_at, id) so each page is an
+        index range scan on idx_quest_completions_completed_at, no matter
+        how far back the user has scrolled. Quest titles are joined in the
+        same query.
+
+        Args:
+            limit: Maximum rows per page
+            cursor: (completed_at, id) of the last row of the previous page,
+                or None for the first page
+            since: Optional lower bound on completed_at
+
+        Returns:
+            Tuple of (rows, next_cursor). next_cursor is None on the last page.
+        """
+        clauses = []
+        params: List[Any] = []
+
+        if cursor is not None:
+            # Row-value comparison lets SQLite seek straight into the index
+            clauses.append('(qc.completed_at, qc.id) < (?, ?)')
+            params.extend(cursor)
+
+        if since is not None:
+            clauses.append('qc.completed_at >= ?')
+            params.append(since.isoformat())
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._get_connection() as conn:
+            # Fetch one extra row to know whether another page exists
+            cursor_rows = conn.execute(f'''
+                SELECT
+                    qc.id, qc.quest_id, qc.completed_at, qc.location_visited,
+                    qc.notes, qc.xp_awarded,
+                    q.title, q.description, q.category
+                FROM quest_completions qc
+                LEFT JOIN quests q ON q.id = qc.quest_id
+                {where}
+                ORDER BY qc.completed_at DESC, qc.id DESC
+                LIMIT ?
+            ''', (*params, limit + 1))
+            rows = cursor_rows.fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        page = []
+        for row in rows:
+            page.append({
+                'id': row['id'],
+                'quest_id': row['quest_id'],
+                'title': row['title'],
+                'description': row['description'],
+                'category': row['category'],
+                'completed_at': datetime.fromisoformat(row['completed_at']),
+                'location_visited': row['location_visited'],
+                'notes': row['notes'],
+                'xp_awarded': row['xp_awarded']
+            })
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = (last['completed_at'], last['id'])
+
+        return page, next_cursor
+
     def get_next_completion_id(self) -> int:
         """Get next available completion ID."""
         with self._get_connection() as conn:
@@ -198,6 +384,84 @@ class Database:
             row = cursor.fetchone()
             return (row['max_id'] or 0) + 1
 
+    def save_quest_snooze(self, snooze: QuestSnooze):
+        """Save a quest snooze record."""
+        # return_at rides along in context_data; the base table has no column for it
+        context = dict(snooze.context)
+        context['return_at'] = snooze.return_at.isoformat()
+
+        with self._get_connection() as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO quest_snoozes (
+                    id, quest_id, snoozed_at, reason_category, reason_text, context_data
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            ''', (
+                snooze.id, snooze.quest_id, snooze.snoozed_at.isoformat(),
+                snooze.reason_category, snooze.reason, json.dumps(context)
+            ))
+
+    def load_quest_snoozes(self) -> List[QuestSnooze]:
+        """Load all quest snooze records from database."""
+        with self._get_connection() as conn:
+            cursor = conn.execute('SELECT * FROM quest_snoozes ORDER BY id')
+            rows = cursor.fetchall()
+
+        snoozes = []
+        for row in rows:
+            context = json.loads(row['context_data']) if row['context_data'] else {}
+            snoozed_at = datetime.fromisoformat(row['snoozed_at'])
+            return_at = context.pop('return_at', None)
+
+            snoozes.append(QuestSnooze(
+                id=row['id'],
+                quest_id=row['quest_id'],
+                snoozed_at=snoozed_at,
+                return_at=datetime.fromisoformat(return_at) if return_at else snoozed_at,
+                reason=row['reason_text'],
+                reason_category=row['reason_category'] or "unspecified",
+                context=context
+            ))
+
+        return snoozes
+
+    # ==================== Quest Template Operations ====================
+
+    def load_quest_templates(self) -> List[QuestTemplate]:
+        """Load the quest template library (empty if not yet migrated)."""
+        with self._get_connection() as conn:
+            try:
+                cursor = conn.execute('SELECT * FROM quest_templates ORDER BY id')
+            except sqlite3.OperationalError:
+                return []
+            rows = cursor.fetchall()
+
+        templates = []
+        for row in rows:
+            renewal_policy = None
+            if row['renewal_type']:
+                renewal_policy = RenewalPolicy(
+                    renewal_type=row['renewal_type'],
+                    cooldown_days=row['renewal_cooldown_days'] or 0,
+                    active_months=json.loads(row['renewal_active_months']) if row['renewal_active_months'] else None
+                )
+
+            templates.append(QuestTemplate(
+                id=row['id'],
+                title=row['title'],
+                description=row['description'] or "",
+                category=row['category'],
+                difficulty=row['difficulty'],
+                base_xp=row['base_xp'],
+                optionality=row['optionality'] or "medium",
+                suggested_locations=json.loads(row['suggested_locations']) if row['suggested_locations'] else [],
+                duration_estimate=row['duration_estimate'] or "",
+                tags=json.loads(row['tags']) if row['tags'] else [],
+                difficulty_factors=json.loads(row['difficulty_factors']) if row['difficulty_factors'] else None,
+                renewal_policy=renewal_policy
+            ))
+
+        return templates
+
     # ==================== Mood Event Operations ====================
 
     def save_mood_event(self, event: MoodEvent):
@@ -528,3 +792,188 @@ class Database:
                 })
 
             return moodlets
+
+    def get_event_moodlet_categories(self) -> List[Tuple[str, int]]:
+        """Get the categories of event-based moodlet templates.
+
+        Returns:
+            (category, number of moodlets) pairs, sorted by category
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute('''
+                SELECT category, COUNT(*) AS count FROM moodlets
+                WHERE is_quest_based = 0 AND category != 'system'
+                GROUP BY category
+                ORDER BY category
+            ''')
+            return [(row['category'], row['count']) for row in cursor.fetchall()]
+
+    def get_event_moodlets_page(
+        self,
+        category: str,
+        limit: int = 20,
+        cursor: Optional[Tuple[int, int]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[int, int]]]:
+        """Get one page of event-based moodlet templates in a category.
+
+        Highest mood value first, using keyset pagination over
+        (mood_value DESC, id) on idx_moodlets_category_value.
+
+        Args:
+            category: Category name
+            limit: Maximum rows per page
+            cursor: (mood_value, id) of the last row of the previous page,
+                or None for the first page
+
+        Returns:
+            Tuple of (rows, next_cursor). next_cursor is None on the last page.
+        """
+        clauses = ['category = ?', 'is_quest_based = 0']
+        params: List[Any] = [category]
+
+        if cursor is not None:
+            clauses.append('(mood_value < ? OR (mood_value = ? AND id > ?))')
+            params.extend((cursor[0], cursor[0], cursor[1]))
+
+        with self._get_connection() as conn:
+            # Fetch one extra row to know whether another page exists
+            rows = conn.execute(f'''
+                SELECT * FROM moodlets
+                WHERE {' AND '.join(clauses)}
+                ORDER BY mood_value DESC, id
+                LIMIT ?
+            ''', (*params, limit + 1)).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        page = []
+        for row in rows:
+            page.append({
+                'id': row['id'],
+                'name': row['name'],
+                'category': row['category'],
+                'mood_value': row['mood_value'],
+                'duration_hours': row['duration_hours'],
+                'backoff_value': row['backoff_value'],
+                'backoff_duration_hours': row['backoff_duration_hours'],
+                'description': row['description'],
+                'is_quest_based': bool(row['is_quest_based'])
+            })
+
+        next_cursor = (rows[-1]['mood_value'], rows[-1]['id']) if has_more else None
+        return page, next_cursor
+
+    # ==================== LLM Call Operations ====================
+
+    def record_llm_call(self, call) -> int:
+        """Save an LLM parse or warm-up record.
+
+        Args:
+            call: LLMCall from the quest parser
+
+        Returns:
+            ID of the saved row
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute('''
+                INSERT INTO llm_calls (
+                    called_at, kind, model, prompt_version, source, outcome,
+                    cache_hit, streamed, input_chars, wall_ms, first_field_ms,
+                    total_ms, load_ms, prompt_eval_count, prompt_eval_ms,
+                    eval_count, eval_ms, error
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                call.called_at.isoformat(),
+                call.kind,
+                call.model,
+                call.prompt_version,
+                call.source,
+                call.outcome,
+                1 if call.cache_hit else 0,
+                1 if call.streamed else 0,
+                call.input_chars,
+                call.wall_ms,
+                call.first_field_ms,
+                call.total_ms,
+                call.load_ms,
+                call.prompt_eval_count,
+                call.prompt_eval_ms,
+                call.eval_count,
+                call.eval_ms,
+                call.error
+            ))
+            return cursor.lastrowid
+
+    def get_llm_call_report(self, days: int = 7) -> List[Dict[str, Any]]:
+        """Summarize recent LLM calls for tuning models and prompts.
+
+        Calls are grouped by kind, model, prompt version and source (llm,
+        cache or rules), so cache hits and rule parses don't drag down the
+        model's latency figures.
+
+        Args:
+            days: How many days back to include
+
+        Returns:
+            One dict per group, busiest first, with count, p50/p95/max wall
+            time (ms), failure rate, outcome counts, average prompt tokens
+            and generation speed (tokens/s, where Ollama reported it)
+        """
+        since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+        with self._get_connection() as conn:
+            cursor = conn.execute('''
+                SELECT kind, model, prompt_version, source, outcome, wall_ms,
+                       prompt_eval_count, eval_count, eval_ms
+                FROM llm_calls
+                WHERE called_at >= ?
+                ORDER BY wall_ms
+            ''', (since,))
+
+            groups: Dict[Tuple, Dict[str, Any]] = {}
+            for row in cursor.fetchall():
+                key = (row['kind'], row['model'], row['prompt_version'], row['source'])
+                group = groups.setdefault(key, {
+                    'wall_ms': [], 'outcomes': {}, 'prompt_tokens': [], 'eval_count': 0, 'eval_ms': 0.0
+                })
+                group['wall_ms'].append(row['wall_ms'])
+                group['outcomes'][row['outcome']] = group['outcomes'].get(row['outcome'], 0) + 1
+                if row['prompt_eval_count'] is not None:
+                    group['prompt_tokens'].append(row['prompt_eval_count'])
+                if row['eval_count'] and row['eval_ms']:
+                    group['eval_count'] += row['eval_count']
+                    group['eval_ms'] += row['eval_ms']
+
+        report = []
+        for (kind, model, prompt_version, source), group in groups.items():
+            wall = group['wall_ms']  # Already sorted by the query
+            failures = sum(n for outcome, n in group['outcomes'].items() if outcome != 'ok')
+            report.append({
+                'kind': kind,
+                'model': model,
+                'prompt_version': prompt_version,
+                'source': source,
+                'count': len(wall),
+                'p50_ms': _percentile(wall, 50),
+                'p95_ms': _percentile(wall, 95),
+                'max_ms': wall[-1],
+                'failures': failures,
+                'failure_rate': failures / len(wall),
+                'outcomes': group['outcomes'],
+                'avg_prompt_tokens': (
+                    sum(group['prompt_tokens']) / len(group['prompt_tokens']) if group['prompt_tokens'] else None
+                ),
+                'tokens_per_second': (
+                    group['eval_count'] / (group['eval_ms'] / 1000) if group['eval_ms'] else None
+                ),
+            })
+
+        report.sort(key=lambda r: r['count'], reverse=True)
+        return report
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
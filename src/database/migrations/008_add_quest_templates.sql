@@ -0,0 +1,21 @@
+-- Migration 008: Add Quest Templates
+-- Stores the reusable quest template library (bulk-imported from JSONL/CSV)
+
+CREATE TABLE IF NOT EXISTS quest_templates (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    base_xp INTEGER NOT NULL,
+    optionality TEXT,
+    suggested_locations TEXT,  -- JSON array
+    duration_estimate TEXT,
+    tags TEXT,  -- JSON array
+    difficulty_factors TEXT,  -- JSON object
+    renewal_type TEXT,
+    renewal_cooldown_days INTEGER,
+    renewal_active_months TEXT  -- JSON array
+);
+
+CREATE INDEX IF NOT EXISTS idx_quest_templates_category ON quest_templates(category);
@@ -0,0 +1,26 @@
+-- Migration 009: Add LLM Call Log
+-- One row per quest parse or model warm-up, for latency and failure reporting
+
+CREATE TABLE IF NOT EXISTS llm_calls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    called_at TEXT NOT NULL,
+    kind TEXT NOT NULL,  -- parse, warm_up
+    model TEXT NOT NULL,
+    prompt_version INTEGER NOT NULL,
+    source TEXT NOT NULL,  -- llm, cache, rules
+    outcome TEXT NOT NULL,  -- ok, timeout, connection_error, http_error, invalid_json, missing_fields, circuit_open
+    cache_hit INTEGER NOT NULL DEFAULT 0,
+    streamed INTEGER NOT NULL DEFAULT 0,
+    input_chars INTEGER,
+    wall_ms REAL NOT NULL,
+    first_field_ms REAL,
+    total_ms REAL,
+    load_ms REAL,
+    prompt_eval_count INTEGER,
+    prompt_eval_ms REAL,
+    eval_count INTEGER,
+    eval_ms REAL,
+    error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_calls_called_at ON llm_calls(called_at);
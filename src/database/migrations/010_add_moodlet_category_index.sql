@@ -0,0 +1,5 @@
+-- Migration 010: Index for paging through a moodlet category
+-- QuickLog lists one category at a time, highest mood value first, a page at a time
+
+CREATE INDEX IF NOT EXISTS idx_moodlets_category_value
+    ON moodlets(category, is_quest_based, mood_value DESC, id);
@@ -0,0 +1,67 @@
+"""Read-only view of everything the TUI screens display."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ModifierView:
+    """An active moodlet or mood event."""
+    source: str  # "moodlet" or "event"
+    title: str
+    description: str
+    value: int
+    expires_at: Optional[datetime]
+    is_in_backoff: bool = False
+
+
+@dataclass(frozen=True)
+class TraitView:
+    """An active trait."""
+    name: str
+    description: str
+    mood_modifier: int
+
+
+@dataclass(frozen=True)
+class QuestView:
+    """An active quest, as listed on the quest board."""
+    id: int
+    title: str
+    description: str
+    category: str
+    xp_reward: int
+    renewal_type: Optional[str]  # None for one-time quests
+    constraint_note: Optional[str]
+
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """Mood, quests, XP and profile flags at one point in time.
+
+    Built by MOOdBBSEngine.get_dashboard_snapshot(). Snapshots are never
+    modified; a newer state_version means the engine's state has changed.
+    """
+    state_version: int
+    built_at: datetime
+    mood_score: int
+    mood_face: str
+    moodlets: Tuple[ModifierView, ...]
+    events: Tuple[ModifierView, ...]
+    traits: Tuple[TraitView, ...]
+    active_quests: Tuple[QuestView, ...]
+    max_active_quests: int
+    total_xp: int
+    quests_completed: int
+    setup_completed: bool
+    home_neighborhood: Optional[str]
+    memberships: Tuple[str, ...]
+    # When the snapshot goes stale even without changes (a modifier
+    # expires, or the day rolls over and quest eligibility changes)
+    valid_until: datetime
+
+    @property
+    def modifiers(self) -> Tuple[ModifierView, ...]:
+        """Moodlets followed by mood events."""
+        return self.moodlets + self.events
@@ -1,11 +1,14 @@
 """MOOdBBS Game Engine - integrates all game systems."""
 
+import copy
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from src.domain.dashboard import DashboardSnapshot, ModifierView, QuestView, TraitView
 from src.domain.mood import MoodCalculator, MoodEvent, MoodState, MoodModifierLibrary
 from src.domain.quests import QuestManager, Quest, QuestCompletionResult, QuestStats
 from src.domain.traits import Trait
+from src.domain.user_profile import UserProfile
 from src.database.db import Database
 
 
@@ -28,6 +31,17 @@ class MOOdBBSEngine:
         self.mood_calculator = MoodCalculator()
         self.mood_library = MoodModifierLibrary()
         self.quest_manager = QuestManager(max_active_quests=max_active_quests)
+        self._template_repository = None
+        self._quest_suggester = None
+        self._duplicate_index = None
+
+        # Dashboard state: bumped on every change so cached views know when to rebuild
+        self._state_version = 0
+        self._snapshot = None
+        self._moodlet_cache: Optional[List[Dict[str, Any]]] = None
+        self._moodlets_valid_until: Optional[datetime] = None
+        self._profile = None
+        self._change_listeners: List[Callable[[], None]] = []
 
         # Load data from database
         self._load_from_database()
@@ -52,6 +66,15 @@ class MOOdBBSEngine:
         else:
             self.quest_manager._next_completion_id = 1
 
+        # Load quest snoozes
+        snoozes = self.db.load_quest_snoozes()
+        for snooze in snoozes:
+            self.quest_manager._snoozes[snooze.id] = snooze
+        if snoozes:
+            self.quest_manager._next_snooze_id = max(s.id for s in snoozes) + 1
+        else:
+            self.quest_manager._next_snooze_id = 1
+
         # Load mood events
         self._mood_events = self.db.load_mood_events()
         if self._mood_events:
@@ -81,7 +104,10 @@ class MOOdBBSEngine:
         Returns:
             ID of the new active moodlet instance
         """
-        return self.db.apply_moodlet(moodlet_id, source_quest_id)
+        moodlet_id = self.db.apply_moodlet(moodlet_id, source_quest_id)
+        self._moodlet_cache = None
+        self._mark_changed()
+        return moodlet_id
 
     def get_active_moodlets(self) -> List[Dict[str, Any]]:
         """Get all currently active moodlets."""
@@ -90,6 +116,18 @@ class MOOdBBSEngine:
     def cleanup_expired_moodlets(self):
         """Remove expired moodlets and transition to backoff phase."""
         self.db.cleanup_expired_moodlets()
+        self._moodlet_cache = None
+
+    def warm_up(self):
+        """Do the one-off loading work ahead of the first screen.
+
+        Sweeps expired moodlets into their backoff phase, loads the quest
+        template library and builds the first dashboard snapshot. All of
+        it would otherwise happen on first use.
+        """
+        self.cleanup_expired_moodlets()
+        self.get_template_repository()
+        self.get_dashboard_snapshot()
 
     def get_moodlets_by_category(self, category: str, is_quest_based: Optional[bool] = None) -> List[Dict[str, Any]]:
         """Get moodlet templates by category."""
@@ -99,6 +137,28 @@ class MOOdBBSEngine:
         """Get all event-based moodlets."""
         return self.db.get_all_event_moodlets()
 
+    def get_event_moodlet_categories(self) -> List[Tuple[str, int]]:
+        """Get (category, count) pairs for event-based moodlets."""
+        return self.db.get_event_moodlet_categories()
+
+    def get_event_moodlets_page(
+        self,
+        category: str,
+        limit: int = 20,
+        cursor: Optional[Tuple[int, int]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[int, int]]]:
+        """Get one page of event-based moodlets in a category, highest value first.
+
+        Args:
+            category: Category name
+            limit: Maximum rows per page
+            cursor: Cursor returned by the previous page, or None to start
+
+        Returns:
+            Tuple of (rows, next_cursor)
+        """
+        return self.db.get_event_moodlets_page(category, limit=limit, cursor=cursor)
+
     def get_current_mood(self) -> MoodState:
         """Get current mood score and contributing factors."""
         # Clean up expired moodlets first
@@ -127,6 +187,7 @@ class MOOdBBSEngine:
 
         # Add moodlet score to total
         mood_state.score += moodlet_score
+        mood_state.face = self.mood_calculator.get_mood_face(mood_state.score)
 
         # Add moodlets to contributing factors (optional, for display)
         for moodlet in active_moodlets:
@@ -153,6 +214,18 @@ class MOOdBBSEngine:
         Returns:
             Created MoodEvent
         """
+        # Pick up events logged by other processes, so their ids aren't reused
+        self.refresh_if_changed()
+        return self._add_mood_event(event_type, modifier, description, duration_hours)
+
+    def _add_mood_event(
+        self,
+        event_type: str,
+        modifier: int,
+        description: str,
+        duration_hours: Optional[int]
+    ) -> MoodEvent:
+        """Log a mood event against the state already loaded (see log_mood_event)."""
         from datetime import timedelta
 
         now = datetime.now(timezone.utc)
@@ -175,6 +248,7 @@ class MOOdBBSEngine:
 
         # Save to database
         self.db.save_mood_event(event)
+        self._mark_changed()
 
         return event
 
@@ -190,6 +264,21 @@ class MOOdBBSEngine:
 
         return active
 
+    def get_mood_history(self, days: int = 7) -> List[MoodEvent]:
+        """Get mood events logged recently, expired ones included.
+
+        Args:
+            days: Days to look back
+
+        Returns:
+            MoodEvents, most recent first
+        """
+        from datetime import timedelta
+
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        events = [e for e in self._mood_events if e.created_at >= since]
+        return sorted(events, key=lambda e: e.created_at, reverse=True)
+
     def get_mood_modifier_library(self) -> List:
         """Get available mood modifiers (stock + custom)."""
         return self.mood_library.get_stock_modifiers()
@@ -232,6 +321,17 @@ class MOOdBBSEngine:
         """
         return self.quest_manager.get_active_quests(limit=limit, filter_by_eligibility=filter_by_eligibility)
 
+    def get_open_quest_slots(self) -> int:
+        """Get how many more quests can be created before the active limit.
+
+        Returns:
+            Number of free active quest slots
+        """
+        self.refresh_if_changed()
+        # Counted the way QuestManager.create_quest enforces the limit
+        active_count = len(self.quest_manager.get_active_quests())
+        return max(0, self.quest_manager.max_active_quests - active_count)
+
     def get_quest_by_id(self, quest_id: int) -> Quest:
         """Get a specific quest.
 
@@ -257,7 +357,8 @@ class MOOdBBSEngine:
         due_hours: Optional[int] = None,
         renewal_policy: Optional[Any] = None,
         constraint_type: Optional[str] = None,
-        constraint_note: Optional[str] = None
+        constraint_note: Optional[str] = None,
+        allow_duplicate: bool = True
     ) -> Quest:
         """Create a new quest.
 
@@ -272,12 +373,27 @@ class MOOdBBSEngine:
             renewal_policy: Optional renewal policy
             constraint_type: Type of time constraint (day_of_week, day_of_month)
             constraint_note: Constraint details (e.g., "Friday", "first_friday")
+            allow_duplicate: If False, refuse titles that look like an
+                existing quest or template
 
         Returns:
             Created Quest
+
+        Raises:
+            DuplicateQuestError: If allow_duplicate is False and similar
+                quests exist (a ValueError carrying the matches)
         """
+        # Pick up quests created by other processes, so their ids aren't reused
+        self.refresh_if_changed()
+
         from datetime import timedelta
 
+        if not allow_duplicate:
+            matches = self.find_duplicate_quests(title, location)
+            if matches:
+                from src.services.quest_dedup import DuplicateQuestError
+                raise DuplicateQuestError(title, matches)
+
         due_at = None
         if due_hours:
             due_at = datetime.now(timezone.utc) + timedelta(hours=due_hours)
@@ -297,9 +413,101 @@ class MOOdBBSEngine:
 
         # Save to database
         self.db.save_quest(quest)
+        self._index_quest(quest)
+        self._mark_changed()
 
         return quest
 
+    def create_quest_from_parsed(
+        self,
+        quest_data: Dict[str, Any],
+        location: str = "",
+        allow_duplicate: bool = True
+    ) -> Quest:
+        """Create a quest from LLMQuestParser output.
+
+        Args:
+            quest_data: Parsed quest (title, category, xp_reward, renewal_type, ...)
+            location: Optional location
+            allow_duplicate: If False, refuse titles that look like an
+                existing quest or template
+
+        Returns:
+            Created Quest
+
+        Raises:
+            DuplicateQuestError: If allow_duplicate is False and similar
+                quests exist
+        """
+        from src.domain.quests import RenewalPolicy
+
+        xp_reward = quest_data['xp_reward']
+        difficulty = "easy" if xp_reward <= 10 else "medium" if xp_reward <= 20 else "hard"
+
+        renewal_policy = None
+        renewal_type = quest_data.get('renewal_type')
+        if renewal_type:
+            cooldown_map = {
+                "daily": 1,
+                "weekly": 7,
+                "monthly": 30,
+                "seasonal": 90
+            }
+            renewal_policy = RenewalPolicy(renewal_type=renewal_type, cooldown_days=cooldown_map.get(renewal_type, 7))
+
+        return self.create_quest(
+            title=quest_data['title'],
+            description=quest_data.get('description') or "",
+            category=quest_data['category'],
+            difficulty=difficulty,
+            location=location,
+            xp_reward=xp_reward,
+            renewal_policy=renewal_policy,
+            constraint_type=quest_data.get('constraint_type'),
+            constraint_note=quest_data.get('constraint_note'),
+            allow_duplicate=allow_duplicate
+        )
+
+    def find_duplicate_quests(self, title: str, location: str = "") -> List[Any]:
+        """Find quests and templates that look like a new quest.
+
+        Matches on title trigrams, so word order and small spelling
+        differences don't matter ("Visit SFMOMA" vs "SFMOMA visit"). When
+        both sides have a location, the locations must roughly agree too.
+
+        Args:
+            title: New quest title
+            location: New quest location
+
+        Returns:
+            List of DuplicateMatch, most similar first
+        """
+        matches = self._get_duplicate_index().find(title, location)
+        for match in matches:
+            if match.kind == "quest" and match.id in self.quest_manager._quests:
+                match.status = self.quest_manager._quests[match.id].status
+        return matches
+
+    def _get_duplicate_index(self):
+        """Get the title trigram index, built on first use from all quests and templates."""
+        if self._duplicate_index is None:
+            from src.services.quest_dedup import TrigramIndex
+
+            index = TrigramIndex()
+            for quest in self.quest_manager._quests.values():
+                index.add("quest", quest.id, quest.title, quest.location)
+            for template in self.get_template_repository().all():
+                locations = template.suggested_locations or []
+                index.add("template", template.id, template.title, locations[0].get("name", "") if locations else "")
+            self._duplicate_index = index
+
+        return self._duplicate_index
+
+    def _index_quest(self, quest: Quest):
+        """Add a new quest to the trigram index, if it has been built."""
+        if self._duplicate_index is not None:
+            self._duplicate_index.add("quest", quest.id, quest.title, quest.location)
+
     def complete_quest(
         self,
         quest_id: int,
@@ -316,6 +524,9 @@ class MOOdBBSEngine:
         Returns:
             QuestCompletionResult with XP and mood buffs
         """
+        # The quest may have been completed in another process since we loaded it
+        self.refresh_if_changed()
+
         result = self.quest_manager.complete_quest(
             quest_id=quest_id,
             notes=notes,
@@ -324,7 +535,7 @@ class MOOdBBSEngine:
 
         # Apply mood buffs to engine
         for event_type, modifier in result.mood_buffs_applied:
-            self.log_mood_event(
+            self._add_mood_event(
                 event_type=event_type,
                 modifier=modifier,
                 description=f"Quest completion: {result.quest.title}",
@@ -337,6 +548,7 @@ class MOOdBBSEngine:
         completion = max(self.quest_manager._completions.values(), key=lambda c: c.completed_at)
         self.db.save_quest_completion(completion)
         self.db.set_total_xp(result.total_xp)
+        self._mark_changed()
 
         return result
 
@@ -355,6 +567,8 @@ class MOOdBBSEngine:
             reason_text: Optional reason text
             snooze_days: Days to snooze
         """
+        self.refresh_if_changed()
+
         # Get current mood for context
         mood = self.get_current_mood()
 
@@ -371,9 +585,11 @@ class MOOdBBSEngine:
             context=context
         )
 
-        # Save updated quest to database
+        # Save updated quest and snooze record to database
         quest = self.quest_manager.get_quest(quest_id)
         self.db.save_quest(quest)
+        self.db.save_quest_snooze(result)
+        self._mark_changed()
 
         return result
 
@@ -388,6 +604,41 @@ class MOOdBBSEngine:
         # Save updated quest to database
         quest = self.quest_manager.get_quest(quest_id)
         self.db.save_quest(quest)
+        self._mark_changed()
+
+    def delete_quest(self, quest_id: int):
+        """Delete a quest and its completions and snoozes permanently.
+
+        Args:
+            quest_id: Quest to delete
+
+        Raises:
+            ValueError: If quest not found
+        """
+        self.quest_manager.get_quest(quest_id)
+        del self.quest_manager._quests[quest_id]
+        for completion_id in [c.id for c in self.quest_manager._completions.values() if c.quest_id == quest_id]:
+            del self.quest_manager._completions[completion_id]
+        for snooze_id in [s.id for s in self.quest_manager._snoozes.values() if s.quest_id == quest_id]:
+            del self.quest_manager._snoozes[snooze_id]
+
+        self.db.delete_quest(quest_id)
+        if self._duplicate_index is not None:
+            self._duplicate_index.remove("quest", quest_id)
+        self._mark_changed()
+
+    def destroy_quest_data(self):
+        """Delete every quest, completion and snooze, and all earned XP.
+
+        The user profile, traits and mood history are kept.
+        """
+        self.db.delete_all_quest_data()
+        self.quest_manager._quests = {}
+        self.quest_manager._completions = {}
+        self.quest_manager._snoozes = {}
+        self.quest_manager._total_xp = 0
+        self._duplicate_index = None
+        self._mark_changed()
 
     def get_quest_history(self, days: int = 7):
         """Get recently completed quests.
@@ -400,10 +651,162 @@ class MOOdBBSEngine:
         """
         return self.quest_manager.get_completion_history(days=days)
 
+    def get_quest_history_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[Tuple[str, int]] = None,
+        days: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """Get one page of completed quests, most recent first.
+
+        Args:
+            limit: Maximum rows per page
+            cursor: Cursor returned by the previous page, or None to start
+            days: Optional number of days to look back
+
+        Returns:
+            Tuple of (rows with quest titles joined, next_cursor)
+        """
+        from datetime import timedelta
+
+        since = None
+        if days is not None:
+            since = datetime.now(timezone.utc) - timedelta(days=days)
+
+        return self.db.get_completion_history_page(limit=limit, cursor=cursor, since=since)
+
     def get_quest_stats(self) -> QuestStats:
         """Get quest statistics."""
         return self.quest_manager.get_quest_stats()
 
+    # ==================== Quest Suggestions ====================
+
+    def get_template_repository(self):
+        """Get the quest template library (YAML config plus imported templates).
+
+        Loaded on first use and cached for the life of the engine.
+        """
+        if self._template_repository is None:
+            from src.services.quest_templates import QuestTemplateRepository
+
+            repository = QuestTemplateRepository.load()
+            repository.add_templates(self.db.load_quest_templates())
+            self._template_repository = repository
+
+        return self._template_repository
+
+    def reload_templates(self):
+        """Drop the cached template library, suggestion features and duplicate index."""
+        self._template_repository = None
+        self._quest_suggester = None
+        self._duplicate_index = None
+
+    def suggest_quests(self, k: int = 3) -> List[Any]:
+        """Suggest quest templates for the quest board.
+
+        Scores every template against the user profile, recent completions,
+        snooze reasons and current mood, and returns the best k.
+
+        Args:
+            k: Number of suggestions
+
+        Returns:
+            List of QuestSuggestion, best first
+        """
+        if self._quest_suggester is None:
+            from src.services.quest_suggestions import QuestSuggester
+
+            self._quest_suggester = QuestSuggester(self.get_template_repository().all())
+
+        quests = self.quest_manager._quests.values()
+        in_progress = {
+            q.template_id for q in quests
+            if q.template_id and q.status in ("active", "snoozed", "pending_renewal")
+        }
+        completed_template_ids = {q.id: q.template_id for q in quests if q.template_id}
+
+        return self._quest_suggester.suggest(
+            k=k,
+            profile=self.get_user_profile(),
+            completions=self.quest_manager._completions.values(),
+            snoozes=self.quest_manager._snoozes.values(),
+            mood_score=self.get_current_mood().score,
+            exclude_template_ids=in_progress,
+            completed_template_ids=completed_template_ids
+        )
+
+    def create_quest_from_template(self, template_id: str) -> Quest:
+        """Start a quest from a library template.
+
+        Args:
+            template_id: Template ID
+
+        Returns:
+            Created Quest
+
+        Raises:
+            ValueError: If the template is unknown or at max active quests
+        """
+        template = self.get_template_repository().get(template_id)
+        if template is None:
+            raise ValueError(f"Template {template_id} not found")
+
+        if len(self.get_active_quests(filter_by_eligibility=False)) >= self.quest_manager.max_active_quests:
+            raise ValueError(f"Already at maximum of {self.quest_manager.max_active_quests} active quests")
+
+        quest = self.quest_manager.create_quest_from_template(template)
+        if template.suggested_locations:
+            quest.location = template.suggested_locations[0].get("name", "")
+
+        # Save to database
+        self.db.save_quest(quest)
+        self._index_quest(quest)
+        self._mark_changed()
+
+        return quest
+
+    # ==================== Bulk Import/Export ====================
+
+    def export_records(self, kind: str, path: str, fmt: Optional[str] = None) -> int:
+        """Export quests, templates or completions to a JSONL/CSV file.
+
+        Args:
+            kind: "quests", "templates" or "completions"
+            path: Destination file path
+            fmt: "jsonl" or "csv" (defaults to the file extension)
+
+        Returns:
+            Number of records written
+        """
+        from src.database.bulk_io import BulkTransfer
+
+        return BulkTransfer(self.db.db_path).export_records(kind, path, fmt)
+
+    def import_records(self, kind: str, path: str, fmt: Optional[str] = None) -> int:
+        """Import quests, templates or completions from a JSONL/CSV file.
+
+        The whole file is imported in one transaction, then in-memory
+        state is reloaded so the engine sees the new records.
+
+        Args:
+            kind: "quests", "templates" or "completions"
+            path: Source file path
+            fmt: "jsonl" or "csv" (defaults to the file extension)
+
+        Returns:
+            Number of records imported
+        """
+        from src.database.bulk_io import BulkTransfer
+
+        count = BulkTransfer(self.db.db_path).import_records(kind, path, fmt)
+        if kind == "templates":
+            self.reload_templates()
+        else:
+            self._load_from_database()
+            self._duplicate_index = None
+        self._mark_changed()
+        return count
+
     # ==================== Trait System ====================
 
     def get_active_traits(self) -> List[Trait]:
@@ -426,6 +829,8 @@ class MOOdBBSEngine:
         Returns:
             Created Trait
         """
+        self.refresh_if_changed()
+
         trait = Trait(
             id=self._next_trait_id,
             trait_name=trait_name,
@@ -440,6 +845,7 @@ class MOOdBBSEngine:
 
         # Save to database
         self.db.save_trait(trait)
+        self._mark_changed()
 
         return trait
 
@@ -457,6 +863,7 @@ class MOOdBBSEngine:
                 trait.is_active = False
                 # Save to database
                 self.db.save_trait(trait)
+                self._mark_changed()
                 return True
         return False
 
@@ -474,3 +881,186 @@ class MOOdBBSEngine:
             "active_traits": len(self.get_active_traits()),
             "active_modifiers": len(self.get_active_mood_events())
         }
+
+    # ==================== User Profile ====================
+
+    def get_user_profile(self) -> UserProfile:
+        """Get the user profile.
+
+        Loaded once and cached; returns a copy, so edits only take effect
+        through save_user_profile().
+        """
+        if self._profile is None:
+            self._profile = self.db.get_user_profile()
+        return copy.deepcopy(self._profile)
+
+    def save_user_profile(self, profile: UserProfile):
+        """Save the user profile.
+
+        Args:
+            profile: Updated profile
+        """
+        self.db.save_user_profile(profile)
+        self._profile = copy.deepcopy(profile)
+        self._mark_changed()
+
+    # ==================== Dashboard ====================
+
+    @property
+    def state_version(self) -> int:
+        """Counter bumped by every change made through the engine."""
+        return self._state_version
+
+    def add_change_listener(self, callback: Callable[[], None]):
+        """Call callback after every change made through the engine.
+
+        Callbacks run on whichever thread made the change and should only
+        signal (e.g. wake a waiting screen), not render.
+        """
+        self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback: Callable[[], None]):
+        """Stop calling a change listener."""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _mark_changed(self):
+        self._state_version += 1
+        for callback in list(self._change_listeners):
+            callback()
+
+    def refresh_if_changed(self) -> bool:
+        """Reload state if another process has written to the database.
+
+        The TUI, shell and API server each keep their own engine; this is
+        how changes made by one reach the others.
+
+        Returns:
+            True if state was reloaded
+        """
+        if not self.db.changed_elsewhere():
+            return False
+        self.reload()
+        return True
+
+    def reload(self):
+        """Discard in-memory state and load it again from the database."""
+        self.db.mark_seen()
+        self.quest_manager = QuestManager(max_active_quests=self.quest_manager.max_active_quests)
+        self._duplicate_index = None
+        self._moodlet_cache = None
+        self._moodlets_valid_until = None
+        self._profile = None
+        self._load_from_database()
+        self._mark_changed()
+
+    def get_dashboard_snapshot(self) -> DashboardSnapshot:
+        """Get everything the TUI screens display, in one immutable view.
+
+        Built from in-memory state plus a cached copy of the active
+        moodlets, which is only re-queried when one of them reaches its
+        next phase. The same snapshot is returned until something changes
+        through the engine or its valid_until time passes.
+
+        Returns:
+            DashboardSnapshot
+        """
+        self.refresh_if_changed()  # Changes made by the TUI, shell or API server
+        now = datetime.now(timezone.utc)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.state_version == self._state_version and now < snapshot.valid_until:
+            return snapshot
+
+        deadlines = [_next_utc_midnight(now)]  # Day-of-week/month quest eligibility
+
+        moodlets = []
+        for moodlet in self._get_cached_moodlets(now):
+            expires_at = datetime.fromisoformat(moodlet['expires_at']) if moodlet['expires_at'] else None
+            moodlets.append(ModifierView(
+                source="moodlet",
+                title=moodlet['name'],
+                description=moodlet['description'] or "",
+                value=moodlet['mood_value'],
+                expires_at=expires_at,
+                is_in_backoff=moodlet['is_in_backoff']
+            ))
+        if self._moodlets_valid_until is not None:
+            deadlines.append(self._moodlets_valid_until)
+
+        events = []
+        for event in self.get_active_mood_events():
+            # Custom and snake_case event types read better as their description
+            if event.event_type == 'custom' or '_' in event.event_type:
+                title, description = event.description, ""
+            else:
+                title, description = event.event_type, event.description or ""
+            events.append(ModifierView(
+                source="event",
+                title=title,
+                description=description,
+                value=event.modifier,
+                expires_at=event.expires_at
+            ))
+            if event.expires_at is not None:
+                deadlines.append(event.expires_at)
+
+        traits = [t for t in self._traits if t.is_active]
+        score = (
+            sum(m.value for m in moodlets)
+            + sum(e.value for e in events)
+            + sum(t.mood_modifier for t in traits)
+        )
+
+        quests = self.get_active_quests()
+        profile = self.get_user_profile()
+        stats = self.quest_manager.get_quest_stats()
+
+        self._snapshot = DashboardSnapshot(
+            state_version=self._state_version,
+            built_at=now,
+            mood_score=score,
+            mood_face=self.mood_calculator.get_mood_face(score),
+            moodlets=tuple(moodlets),
+            events=tuple(events),
+            traits=tuple(TraitView(t.trait_name, t.description, t.mood_modifier) for t in traits),
+            active_quests=tuple(
+                QuestView(
+                    id=q.id,
+                    title=q.title,
+                    description=q.description,
+                    category=q.category,
+                    xp_reward=q.xp_reward,
+                    renewal_type=q.renewal_policy.renewal_type if q.renewal_policy else None,
+                    constraint_note=q.constraint_note
+                )
+                for q in quests
+            ),
+            max_active_quests=self.quest_manager.max_active_quests,
+            total_xp=stats.total_xp_earned,
+            quests_completed=stats.total_completed,
+            setup_completed=profile.setup_completed,
+            home_neighborhood=profile.home_neighborhood,
+            memberships=tuple(profile.memberships),
+            valid_until=min(deadlines)
+        )
+        return self._snapshot
+
+    def _get_cached_moodlets(self, now: datetime) -> List[Dict[str, Any]]:
+        """Active moodlets, re-queried only when one may have changed phase."""
+        if self._moodlet_cache is None or (
+            self._moodlets_valid_until is not None and now >= self._moodlets_valid_until
+        ):
+            self.db.cleanup_expired_moodlets()
+            self._moodlet_cache = self.db.get_active_moodlets()
+            deadlines = [
+                datetime.fromisoformat(m['expires_at']) for m in self._moodlet_cache if m['expires_at']
+            ]
+            self._moodlets_valid_until = min(deadlines) if deadlines else None
+        return self._moodlet_cache
+
+
+def _next_utc_midnight(now: datetime) -> datetime:
+    """Start of the next UTC day."""
+    from datetime import timedelta
+
+    return datetime(now.year, now.month, now.day, tzinfo=timezone.utc) + timedelta(days=1)
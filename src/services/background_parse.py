@@ -0,0 +1,117 @@
+"""Run LLM quest parses off the UI thread."""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the shared worker pool for background parses."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm-parse")
+        return _executor
+
+
+def merge_quest_fields(parsed: Optional[Dict[str, Any]], manual: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Merge fields the user entered by hand over a parsed quest.
+
+    Args:
+        parsed: Parser output, or None if parsing failed
+        manual: Fields the user filled in; present keys win, even when None
+            (e.g. renewal_type=None means "one-time", not "unset")
+
+    Returns:
+        Merged quest data, or None if there was no parse to merge into
+    """
+    if parsed is None:
+        return None
+    merged = dict(parsed)
+    merged.update(manual)
+    return merged
+
+
+class ParseJob:
+    """A quest parse running on the background pool.
+
+    The HTTP request itself can't be interrupted, so cancelling only
+    detaches the job: the worker finishes on its own and its result is
+    discarded (a successful parse still lands in the parser's cache).
+    """
+
+    def __init__(self, parser, user_input: str, user_context: str = "", executor: Optional[ThreadPoolExecutor] = None):
+        """Submit a parse.
+
+        Args:
+            parser: LLMQuestParser (or anything with parse_quest)
+            user_input: Natural language quest description
+            user_context: User context for the prompt
+            executor: Worker pool (defaults to the shared pool)
+        """
+        self.started_at = time.monotonic()
+        self.first_field_at: Optional[float] = None
+        self.fields: Dict[str, Any] = {}
+        self._cancelled = False
+        self._future: Future = (executor or get_executor()).submit(
+            parser.parse_quest, user_input, user_context, on_field=self._on_field
+        )
+
+    def _on_field(self, name: str, value: Any):
+        """Record a field as soon as the parser surfaces it (worker thread)."""
+        if self.first_field_at is None:
+            self.first_field_at = time.monotonic() - self.started_at
+        self.fields[name] = value
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the parse was submitted."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def done(self) -> bool:
+        """Check whether the parse has finished (or was cancelled)."""
+        return self._cancelled or self._future.done()
+
+    def cancel(self):
+        """Stop waiting for the parse."""
+        self._cancelled = True
+        self._future.cancel()  # Only effective if it hasn't started yet
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the parse to finish.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the job is done
+        """
+        if self._cancelled:
+            return True
+        try:
+            self._future.exception(timeout=timeout)
+        except Exception:
+            pass  # Timeout, or cancelled before it started
+        return self.done()
+
+    def result(self) -> Optional[Dict[str, Any]]:
+        """Get the parsed quest.
+
+        Returns:
+            Parsed quest data, or None if parsing failed, was cancelled or
+            hasn't finished
+        """
+        if self._cancelled or not self._future.done() or self._future.cancelled():
+            return None
+        if self._future.exception() is not None:
+            return None
+        return self._future.result()
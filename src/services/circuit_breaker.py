@@ -0,0 +1,123 @@
+"""Circuit breaker for flaky network services."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class CircuitBreaker:
+    """Fail fast once a service has stopped answering.
+
+    The breaker starts closed. After failure_threshold consecutive failures
+    it opens and every call is refused without touching the network. Once
+    reset_timeout has passed it lets a single trial call through
+    (half-open): success closes it again, failure re-opens it.
+
+    It also remembers the last known availability for availability_ttl
+    seconds so repeated "is the service up?" checks don't each pay for
+    a probe.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        availability_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before allowing a trial call
+            availability_ttl: Seconds a known availability stays valid
+            clock: Monotonic time source (for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.availability_ttl = availability_ttl
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._known_available: Optional[bool] = None
+        self._known_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open -> half-open once the timeout has passed."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a call may go out now.
+
+        Returns:
+            True if the caller should attempt the call
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """Record a successful call."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+            self._known_available = True
+            self._known_at = self._clock()
+
+    def record_failure(self):
+        """Record a failed call."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._known_available = False
+            self._known_at = self._clock()
+
+    def known_availability(self) -> Optional[bool]:
+        """Get the remembered availability.
+
+        Returns:
+            False while the breaker is open, otherwise the last observed
+            availability if still within its TTL, or None if a probe is due
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.OPEN:
+                return False
+            if state == self.HALF_OPEN:
+                return None  # Time for a fresh probe
+            if self._known_available is None or self._clock() - self._known_at >= self.availability_ttl:
+                return None
+            return self._known_available
+
+    def reset(self):
+        """Forget all failures and known availability."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+            self._known_available = None
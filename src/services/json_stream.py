@@ -0,0 +1,98 @@
+"""Incremental extraction of top-level fields from a streamed JSON object."""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JSONFieldStream:
+    """Pull completed top-level fields out of a JSON object as it streams in.
+
+    Feed text chunks in order; each call returns the (key, value) pairs
+    whose values closed in that chunk. Only the outermost object is split
+    into fields; nested objects and arrays are returned whole once they
+    close. Anything before the opening brace is ignored.
+
+        stream = JSONFieldStream()
+        stream.feed('{"title": "Walk", "xp')   # [("title", "Walk")]
+        stream.feed('_reward": 10}')           # [("xp_reward", 10)]
+        stream.complete                          # True
+    """
+
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start: Optional[int] = None
+        self._length = 0
+        self.complete = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume the next chunk of text.
+
+        Args:
+            chunk: Next piece of the JSON text
+
+        Returns:
+            Fields completed by this chunk, in order
+
+        Raises:
+            ValueError: If a completed member isn't valid JSON
+        """
+        fields = []
+        if self.complete:
+            return fields
+
+        self._buffer.append(chunk)
+
+        for ch in chunk:
+            position = self._length
+            self._length += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                if self._depth >= 1:
+                    self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    if ch != "{":
+                        raise ValueError("expected a JSON object")
+                    self._member_start = position + 1
+            elif ch in "}]":
+                if self._depth == 1:
+                    field = self._close_member(position)
+                    if field is not None:
+                        fields.append(field)
+                    self.complete = True
+                    self._depth = 0
+                    break
+                self._depth -= 1
+            elif ch == "," and self._depth == 1:
+                field = self._close_member(position)
+                if field is not None:
+                    fields.append(field)
+                self._member_start = position + 1
+
+        return fields
+
+    def _close_member(self, end: int) -> Optional[Tuple[str, Any]]:
+        """Decode the member between the last separator and end."""
+        text = "".join(self._buffer)
+        self._buffer = [text]
+        member = text[self._member_start:end].strip()
+        if not member:
+            return None  # Empty object, or trailing comma
+        try:
+            decoded = json.loads("{" + member + "}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid JSON member: {member[:40]!r} ({e.msg})") from e
+        return next(iter(decoded.items()))
@@ -1,36 +1,32 @@
 """LLM-powered quest parser using Ollama."""
 
 import json
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
 
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.json_stream import JSONFieldStream
+from src.services.parse_cache import ParseCache, normalize_input
+from src.services.rule_quest_parser import RuleQuestParser
 
-class LLMQuestParser:
-    """Parse natural language quest descriptions using Ollama."""
 
-    def __init__(self, ollama_host: str = "http://loki.local:11434", model: str = "qwen2.5:7b"):
-        """Initialize LLM quest parser.
-
-        Args:
-            ollama_host: Ollama server URL
-            model: Model to use for parsing
-        """
-        self.ollama_host = ollama_host
-        self.model = model
-
-    def parse_quest(self, user_input: str, user_context: str = "") -> Optional[Dict[str, Any]]:
-        """Parse a natural language quest description into structured data.
-
-        Args:
-            user_input: Natural language quest description
-            user_context: User context (location, memberships, etc.)
-
-        Returns:
-            Dictionary with quest parameters, or None if parsing failed
-        """
-        context_section = f"\n\nUser context (for reference only, don't adjust XP): {user_context}" if user_context else ""
+# Connect timeout is short so an unreachable host fails fast; the read
+# timeout leaves room for the model to generate.
+CONNECT_TIMEOUT = 2.0
+GENERATE_TIMEOUT = (CONNECT_TIMEOUT, 30.0)
+PROBE_TIMEOUT = (CONNECT_TIMEOUT, 3.0)
 
-        prompt = f"""Parse this quest description into JSON format. Extract:
+# Instructions and few-shot examples, sent as the system prompt. Keep this
+# text stable: any change invalidates Ollama's prompt cache, and must come
+# with a PROMPT_VERSION bump so cached parses are invalidated too.
+SYSTEM_PROMPT = """Parse this quest description into JSON format. Extract:
 - title: short quest title
 - description: what to do
 - category: one of "social", "constitutional", "creative", "experiential"
@@ -50,63 +46,606 @@ Set XP based on the ACTIVITY ITSELF, not user circumstances - the system will ad
 Examples:
 
 Input: "First Friday Poetry at Coit Tower - go hear some spoken word in North Beach"
-Output: {{"title": "First Friday Poetry at Coit Tower", "description": "go hear some spoken word in North Beach for free", "category": "experiential", "xp_reward": 20, "renewal_type": "monthly", "constraint_type": "day_of_month", "constraint_note": "first_friday", "time_note": null}}
+Output: {"title": "First Friday Poetry at Coit Tower", "description": "go hear some spoken word in North Beach for free", "category": "experiential", "xp_reward": 20, "renewal_type": "monthly", "constraint_type": "day_of_month", "constraint_note": "first_friday", "time_note": null}
 
 Input: "Visit the California Academy of Sciences"
-Output: {{"title": "Visit the California Academy of Sciences", "description": "Go to the California Academy of Sciences in Golden Gate Park", "category": "experiential", "xp_reward": 25, "renewal_type": "seasonal", "constraint_type": "time_of_day", "constraint_note": "10:00-17:00", "time_note": "Opens 10am, closes 5pm"}}
+Output: {"title": "Visit the California Academy of Sciences", "description": "Go to the California Academy of Sciences in Golden Gate Park", "category": "experiential", "xp_reward": 25, "renewal_type": "seasonal", "constraint_type": "time_of_day", "constraint_note": "10:00-17:00", "time_note": "Opens 10am, closes 5pm"}
 
 Input: "Daily morning walk around the block"
-Output: {{"title": "Morning walk", "description": "Walk around the block", "category": "constitutional", "xp_reward": 10, "renewal_type": "daily", "constraint_type": null, "constraint_note": null, "time_note": null}}
+Output: {"title": "Morning walk", "description": "Walk around the block", "category": "constitutional", "xp_reward": 10, "renewal_type": "daily", "constraint_type": null, "constraint_note": null, "time_note": null}
 
 Input: "Weekly game night on Fridays"
-Output: {{"title": "Weekly game night", "description": "Play board games with friends", "category": "social", "xp_reward": 15, "renewal_type": "weekly", "constraint_type": "day_of_week", "constraint_note": "Friday", "time_note": null}}
+Output: {"title": "Weekly game night", "description": "Play board games with friends", "category": "social", "xp_reward": 15, "renewal_type": "weekly", "constraint_type": "day_of_week", "constraint_note": "Friday", "time_note": null}
 
 Input: "Visit SFMOMA"
-Output: {{"title": "Visit SFMOMA", "description": "Go to the SF Museum of Modern Art", "category": "experiential", "xp_reward": 25, "renewal_type": "seasonal", "constraint_type": "time_of_day", "constraint_note": "10:00-17:00", "time_note": "Open 10am-5pm, closed Wednesdays"}}
+Output: {"title": "Visit SFMOMA", "description": "Go to the SF Museum of Modern Art", "category": "experiential", "xp_reward": 25, "renewal_type": "seasonal", "constraint_type": "time_of_day", "constraint_note": "10:00-17:00", "time_note": "Open 10am-5pm, closed Wednesdays"}
+"""
+
+# How long Ollama keeps the model loaded after a request
+DEFAULT_KEEP_ALIVE = "30m"
+
+REQUIRED_FIELDS = ("title", "category", "xp_reward")
+
+# Every field the prompt asks for, in the order the model emits them
+QUEST_FIELDS = (
+    "title", "description", "category", "xp_reward",
+    "renewal_type", "constraint_type", "constraint_note", "time_note",
+)
+
+FieldCallback = Callable[[str, Any], None]
+
+
+# Parse outcomes recorded in llm_calls
+OUTCOME_OK = "ok"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_CONNECTION_ERROR = "connection_error"
+OUTCOME_HTTP_ERROR = "http_error"
+OUTCOME_INVALID_JSON = "invalid_json"
+OUTCOME_MISSING_FIELDS = "missing_fields"
+OUTCOME_CIRCUIT_OPEN = "circuit_open"
+
+
+@dataclass
+class LLMCall:
+    """Record of one parse or warm-up.
+
+    Durations are milliseconds. Model-side figures come from Ollama's final
+    response chunk; they are None when the answer came from the rules or
+    the cache, or when a streamed generation was cut short.
+    """
+    kind: str  # "parse" or "warm_up"
+    model: str
+    prompt_version: int
+    source: str = "llm"  # "llm", "cache" or "rules"
+    outcome: str = OUTCOME_OK
+    streamed: bool = False
+    input_chars: int = 0
+    wall_ms: float = 0.0
+    first_field_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+    load_ms: Optional[float] = None
+    prompt_eval_count: Optional[int] = None
+    prompt_eval_ms: Optional[float] = None
+    eval_count: Optional[int] = None
+    eval_ms: Optional[float] = None
+    error: Optional[str] = None
+    called_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def cache_hit(self) -> bool:
+        return self.source == "cache"
+
+    def add_response_stats(self, data: Dict[str, Any]):
+        """Copy Ollama's timing and token counts (durations in ns)."""
+        def ms(name):
+            value = data.get(name)
+            return value / 1e6 if value is not None else None
+
+        self.total_ms = ms("total_duration")
+        self.load_ms = ms("load_duration")
+        self.prompt_eval_count = data.get("prompt_eval_count")
+        self.prompt_eval_ms = ms("prompt_eval_duration")
+        self.eval_count = data.get("eval_count")
+        self.eval_ms = ms("eval_duration")
+
+    def fail(self, outcome: str, error: Optional[BaseException] = None):
+        """Mark the call as failed."""
+        self.outcome = outcome
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"[:200]
+
+
+def _classify_request_error(error: BaseException) -> str:
+    """Map a requests exception to an outcome."""
+    if isinstance(error, requests.Timeout):
+        return OUTCOME_TIMEOUT
+    # Read timeouts while streaming surface as ConnectionError
+    if "timed out" in str(error).lower():
+        return OUTCOME_TIMEOUT
+    if isinstance(error, requests.HTTPError):
+        return OUTCOME_HTTP_ERROR
+    return OUTCOME_CONNECTION_ERROR
+
+
+CallRecorder = Callable[[LLMCall], None]
+
+
+# Concurrent requests per host; also the size of the shared connection pool
+DEFAULT_MAX_CONCURRENCY = 4
+
+# One pooled session and breaker per Ollama host, shared by all parsers
+_sessions: Dict[str, requests.Session] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+_shared_lock = threading.Lock()
+
+
+def get_session(ollama_host: str) -> requests.Session:
+    """Get the shared keep-alive session for an Ollama host."""
+    with _shared_lock:
+        session = _sessions.get(ollama_host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=DEFAULT_MAX_CONCURRENCY)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[ollama_host] = session
+        return session
+
+
+def get_breaker(ollama_host: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for an Ollama host."""
+    with _shared_lock:
+        breaker = _breakers.get(ollama_host)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _breakers[ollama_host] = breaker
+        return breaker
+
+
+class LLMQuestParser:
+    """Parse natural language quest descriptions using Ollama."""
+
+    # Bump whenever the prompt changes so cached parses from the old prompt miss
+    PROMPT_VERSION = 2
+
+    # Rule-based parses at or above this confidence skip the model
+    FAST_PATH_CONFIDENCE = 0.8
+
+    def __init__(
+        self,
+        ollama_host: str = "http://loki.local:11434",
+        model: str = "qwen2.5:7b",
+        cache: Optional[ParseCache] = None,
+        session: Optional[requests.Session] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        stream: bool = False,
+        keep_alive: Optional[str] = DEFAULT_KEEP_ALIVE,
+        rule_parser: Optional[RuleQuestParser] = None,
+        timeout: Tuple[float, float] = GENERATE_TIMEOUT,
+        call_recorder: Optional[CallRecorder] = None
+    ):
+        """Initialize LLM quest parser.
+
+        Args:
+            ollama_host: Ollama server URL
+            model: Model to use for parsing
+            cache: Optional parse cache; repeat inputs skip the model
+            session: HTTP session (defaults to the shared pooled session for the host)
+            breaker: Circuit breaker (defaults to the shared breaker for the host)
+            stream: Stream tokens and stop generating once every field is in
+            keep_alive: How long Ollama keeps the model loaded (e.g. "30m"),
+                or None for the server default
+            rule_parser: Optional local parser tried first; the model is only
+                used when its confidence is below FAST_PATH_CONFIDENCE
+            timeout: (connect, read) timeout in seconds for generate requests
+            call_recorder: Called with an LLMCall after every parse and warm-up
+                (e.g. Database.record_llm_call); errors it raises are ignored
+        """
+        self.ollama_host = ollama_host
+        self.model = model
+        self.cache = cache
+        self.session = session or get_session(ollama_host)
+        self.breaker = breaker or get_breaker(ollama_host)
+        self.stream = stream
+        self.keep_alive = keep_alive
+        self.rule_parser = rule_parser
+        self.timeout = timeout
+        self.call_recorder = call_recorder
+
+        # Recent calls, newest last
+        self.calls: "deque[LLMCall]" = deque(maxlen=100)
+
+    def parse_quest(
+        self,
+        user_input: str,
+        user_context: str = "",
+        on_field: Optional[FieldCallback] = None,
+        stop_after: Iterable[str] = QUEST_FIELDS
+    ) -> Optional[Dict[str, Any]]:
+        """Parse a natural language quest description into structured data.
+
+        Args:
+            user_input: Natural language quest description
+            user_context: User context (location, memberships, etc.)
+            on_field: Called with (name, value) as each field becomes known.
+                In streaming mode this happens while the model is still
+                generating.
+            stop_after: In streaming mode, abort generation once all of these
+                fields have arrived (pass REQUIRED_FIELDS for the fastest
+                usable result)
+
+        Returns:
+            Dictionary with quest parameters, or None if parsing failed
+        """
+        call = self._new_parse_call(user_input)
+        try:
+            return self._timed_parse(user_input, user_context, on_field, frozenset(stop_after), call)
+        finally:
+            self._record(call)
+
+    def _new_parse_call(self, user_input: str) -> LLMCall:
+        return LLMCall(
+            kind="parse",
+            model=self.model,
+            prompt_version=self.PROMPT_VERSION,
+            streamed=self.stream,
+            input_chars=len(user_input)
+        )
+
+    def _timed_parse(
+        self,
+        user_input: str,
+        user_context: str,
+        on_field: Optional[FieldCallback],
+        stop_after: frozenset,
+        call: LLMCall
+    ) -> Optional[Dict[str, Any]]:
+        """Parse, timing the whole call into call.wall_ms."""
+        started = time.perf_counter()
+        try:
+            return self._parse_quest(user_input, user_context, on_field, stop_after, call)
+        finally:
+            call.wall_ms = (time.perf_counter() - started) * 1000
+
+    def _parse_quest(
+        self,
+        user_input: str,
+        user_context: str,
+        on_field: Optional[FieldCallback],
+        stop_after: frozenset,
+        call: LLMCall
+    ) -> Optional[Dict[str, Any]]:
+        """Try the rules, then the cache, then the model."""
+        if self.rule_parser is not None:
+            rule_result = self.rule_parser.parse(user_input)
+            if rule_result.confidence >= self.FAST_PATH_CONFIDENCE:
+                call.source = "rules"
+                self._emit_fields(rule_result.quest_data, on_field)
+                return rule_result.quest_data
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(user_input, user_context, self.model, self.PROMPT_VERSION)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                call.source = "cache"
+                self._emit_fields(cached, on_field)
+                return cached
 
-Now parse this quest:
+        quest_data, complete = self._parse_uncached(user_input, user_context, on_field, stop_after, call)
+
+        # Only successful parses are cached; failures may be transient. A
+        # stream cut short at stop_after has defaults in place of the fields
+        # it skipped, which a later full parse mustn't get back.
+        if quest_data is not None and complete and cache_key is not None:
+            self.cache.put(cache_key, quest_data)
+
+        return quest_data
+
+    @staticmethod
+    def _emit_fields(quest_data: Dict[str, Any], on_field: Optional[FieldCallback]):
+        if on_field is not None:
+            for name, value in quest_data.items():
+                on_field(name, value)
+
+    def _record(self, call: LLMCall):
+        """Keep a call in memory and hand it to the recorder."""
+        self.calls.append(call)
+        if self.call_recorder is not None:
+            try:
+                self.call_recorder(call)
+            except Exception:
+                pass  # Instrumentation must never break parsing
+
+    def parse_many(
+        self,
+        inputs: Iterable[str],
+        user_context: str = "",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Iterator[Tuple[int, str, Optional[Dict[str, Any]]]]:
+        """Parse several quest descriptions with bounded concurrency.
+
+        Results are yielded in input order as soon as each one (and every
+        one before it) is ready. A failure only affects its own item.
+        Inputs that normalize to the same text are sent to the model once.
+        Calls are handed to the recorder from the calling thread, so a
+        recorder writing to a database the caller holds a transaction on
+        doesn't wait on it.
+
+        Args:
+            inputs: Natural language quest descriptions
+            user_context: User context (location, memberships, etc.)
+            max_concurrency: Maximum requests in flight at once
+
+        Yields:
+            (index, input, parsed quest or None) tuples, in input order
+        """
+        items: List[str] = list(inputs)
+        if not items:
+            return
+
+        def parse_one(user_input: str) -> Tuple[Optional[Dict[str, Any]], LLMCall]:
+            call = self._new_parse_call(user_input)
+            try:
+                return self._timed_parse(user_input, user_context, None, frozenset(QUEST_FIELDS), call), call
+            except Exception:
+                return None, call
+
+        executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="llm-batch")
+        try:
+            futures = {}
+            for user_input in items:
+                key = normalize_input(user_input)
+                if key not in futures:
+                    futures[key] = executor.submit(parse_one, user_input)
+
+            recorded = set()
+            for index, user_input in enumerate(items):
+                key = normalize_input(user_input)
+                result, call = futures[key].result()
+                if key not in recorded:
+                    recorded.add(key)
+                    self._record(call)
+                yield index, user_input, dict(result) if result is not None else None
+        finally:
+            # Consumer stopped early: drop whatever hasn't started
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _parse_uncached(
+        self,
+        user_input: str,
+        user_context: str,
+        on_field: Optional[FieldCallback],
+        stop_after: frozenset,
+        call: LLMCall
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Run the model for a quest description.
+
+        Returns:
+            (parsed quest or None, whether the model's whole answer was read)
+        """
+        # Host is known to be down: don't stall the caller on another timeout
+        if not self.breaker.allow_request():
+            call.fail(OUTCOME_CIRCUIT_OPEN)
+            return None, False
+
+        prompt = self._build_prompt(user_input, user_context)
+
+        if self.stream:
+            quest_data, complete = self._generate_streaming(prompt, call, on_field, stop_after)
+        else:
+            quest_data, complete = self._generate(prompt, call), True
+            if quest_data is not None:
+                self._emit_fields(quest_data, on_field)
+
+        return self._finalize(quest_data, call), complete
+
+    def _build_prompt(self, user_input: str, user_context: str) -> str:
+        """Build the per-call part of the prompt.
+
+        The instructions and examples go in the system prompt, which stays
+        byte-identical between calls so Ollama can reuse its evaluated
+        prefix; only this short suffix is evaluated fresh.
+        """
+        context_section = f"User context (for reference only, don't adjust XP): {user_context}\n\n" if user_context else ""
+
+        return f"""{context_section}Now parse this quest:
 Input: "{user_input}"
 Output:"""
 
+    def _request_body(self, prompt: str, stream: bool) -> Dict[str, Any]:
+        """Build an /api/generate request body."""
+        body = {
+            "model": self.model,
+            "system": SYSTEM_PROMPT,
+            "prompt": prompt,
+            "stream": stream,
+            "format": "json"
+        }
+        if self.keep_alive is not None:
+            body["keep_alive"] = self.keep_alive
+        return body
+
+    def warm_up(self) -> bool:
+        """Load the model and evaluate the system prompt ahead of the first parse.
+
+        Generates a single token so Ollama loads the model and caches the
+        evaluated system prompt; the first real parse then only pays for
+        its own short suffix.
+
+        Returns:
+            True if the host answered
+        """
+        if not self.breaker.allow_request():
+            return False
+
+        body = self._request_body(self._build_prompt("warm up", ""), stream=False)
+        body.pop("format")
+        body["options"] = {"num_predict": 1}
+
+        call = LLMCall(kind="warm_up", model=self.model, prompt_version=self.PROMPT_VERSION)
+        started = time.perf_counter()
         try:
-            response = requests.post(
+            response = self.session.post(f"{self.ollama_host}/api/generate", json=body, timeout=self.timeout)
+            if response.status_code != 200:
+                call.fail(OUTCOME_HTTP_ERROR)
+            else:
+                call.add_response_stats(response.json())
+        except requests.RequestException as e:
+            call.fail(_classify_request_error(e), e)
+        except ValueError as e:
+            call.fail(OUTCOME_INVALID_JSON, e)
+        call.wall_ms = (time.perf_counter() - started) * 1000
+        self._record(call)
+
+        if call.outcome != OUTCOME_OK:
+            self.breaker.record_failure()
+            return False
+
+        self.breaker.record_success()
+        return True
+
+    def _generate(self, prompt: str, call: LLMCall) -> Optional[Dict[str, Any]]:
+        """Generate a complete response in one request."""
+        try:
+            response = self.session.post(
                 f"{self.ollama_host}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "format": "json"
-                },
-                timeout=30
+                json=self._request_body(prompt, stream=False),
+                timeout=self.timeout
             )
 
             if response.status_code != 200:
+                self.breaker.record_failure()
+                call.fail(OUTCOME_HTTP_ERROR)
+                call.error = f"HTTP {response.status_code}"
                 return None
 
             result = response.json()
+        except requests.RequestException as e:
+            self.breaker.record_failure()
+            call.fail(_classify_request_error(e), e)
+            return None
+        except ValueError as e:
+            # Not even a valid Ollama envelope
+            self.breaker.record_failure()
+            call.fail(OUTCOME_INVALID_JSON, e)
+            return None
+        except Exception as e:
+            self.breaker.record_failure()
+            call.fail(OUTCOME_CONNECTION_ERROR, e)
+            return None
+
+        self.breaker.record_success()
+        call.add_response_stats(result)
+
+        try:
             quest_data = json.loads(result.get("response", "{}"))
+        except (TypeError, ValueError) as e:
+            call.fail(OUTCOME_INVALID_JSON, e)
+            return None
+        if not isinstance(quest_data, dict):
+            call.fail(OUTCOME_INVALID_JSON)
+            return None
+        return quest_data
 
-            # Validate required fields
-            required = ["title", "category", "xp_reward"]
-            if not all(k in quest_data for k in required):
-                return None
+    def _generate_streaming(
+        self,
+        prompt: str,
+        call: LLMCall,
+        on_field: Optional[FieldCallback],
+        stop_after: frozenset
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Stream the response, surfacing fields as they close.
 
-            # Set defaults
-            quest_data.setdefault("description", "")
-            quest_data.setdefault("renewal_type", None)
-            quest_data.setdefault("constraint_type", None)
-            quest_data.setdefault("constraint_note", None)
-            quest_data.setdefault("time_note", None)
+        Closing the response once every field in stop_after has arrived
+        drops the connection, which makes Ollama stop generating.
 
-            return quest_data
+        Returns:
+            (fields or None, whether the stream ended before stop_after cut it short)
+        """
+        started = time.perf_counter()
+        try:
+            response = self.session.post(
+                f"{self.ollama_host}/api/generate",
+                json=self._request_body(prompt, stream=True),
+                timeout=self.timeout,
+                stream=True
+            )
+        except Exception as e:
+            self.breaker.record_failure()
+            call.fail(_classify_request_error(e), e)
+            return None, False
 
-        except Exception:
+        fields: Dict[str, Any] = {}
+        extractor = JSONFieldStream()
+        complete = False
+
+        try:
+            if response.status_code != 200:
+                self.breaker.record_failure()
+                call.fail(OUTCOME_HTTP_ERROR)
+                call.error = f"HTTP {response.status_code}"
+                return None, False
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+
+                for name, value in extractor.feed(chunk.get("response", "")):
+                    if call.first_field_ms is None:
+                        call.first_field_ms = (time.perf_counter() - started) * 1000
+                    fields[name] = value
+                    if on_field is not None:
+                        on_field(name, value)
+
+                if chunk.get("done"):
+                    call.add_response_stats(chunk)
+                    complete = True
+                    break
+                if extractor.complete:
+                    complete = True
+                    break
+                if stop_after <= fields.keys():
+                    break
+        except (requests.RequestException, OSError) as e:
+            self.breaker.record_failure()
+            call.fail(_classify_request_error(e), e)
+            return None, False
+        except ValueError as e:
+            # The host answered; the model just produced something unusable
+            self.breaker.record_success()
+            call.fail(OUTCOME_INVALID_JSON, e)
+            return None, False
+        finally:
+            response.close()
+
+        self.breaker.record_success()
+        return fields, complete
+
+    @staticmethod
+    def _finalize(quest_data: Optional[Dict[str, Any]], call: LLMCall) -> Optional[Dict[str, Any]]:
+        """Validate required fields and fill in defaults."""
+        if quest_data is None:
+            return None
+
+        # Validate required fields
+        missing = [k for k in REQUIRED_FIELDS if k not in quest_data]
+        if missing:
+            call.fail(OUTCOME_MISSING_FIELDS)
+            call.error = f"missing: {', '.join(missing)}"
             return None
 
+        # Set defaults
+        quest_data.setdefault("description", "")
+        quest_data.setdefault("renewal_type", None)
+        quest_data.setdefault("constraint_type", None)
+        quest_data.setdefault("constraint_note", None)
+        quest_data.setdefault("time_note", None)
+
+        return quest_data
+
     def is_available(self) -> bool:
-        """Check if Ollama service is available."""
-        try:
-            response = requests.get(f"{self.ollama_host}/api/tags", timeout=5)
-            return response.status_code == 200
-        except:
+        """Check if Ollama service is available.
+
+        Uses the breaker's remembered availability when it is fresh, and
+        only probes /api/tags when it isn't.
+        """
+        known = self.breaker.known_availability()
+        if known is not None:
+            return known
+
+        if not self.breaker.allow_request():
             return False
+
+        try:
+            response = self.session.get(f"{self.ollama_host}/api/tags", timeout=PROBE_TIMEOUT)
+            available = response.status_code == 200
+        except Exception:
+            available = False
+
+        if available:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        return available
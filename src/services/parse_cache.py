@@ -0,0 +1,210 @@
+"""Two-level cache for LLM quest parses.
+
+An in-memory LRU sits in front of a small SQLite store, so repeat parses
+of the same description skip Ollama entirely and survive restarts.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULT_CACHE_PATH = "data/cache/llm_parse_cache.db"
+
+
+def normalize_input(text: str) -> str:
+    """Normalize a quest description for cache lookup.
+
+    Case, surrounding quotes, repeated whitespace and trailing punctuation
+    don't change what the model is asked to do, so
+    "Weekly game night on Fridays." and "weekly game night on fridays"
+    share a cache entry.
+    """
+    text = " ".join(text.lower().split())
+    return text.strip(" \"'").rstrip(".!?,;: ")
+
+
+class ParseCache:
+    """LRU + SQLite cache of parsed quest dictionaries.
+
+    Entries are keyed on a hash of the normalized input, user context,
+    model name and prompt version, so changing any of them misses the
+    cache instead of serving a stale parse. Entries older than the TTL
+    are ignored and pruned; the store is trimmed back to max_entries,
+    least recently used first.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_CACHE_PATH,
+        memory_size: int = 256,
+        max_entries: int = 5000,
+        ttl_seconds: float = 30 * 24 * 3600
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for the persistent store, or None for memory only
+            memory_size: Entries held in the in-memory LRU
+            max_entries: Entries kept in the persistent store
+            ttl_seconds: Age after which an entry is treated as missing
+        """
+        self.path = path
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.misses = 0
+
+        if path is not None:
+            self._open_store(path)
+
+    def _open_store(self, path: str):
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS parse_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_parse_cache_accessed ON parse_cache(accessed_at)")
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error:
+            self._conn = None  # Cache is an optimization; fall back to memory only
+
+    @staticmethod
+    def make_key(user_input: str, user_context: str, model: str, prompt_version: int) -> str:
+        """Build a cache key.
+
+        Args:
+            user_input: Raw quest description
+            user_context: User context passed to the prompt
+            model: Model name
+            prompt_version: Version of the prompt template
+
+        Returns:
+            Hex digest identifying the request
+        """
+        material = json.dumps(
+            [normalize_input(user_input), " ".join(user_context.split()), model, prompt_version]
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached parse.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            A copy of the cached parse, or None on a miss
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at < self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return dict(value)
+                del self._memory[key]
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value, created_at FROM parse_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None and now - row[1] < self.ttl_seconds:
+                        value = json.loads(row[0])
+                        self._conn.execute("UPDATE parse_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                        self._conn.commit()
+                        self._remember(key, row[1], value)
+                        self.hits += 1
+                        return dict(value)
+                except (sqlite3.Error, ValueError):
+                    pass
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """Store a parse.
+
+        Args:
+            key: Key from make_key()
+            value: Parsed quest dictionary (must be JSON-serializable)
+        """
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, now, dict(value))
+
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO parse_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                        (key, json.dumps(value), now, now)
+                    )
+                    self._evict(now)
+                    self._conn.commit()
+                except sqlite3.Error:
+                    pass
+
+    def _remember(self, key: str, created_at: float, value: Dict[str, Any]):
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _evict(self, now: float):
+        """Drop expired entries, then trim the store to max_entries."""
+        self._conn.execute("DELETE FROM parse_cache WHERE created_at <= ?", (now - self.ttl_seconds,))
+        self._conn.execute("""
+            DELETE FROM parse_cache WHERE key IN (
+                SELECT key FROM parse_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+
+    def clear(self):
+        """Remove every entry from both levels."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM parse_cache")
+                    self._conn.commit()
+                except sqlite3.Error:
+                    pass
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    return self._conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            return len(self._memory)
+
+    def close(self):
+        """Close the persistent store."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,207 @@
+"""Near-duplicate quest detection with a character-trigram index.
+
+Titles are split into words and each word is padded the way pg_trgm
+does ("  sfmoma "), so trigram sets ignore word order: "Visit SFMOMA"
+and "SFMOMA visit" index identically. Similarity is Jaccard over
+trigram sets.
+
+Lookups use prefix filtering: a title can only reach the threshold if it
+shares enough trigrams with the query, so candidates are gathered from
+the query's rarest trigrams alone and common ones ("  w", "ing") never
+have their posting lists scanned.
+"""
+
+import heapq
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+
+STOPWORDS = frozenset({"a", "an", "the", "to", "at", "of", "in", "on", "for", "with", "and", "my"})
+
+_WORD = re.compile(r"[a-z0-9]+")
+_NUMBER = re.compile(r"\d+")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams of a title or location.
+
+    Args:
+        text: Free text
+
+    Returns:
+        Set of trigrams (empty if the text has no indexable words).
+        Bare numbers are left out; the index compares them exactly.
+    """
+    grams = set()
+    for word in _WORD.findall(text.lower()):
+        if word in STOPWORDS or word.isdigit():
+            continue
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two trigram sets."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+@dataclass
+class DuplicateMatch:
+    """An existing quest or template that resembles a new one."""
+    kind: str  # "quest" or "template"
+    id: Hashable
+    title: str
+    location: str
+    similarity: float  # Title similarity, 0.0 .. 1.0
+    status: Optional[str] = None  # Quest status, filled in by the engine
+
+
+@dataclass
+class _Entry:
+    kind: str
+    id: Hashable
+    title: str
+    location: str
+    title_grams: FrozenSet[str]
+    location_grams: FrozenSet[str]
+    numbers: FrozenSet[str]
+
+
+class TrigramIndex:
+    """Inverted index from title trigrams to quests and templates.
+
+    Entries are added one at a time as quests are created, so the index
+    never needs rebuilding during a session. Postings point at distinct
+    trigram sets rather than entries: renewed or re-created quests often
+    share a title, and each title only needs scoring once.
+    """
+
+    TITLE_THRESHOLD = 0.6
+    # When both sides name a location, they must also roughly agree on it
+    # ("Walk" at Ocean Beach isn't a duplicate of "Walk" at Dolores Park)
+    LOCATION_THRESHOLD = 0.3
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, Hashable], _Entry] = {}
+        self._by_grams: Dict[FrozenSet[str], Set[Tuple[str, Hashable]]] = {}
+        self._postings: Dict[str, Set[FrozenSet[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, kind: str, id: Hashable, title: str, location: str = ""):
+        """Index a quest or template, replacing any previous entry for it.
+
+        Args:
+            kind: "quest" or "template"
+            id: Quest or template ID
+            title: Title to index
+            location: Location (compared, not indexed)
+        """
+        key = (kind, id)
+        self.remove(kind, id)
+
+        entry = _Entry(
+            kind, id, title, location or "",
+            trigrams(title), trigrams(location or ""), frozenset(_NUMBER.findall(title))
+        )
+        self._entries[key] = entry
+
+        keys = self._by_grams.get(entry.title_grams)
+        if keys is None:
+            keys = self._by_grams[entry.title_grams] = set()
+            for gram in entry.title_grams:
+                self._postings.setdefault(gram, set()).add(entry.title_grams)
+        keys.add(key)
+
+    def remove(self, kind: str, id: Hashable):
+        """Drop an entry if present."""
+        entry = self._entries.pop((kind, id), None)
+        if entry is None:
+            return
+
+        keys = self._by_grams[entry.title_grams]
+        keys.discard((kind, id))
+        if keys:
+            return
+        del self._by_grams[entry.title_grams]
+        for gram in entry.title_grams:
+            posting = self._postings[gram]
+            posting.discard(entry.title_grams)
+            if not posting:
+                del self._postings[gram]
+
+    def find(
+        self,
+        title: str,
+        location: str = "",
+        threshold: Optional[float] = None,
+        limit: int = 5
+    ) -> List[DuplicateMatch]:
+        """Find indexed entries that look like the same quest.
+
+        Args:
+            title: New quest title
+            location: New quest location
+            threshold: Minimum title similarity (default TITLE_THRESHOLD)
+            limit: Maximum matches to return
+
+        Returns:
+            Matches, most similar first
+        """
+        threshold = self.TITLE_THRESHOLD if threshold is None else threshold
+        query = trigrams(title)
+        if not query:
+            return []
+        location_grams = trigrams(location or "")
+        numbers = frozenset(_NUMBER.findall(title))
+
+        # Jaccard >= t needs at least ceil(t * |query|) shared trigrams, so a
+        # match must contain one of the |query| - that + 1 rarest trigrams
+        required = max(1, math.ceil(threshold * len(query)))
+        by_rarity = sorted(query, key=lambda gram: len(self._postings.get(gram, ())))
+        candidates: Set[FrozenSet[str]] = set()
+        for gram in by_rarity[:len(query) - required + 1]:
+            candidates.update(self._postings.get(gram, ()))
+
+        scored = []
+        for grams in candidates:
+            score = similarity(query, grams)
+            if score < threshold:
+                continue
+            for key in self._by_grams[grams]:
+                entry = self._entries[key]
+                # "Read chapter 3" and "Read chapter 4" are different quests
+                if numbers and entry.numbers and numbers != entry.numbers:
+                    continue
+                if (location_grams and entry.location_grams
+                        and similarity(location_grams, entry.location_grams) < self.LOCATION_THRESHOLD):
+                    continue
+                # On ties, the user's own quests outrank library templates
+                scored.append((score, entry.kind == "quest", key))
+
+        return [
+            DuplicateMatch(
+                kind=self._entries[key].kind,
+                id=self._entries[key].id,
+                title=self._entries[key].title,
+                location=self._entries[key].location,
+                similarity=round(score, 3)
+            )
+            for score, _, key in heapq.nlargest(limit, scored, key=lambda item: item[:2])
+        ]
+
+
+class DuplicateQuestError(ValueError):
+    """Raised when a new quest looks like one that already exists."""
+
+    def __init__(self, title: str, matches: List[DuplicateMatch]):
+        self.matches = matches
+        best = matches[0]
+        super().__init__(f"'{title}' looks like existing {best.kind} '{best.title}'")
@@ -0,0 +1,219 @@
+"""Quest suggestion scoring over the template library.
+
+Implements the v2 generation heuristic from QUEST_SYSTEM_SPEC.md: push
+the user toward neighborhoods they haven't explored, keep categories
+balanced, and stay out of the way of recent snooze reasons and low mood.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set
+
+from src.domain.quests import QuestCompletion, QuestSnooze, QuestTemplate
+from src.domain.user_profile import UserProfile
+from src.services.quest_templates import normalize_key
+
+
+CATEGORIES = ("social", "constitutional", "creative", "experiential")
+DIFFICULTY_LEVELS = {"easy": 0, "medium": 1, "hard": 2, "extreme": 3}
+
+# Tags that make a quest weather-dependent
+OUTDOOR_TAGS = frozenset(normalize_key(t) for t in ("outdoor", "outdoors", "nature", "bike", "ocean", "park", "views"))
+
+
+class TemplateFeatures(NamedTuple):
+    """Precomputed, query-independent features of one template."""
+    template_id: str
+    category: int  # Index into CATEGORIES, -1 if unknown
+    difficulty: int  # 0 (easy) .. 3 (extreme)
+    outdoor: bool
+    neighborhoods: FrozenSet[str]
+    location_names: FrozenSet[str]
+    active_months: Optional[FrozenSet[int]]
+
+
+@dataclass
+class QuestSuggestion:
+    """A scored template suggestion."""
+    template: QuestTemplate
+    score: float
+    reasons: List[str] = field(default_factory=list)
+
+
+class QuestSuggester:
+    """Score templates against the user's situation and pick the top k."""
+
+    # Scoring weights
+    NEW_NEIGHBORHOOD_BONUS = 3.0
+    CATEGORY_BALANCE_WEIGHT = 2.0
+    DIFFICULTY_MISMATCH_PENALTY = 1.0
+    MEMBERSHIP_BONUS = 1.0
+    SNOOZE_PENALTY = 0.75  # Per matching recent snooze, capped below
+    MAX_SNOOZE_PENALTY = 3.0
+
+    HISTORY_WINDOW_DAYS = 30
+
+    def __init__(self, templates: Iterable[QuestTemplate]):
+        """Precompute feature vectors for a template pool.
+
+        Args:
+            templates: Candidate templates
+        """
+        self._templates: Dict[str, QuestTemplate] = {t.id: t for t in templates}
+        self._features_by_id: Dict[str, TemplateFeatures] = {
+            tid: self._extract_features(self._templates[tid]) for tid in sorted(self._templates)
+        }
+        self._features: List[TemplateFeatures] = list(self._features_by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    @staticmethod
+    def _extract_features(template: QuestTemplate) -> TemplateFeatures:
+        neighborhoods = set()
+        names = set()
+        for location in template.suggested_locations:
+            if location.get("neighborhood"):
+                neighborhoods.add(normalize_key(location["neighborhood"]))
+            if location.get("name"):
+                names.add(normalize_key(location["name"]))
+
+        active_months = None
+        if template.renewal_policy and template.renewal_policy.active_months:
+            active_months = frozenset(template.renewal_policy.active_months)
+
+        category = CATEGORIES.index(template.category) if template.category in CATEGORIES else -1
+
+        return TemplateFeatures(
+            template_id=template.id,
+            category=category,
+            difficulty=DIFFICULTY_LEVELS.get(template.difficulty, 1),
+            outdoor=any(normalize_key(tag) in OUTDOOR_TAGS for tag in template.tags),
+            neighborhoods=frozenset(neighborhoods),
+            location_names=frozenset(names),
+            active_months=active_months
+        )
+
+    def suggest(
+        self,
+        k: int,
+        profile: UserProfile,
+        completions: Iterable[QuestCompletion],
+        snoozes: Iterable[QuestSnooze],
+        mood_score: int = 0,
+        exclude_template_ids: Optional[Set[str]] = None,
+        completed_template_ids: Optional[Dict[int, str]] = None,
+        now: Optional[datetime] = None
+    ) -> List[QuestSuggestion]:
+        """Pick the k best templates for right now.
+
+        Args:
+            k: Number of suggestions
+            profile: User profile (memberships)
+            completions: Completion history
+            snoozes: Snooze history
+            mood_score: Current mood score
+            exclude_template_ids: Templates already in the user's quest list
+            completed_template_ids: Map of quest id -> template id, used to
+                credit template neighborhoods as visited
+            now: Current time (for tests)
+
+        Returns:
+            Up to k suggestions, best first
+        """
+        if k <= 0 or not self._features:
+            return []
+
+        now = now or datetime.now(timezone.utc)
+        exclude = exclude_template_ids or set()
+        completed_template_ids = completed_template_ids or {}
+        window_start = now - timedelta(days=self.HISTORY_WINDOW_DAYS)
+
+        # --- Per-query context, computed once ---
+
+        visited: Set[str] = set()
+        category_counts = [0] * len(CATEGORIES)
+        recent_total = 0
+        for completion in completions:
+            if completion.location_visited:
+                visited.add(normalize_key(completion.location_visited))
+
+            features = self._features_by_id.get(completed_template_ids.get(completion.quest_id, ""))
+            if features is None:
+                continue
+            visited |= features.neighborhoods
+            if completion.completed_at >= window_start and features.category >= 0:
+                category_counts[features.category] += 1
+                recent_total += 1
+
+        # Under-represented categories get the biggest bonus
+        category_bonus = [
+            self.CATEGORY_BALANCE_WEIGHT * (1.0 - (count / recent_total if recent_total else 0.0))
+            for count in category_counts
+        ] + [0.0]  # Index -1: unknown category
+
+        # Low mood favors easy quests, high mood allows harder ones
+        if mood_score <= -6:
+            target_difficulty = 0
+        elif mood_score < 6:
+            target_difficulty = 1
+        else:
+            target_difficulty = 2
+        difficulty_score = [
+            -self.DIFFICULTY_MISMATCH_PENALTY * max(0, level - target_difficulty)
+            for level in range(len(DIFFICULTY_LEVELS))
+        ]
+
+        snooze_counts = {"weather": 0, "time": 0, "mood": 0}
+        for snooze in snoozes:
+            if snooze.snoozed_at >= window_start and snooze.reason_category in snooze_counts:
+                snooze_counts[snooze.reason_category] += 1
+        weather_penalty = min(self.MAX_SNOOZE_PENALTY, self.SNOOZE_PENALTY * snooze_counts["weather"])
+        time_penalty = min(self.MAX_SNOOZE_PENALTY, self.SNOOZE_PENALTY * snooze_counts["time"])
+        mood_penalty = min(self.MAX_SNOOZE_PENALTY, self.SNOOZE_PENALTY * snooze_counts["mood"])
+
+        memberships = {normalize_key(m) for m in profile.memberships}
+        month = now.month
+
+        # --- Hot loop: plain arithmetic over precomputed features ---
+
+        def scored():
+            for f in self._features:
+                if f.template_id in exclude:
+                    continue
+                if f.active_months is not None and month not in f.active_months:
+                    continue
+
+                score = category_bonus[f.category] + difficulty_score[f.difficulty]
+                if f.neighborhoods and not f.neighborhoods <= visited:
+                    score += self.NEW_NEIGHBORHOOD_BONUS
+                if f.outdoor:
+                    score -= weather_penalty
+                if f.difficulty >= 2:
+                    score -= time_penalty + mood_penalty
+                if memberships and not memberships.isdisjoint(f.location_names):
+                    score += self.MEMBERSHIP_BONUS
+
+                yield score, f
+
+        # nlargest is stable, and features are sorted by id, so ties break alphabetically
+        top = heapq.nlargest(k, scored(), key=lambda item: item[0])
+
+        suggestions = []
+        for score, f in top:
+            reasons = []
+            if f.neighborhoods and not f.neighborhoods <= visited:
+                reasons.append("New neighborhood to explore")
+            if f.category >= 0 and recent_total and category_counts[f.category] == 0:
+                reasons.append(f"No {CATEGORIES[f.category]} quests lately")
+            if memberships and not memberships.isdisjoint(f.location_names):
+                reasons.append("Covered by your membership")
+            suggestions.append(QuestSuggestion(
+                template=self._templates[f.template_id],
+                score=round(score, 3),
+                reasons=reasons
+            ))
+
+        return suggestions
+
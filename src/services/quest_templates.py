@@ -0,0 +1,286 @@
+"""Indexed quest template library loaded from YAML."""
+
+import pickle
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from src.domain.quests import QuestTemplate, RenewalPolicy
+
+
+DEFAULT_TEMPLATE_GLOB = "config/quest_templates*.yaml"
+DEFAULT_CACHE_PATH = "data/cache/quest_templates.pickle"
+
+# Bump when QuestTemplate or the index layout changes to invalidate old caches
+CACHE_VERSION = 1
+
+FilterValue = Union[str, Iterable[str], None]
+
+
+def normalize_key(value: str) -> str:
+    """Normalize an index key.
+
+    Lowercases, drops punctuation and sorts words so that
+    "Richmond (Inner)" and "Inner Richmond" land on the same key.
+    """
+    cleaned = "".join(c if c.isalnum() else " " for c in value.lower())
+    return " ".join(sorted(cleaned.split()))
+
+
+class QuestTemplateRepository:
+    """Quest templates with inverted indexes for fast filtering.
+
+    Every indexed field maps a normalized value to the set of template ids
+    carrying it, so a query like "easy social quests tagged outdoor near
+    Inner Richmond" is an intersection of a few small sets rather than a
+    scan of the whole library.
+    """
+
+    INDEXED_FIELDS = ("category", "difficulty", "optionality", "tags", "locations")
+
+    def __init__(self, templates: Optional[Iterable[QuestTemplate]] = None):
+        """Initialize the repository.
+
+        Args:
+            templates: Optional templates to index immediately
+        """
+        self._templates: Dict[str, QuestTemplate] = {}
+        self._indexes: Dict[str, Dict[str, Set[str]]] = {field: {} for field in self.INDEXED_FIELDS}
+
+        if templates:
+            self.add_templates(templates)
+
+    # ==================== Loading ====================
+
+    @classmethod
+    def load(
+        cls,
+        paths: Optional[Iterable[Union[str, Path]]] = None,
+        cache_path: Optional[Union[str, Path]] = DEFAULT_CACHE_PATH
+    ) -> "QuestTemplateRepository":
+        """Load templates from YAML files, using the compiled cache if fresh.
+
+        Args:
+            paths: YAML files to load (defaults to config/quest_templates*.yaml)
+            cache_path: Compiled cache file, or None to disable caching
+
+        Returns:
+            Loaded repository
+        """
+        if paths is None:
+            paths = sorted(Path(".").glob(DEFAULT_TEMPLATE_GLOB))
+        paths = [Path(p) for p in paths]
+
+        signature = cls._source_signature(paths)
+
+        if cache_path is not None:
+            cached = cls._read_cache(Path(cache_path), signature)
+            if cached is not None:
+                return cached
+
+        repo = cls()
+        for path in paths:
+            repo.add_templates(cls._parse_yaml(path))
+
+        if cache_path is not None:
+            repo._write_cache(Path(cache_path), signature)
+
+        return repo
+
+    @staticmethod
+    def _source_signature(paths: List[Path]) -> Tuple:
+        """Identify the YAML sources by path, size and modification time."""
+        signature = []
+        for path in paths:
+            stat = path.stat()
+            signature.append((str(path.resolve()), stat.st_size, stat.st_mtime_ns))
+        return (CACHE_VERSION, tuple(signature))
+
+    @classmethod
+    def _read_cache(cls, cache_path: Path, signature: Tuple) -> Optional["QuestTemplateRepository"]:
+        try:
+            with open(cache_path, "rb") as f:
+                cached_signature, templates, indexes = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError, AttributeError):
+            return None
+
+        if cached_signature != signature:
+            return None
+
+        repo = cls()
+        repo._templates = templates
+        repo._indexes = indexes
+        return repo
+
+    def _write_cache(self, cache_path: Path, signature: Tuple):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((signature, self._templates, self._indexes), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass  # Cache is an optimization; a read-only disk just means slower loads
+
+    @staticmethod
+    def _parse_yaml(path: Path) -> List[QuestTemplate]:
+        """Parse a quest template YAML file."""
+        import yaml
+
+        with open(path, "r") as f:
+            data = yaml.safe_load(f) or {}
+
+        templates = []
+        for entry in data.get("templates", []):
+            renewal_policy = None
+            renewal = entry.get("renewal_policy")
+            if renewal:
+                renewal_policy = RenewalPolicy(
+                    renewal_type=renewal.get("type", "never"),
+                    cooldown_days=renewal.get("cooldown_days", 0),
+                    active_months=renewal.get("active_months"),
+                    schedule=renewal.get("schedule")
+                )
+
+            templates.append(QuestTemplate(
+                id=entry["id"],
+                title=entry["title"],
+                description=entry.get("description", ""),
+                category=entry["category"],
+                difficulty=entry["difficulty"],
+                base_xp=entry["base_xp"],
+                optionality=entry.get("optionality", "medium"),
+                suggested_locations=entry.get("suggested_locations") or [],
+                duration_estimate=entry.get("duration_estimate", ""),
+                tags=entry.get("tags") or [],
+                difficulty_factors=entry.get("difficulty_factors"),
+                renewal_policy=renewal_policy
+            ))
+
+        return templates
+
+    # ==================== Indexing ====================
+
+    def add_templates(self, templates: Iterable[QuestTemplate]):
+        """Add templates, replacing any with the same id.
+
+        Args:
+            templates: Templates to add
+        """
+        for template in templates:
+            if template.id in self._templates:
+                self._unindex(self._templates[template.id])
+            self._templates[template.id] = template
+            self._index(template)
+
+    @staticmethod
+    def _index_keys(template: QuestTemplate) -> Dict[str, Set[str]]:
+        locations = set()
+        for location in template.suggested_locations:
+            for field in ("name", "neighborhood"):
+                if location.get(field):
+                    locations.add(normalize_key(location[field]))
+
+        return {
+            "category": {normalize_key(template.category)},
+            "difficulty": {normalize_key(template.difficulty)},
+            "optionality": {normalize_key(template.optionality)},
+            "tags": {normalize_key(tag) for tag in template.tags},
+            "locations": locations,
+        }
+
+    def _index(self, template: QuestTemplate):
+        for field, keys in self._index_keys(template).items():
+            index = self._indexes[field]
+            for key in keys:
+                index.setdefault(key, set()).add(template.id)
+
+    def _unindex(self, template: QuestTemplate):
+        for field, keys in self._index_keys(template).items():
+            index = self._indexes[field]
+            for key in keys:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(template.id)
+                    if not ids:
+                        del index[key]
+
+    # ==================== Queries ====================
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __contains__(self, template_id: str) -> bool:
+        return template_id in self._templates
+
+    def get(self, template_id: str) -> Optional[QuestTemplate]:
+        """Get a template by id, or None."""
+        return self._templates.get(template_id)
+
+    def all(self) -> List[QuestTemplate]:
+        """Get all templates, ordered by id."""
+        return [self._templates[tid] for tid in sorted(self._templates)]
+
+    def values(self, field: str) -> List[str]:
+        """Get the distinct normalized keys of an indexed field."""
+        return sorted(self._indexes[field])
+
+    def find(
+        self,
+        category: FilterValue = None,
+        difficulty: FilterValue = None,
+        optionality: FilterValue = None,
+        tags: FilterValue = None,
+        location: FilterValue = None,
+        match_all_tags: bool = True
+    ) -> List[QuestTemplate]:
+        """Find templates matching every given filter.
+
+        Each filter accepts a single value or a collection of values. For
+        category, difficulty, optionality and location, a collection means
+        "any of these". Tags must all be present unless match_all_tags is False.
+
+        Returns:
+            Matching templates, ordered by id
+        """
+        candidate_sets: List[Set[str]] = []
+
+        for field, value in (
+            ("category", category),
+            ("difficulty", difficulty),
+            ("optionality", optionality),
+            ("locations", location),
+        ):
+            if value is not None:
+                candidate_sets.append(self._lookup_any(field, value))
+
+        if tags is not None:
+            tag_values = [tags] if isinstance(tags, str) else list(tags)
+            if match_all_tags:
+                candidate_sets.extend(self._lookup_any("tags", tag) for tag in tag_values)
+            else:
+                candidate_sets.append(self._lookup_any("tags", tag_values))
+
+        if not candidate_sets:
+            return self.all()
+
+        # Intersect smallest first so the working set shrinks fastest
+        candidate_sets.sort(key=len)
+        result = set(candidate_sets[0])
+        for ids in candidate_sets[1:]:
+            result &= ids
+            if not result:
+                break
+
+        return [self._templates[tid] for tid in sorted(result)]
+
+    def _lookup_any(self, field: str, value: FilterValue) -> Set[str]:
+        index = self._indexes[field]
+        values = [value] if isinstance(value, str) else list(value)
+
+        if len(values) == 1:
+            return index.get(normalize_key(values[0]), set())
+
+        ids: Set[str] = set()
+        for v in values:
+            ids |= index.get(normalize_key(v), set())
+        return ids
@@ -0,0 +1,291 @@
+"""Rule-based quest parser for common phrasings.
+
+Handles the patterns the LLM's own few-shot examples cover ("every
+Friday", "first friday", "weekly ...", known venues) locally, so most
+quest creation never needs the network.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+ORDINALS = {"first": "first", "1st": "first", "second": "second", "2nd": "second",
+            "third": "third", "3rd": "third", "fourth": "fourth", "4th": "fourth", "last": "last"}
+
+# Known venues: normalized name -> (category, base XP, renewal type)
+VENUES: Dict[str, Tuple[str, int, Optional[str]]] = {
+    "sfmoma": ("experiential", 25, "seasonal"),
+    "de young": ("experiential", 25, "seasonal"),
+    "california academy of sciences": ("experiential", 25, "seasonal"),
+    "cal academy": ("experiential", 25, "seasonal"),
+    "academy of sciences": ("experiential", 25, "seasonal"),
+    "exploratorium": ("experiential", 25, "seasonal"),
+    "asian art museum": ("experiential", 25, "seasonal"),
+    "legion of honor": ("experiential", 25, "seasonal"),
+    "conservatory of flowers": ("experiential", 20, "seasonal"),
+    "japanese tea garden": ("experiential", 20, "seasonal"),
+    "alcatraz": ("experiential", 30, None),
+    "coit tower": ("experiential", 20, "seasonal"),
+    "twin peaks": ("experiential", 20, "monthly"),
+    "lands end": ("constitutional", 20, "monthly"),
+    "ocean beach": ("constitutional", 15, "weekly"),
+    "dolores park": ("social", 15, "weekly"),
+    "golden gate park": ("constitutional", 15, "weekly"),
+    "presidio": ("constitutional", 15, "monthly"),
+}
+
+# Category keywords, matched on word boundaries
+CATEGORY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "social": ("friend", "friends", "game night", "party", "dinner with", "lunch with", "coffee with",
+               "brunch", "meetup", "meet up", "hang out", "call mom", "call dad", "call", "date night",
+               "dim sum", "picnic", "board games", "potluck"),
+    "constitutional": ("walk", "run", "jog", "hike", "bike", "ride", "gym", "yoga", "swim", "stretch",
+                       "exercise", "workout", "climb", "meditate"),
+    "creative": ("write", "writing", "journal", "draw", "sketch", "paint", "painting", "knit",
+                 "compose", "practice guitar", "practice piano", "photograph", "photos", "craft"),
+    "experiential": ("visit", "museum", "concert", "show", "exhibit", "exhibition", "tour",
+                     "festival", "gallery", "poetry", "reading", "lecture", "theater", "theatre",
+                     "movie", "market", "explore"),
+}
+
+# Keywords that settle the category on their own. The rest of
+# CATEGORY_KEYWORDS are common verbs ("call", "run", "visit") that only
+# hint at it: "Call the dentist" isn't social, "Run errands" isn't exercise.
+CATEGORY_PHRASES: Dict[str, Tuple[str, ...]] = {
+    "social": ("game night", "dinner with", "lunch with", "coffee with", "brunch", "meetup", "meet up",
+               "hang out", "call mom", "call dad", "date night", "dim sum", "picnic", "board games", "potluck"),
+    "constitutional": ("gym", "yoga", "workout"),
+    "creative": ("journal", "practice guitar", "practice piano"),
+    "experiential": ("museum", "concert", "exhibit", "exhibition", "festival", "gallery", "poetry",
+                     "lecture", "theater", "theatre"),
+}
+
+# Category score when only common verbs matched: with a short title and a
+# weekday that still stays under the LLM fast-path threshold
+WEAK_CATEGORY_SCORE = 0.15
+
+DEFAULT_XP = {"social": 15, "constitutional": 10, "creative": 15, "experiential": 25}
+
+
+@dataclass
+class RuleParseResult:
+    """Outcome of a rule-based parse."""
+    quest_data: Dict[str, Any]
+    confidence: float  # 0.0 .. 1.0
+    evidence: List[str] = field(default_factory=list)
+
+
+class RuleQuestParser:
+    """Parse quest descriptions with regexes and keyword tables.
+
+    Every pattern is compiled once at import; a parse is a handful of
+    regex searches over a short string.
+    """
+
+    _DAY = r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)s?"
+
+    NTH_WEEKDAY = re.compile(
+        r"\b(first|1st|second|2nd|third|3rd|fourth|4th|last)\s+" + _DAY + r"(\s+of\s+(the|each|every)\s+month)?\b",
+        re.IGNORECASE
+    )
+    EVERY_WEEKDAY = re.compile(r"\b(?:every|each|on)\s+" + _DAY + r"\b", re.IGNORECASE)
+    BARE_WEEKDAY = re.compile(r"\b" + _DAY + r"\b", re.IGNORECASE)
+    DAILY = re.compile(r"\b(daily|every\s+(day|morning|evening|night)|each\s+(day|morning|evening|night))\b", re.IGNORECASE)
+    WEEKLY = re.compile(r"\b(weekly|every\s+week|each\s+week|once\s+a\s+week)\b", re.IGNORECASE)
+    MONTHLY = re.compile(r"\b(monthly|every\s+month|each\s+month|once\s+a\s+month)\b", re.IGNORECASE)
+    SEASONAL = re.compile(r"\b(seasonal(ly)?|quarterly|every\s+season|every\s+(3|three)\s+months)\b", re.IGNORECASE)
+    ONE_TIME = re.compile(r"\b(once|one[\s-]time|one[\s-]off|someday)\b", re.IGNORECASE)
+
+    TIME = r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?"
+    TIME_RANGE = re.compile(r"\b" + TIME + r"\s*(?:-|–|to|until)\s*" + TIME + r"\b", re.IGNORECASE)
+
+    # Schedule phrases stripped from the end of a title
+    TRAILING_SCHEDULE = re.compile(
+        r"[\s,]*\b(?:(?:on|every|each)\s+" + _DAY + r"|daily|every\s+day|each\s+day)\s*$",
+        re.IGNORECASE
+    )
+
+    DIFFICULTY_UP = re.compile(r"\b(hard|challenging|long|all[\s-]day|full[\s-]day|uphill|marathon)\b", re.IGNORECASE)
+
+    MAX_TITLE_WORDS = 8
+
+    def __init__(self):
+        self._category_patterns = {
+            category: re.compile(r"\b(" + "|".join(re.escape(k) for k in keywords) + r")\b", re.IGNORECASE)
+            for category, keywords in CATEGORY_KEYWORDS.items()
+        }
+        self._phrase_patterns = {
+            category: re.compile(r"\b(" + "|".join(re.escape(k) for k in phrases) + r")\b", re.IGNORECASE)
+            for category, phrases in CATEGORY_PHRASES.items()
+        }
+        self._venue_pattern = re.compile(
+            r"\b(" + "|".join(re.escape(v) for v in sorted(VENUES, key=len, reverse=True)) + r")\b",
+            re.IGNORECASE
+        )
+
+    def parse(self, user_input: str) -> RuleParseResult:
+        """Parse a quest description.
+
+        Args:
+            user_input: Natural language quest description
+
+        Returns:
+            Parse result with quest fields and a confidence score
+        """
+        text = " ".join(user_input.split())
+        evidence: List[str] = []
+        confidence = 0.0
+
+        # --- Title and description ---
+        title, description = self._split_title(text)
+        if title and len(title.split()) <= self.MAX_TITLE_WORDS:
+            confidence += 0.2
+            evidence.append("short title")
+
+        # --- Venue ---
+        venue = None
+        venue_match = self._venue_pattern.search(text)
+        if venue_match:
+            venue = VENUES[venue_match.group(1).lower()]
+            evidence.append(f"venue: {venue_match.group(1)}")
+
+        # --- Category ---
+        category, category_score = self._match_category(text)
+        if venue is not None:
+            if category is None or category == venue[0]:
+                category, category_score = venue[0], 0.4
+            confidence += 0.1
+        if category is not None:
+            confidence += category_score
+            evidence.append(f"category: {category}")
+
+        # --- Schedule ---
+        renewal_type, constraint_type, constraint_note, schedule_score = self._match_schedule(text)
+        if renewal_type is None and constraint_type is None and venue is not None and not self.ONE_TIME.search(text):
+            renewal_type = venue[2]
+        confidence += schedule_score
+        if schedule_score >= 0.3:
+            evidence.append(f"schedule: {renewal_type or 'one-time'}")
+
+        time_note = None
+        time_match = self.TIME_RANGE.search(text)
+        if time_match:
+            time_note = time_match.group(0)
+            # A day constraint takes the constraint slot; the hours still go in time_note
+            if constraint_type is None:
+                constraint_type = "time_of_day"
+                constraint_note = self._format_time_range(time_match)
+
+        # --- XP ---
+        xp_reward = venue[1] if venue is not None else DEFAULT_XP.get(category, 10)
+        if self.DIFFICULTY_UP.search(text):
+            xp_reward += 10
+
+        quest_data = {
+            "title": title,
+            "description": description,
+            "category": category or "experiential",
+            "xp_reward": xp_reward,
+            "renewal_type": renewal_type,
+            "constraint_type": constraint_type,
+            "constraint_note": constraint_note,
+            "time_note": time_note,
+        }
+
+        return RuleParseResult(quest_data=quest_data, confidence=round(min(confidence, 1.0), 2), evidence=evidence)
+
+    def _split_title(self, text: str) -> Tuple[str, str]:
+        """Split "Title - description" input and tidy the title."""
+        title, description = text, ""
+        for separator in (" - ", " – ", ": "):
+            if separator in text:
+                title, description = text.split(separator, 1)
+                break
+
+        title = self.TRAILING_SCHEDULE.sub("", title).strip(" ,.;:!\"'")
+        if title:
+            title = title[0].upper() + title[1:]
+        return title, description.strip()
+
+    def _match_category(self, text: str) -> Tuple[Optional[str], float]:
+        """Pick the category whose keywords match, scoring ambiguity lower."""
+        hits = {}
+        for category, pattern in self._category_patterns.items():
+            matches = pattern.findall(text)
+            if matches:
+                hits[category] = len(matches)
+
+        if not hits:
+            return None, 0.0
+
+        ranked = sorted(hits.items(), key=lambda item: item[1], reverse=True)
+        if len(ranked) == 1:
+            category, score = ranked[0][0], 0.4
+        elif ranked[0][1] > ranked[1][1]:
+            category, score = ranked[0][0], 0.25
+        else:
+            # Tie: first keyword in the text wins, but we're unsure
+            first = min(hits, key=lambda c: self._category_patterns[c].search(text).start())
+            return first, 0.1
+
+        if not self._phrase_patterns[category].search(text):
+            score = min(score, WEAK_CATEGORY_SCORE)
+        return category, score
+
+    def _match_schedule(self, text: str) -> Tuple[Optional[str], Optional[str], Optional[str], float]:
+        """Find renewal type and day constraints.
+
+        Returns:
+            (renewal_type, constraint_type, constraint_note, score)
+        """
+        nth = self.NTH_WEEKDAY.search(text)
+        if nth:
+            note = f"{ORDINALS[nth.group(1).lower()]}_{nth.group(2).lower()}"
+            return "monthly", "day_of_month", note, 0.4
+
+        every_day = self.EVERY_WEEKDAY.search(text)
+        if every_day:
+            return "weekly", "day_of_week", every_day.group(1).title(), 0.4
+
+        if self.DAILY.search(text):
+            return "daily", None, None, 0.4
+
+        for pattern, renewal_type in ((self.WEEKLY, "weekly"), (self.MONTHLY, "monthly"), (self.SEASONAL, "seasonal")):
+            if pattern.search(text):
+                bare_day = self.BARE_WEEKDAY.search(text)
+                if renewal_type == "weekly" and bare_day:
+                    return "weekly", "day_of_week", bare_day.group(1).title(), 0.4
+                return renewal_type, None, None, 0.3
+
+        if self.ONE_TIME.search(text):
+            return None, None, None, 0.3
+
+        # No schedule words: probably one-time, but the LLM may know better
+        return None, None, None, 0.1
+
+    @staticmethod
+    def _format_time_range(match: re.Match) -> str:
+        """Format a matched time range as HH:MM-HH:MM (24h)."""
+        h1, m1, ampm1, h2, m2, ampm2 = match.groups()
+        # "10-4:30pm": an unqualified start takes the end's meridiem if that keeps it earlier
+        if ampm1 is None and ampm2 is not None:
+            start_same = RuleQuestParser._to_24h(int(h1), ampm2)
+            ampm1 = ampm2 if start_same <= RuleQuestParser._to_24h(int(h2), ampm2) else "am"
+
+        def fmt(hour, minute, ampm):
+            return f"{RuleQuestParser._to_24h(int(hour), ampm):02d}:{int(minute or 0):02d}"
+
+        return f"{fmt(h1, m1, ampm1)}-{fmt(h2, m2, ampm2)}"
+
+    @staticmethod
+    def _to_24h(hour: int, ampm: Optional[str]) -> int:
+        if ampm is None:
+            return hour
+        ampm = ampm.lower()
+        if ampm == "pm" and hour != 12:
+            return hour + 12
+        if ampm == "am" and hour == 12:
+            return 0
+        return hour
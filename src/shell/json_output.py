@@ -0,0 +1,56 @@
+"""Machine-readable output for the shell's --json and --format jsonl modes."""
+
+import dataclasses
+import json
+import sys
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable, Optional, TextIO
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert an engine result to plain JSON types.
+
+    Dataclasses become objects, datetimes ISO 8601 strings, enums their
+    values and tuples lists.
+
+    Args:
+        value: Engine result (dataclass, dict, list or scalar)
+
+    Returns:
+        Value json.dumps() can serialize
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: to_jsonable(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def write_json(value: Any, stream: Optional[TextIO] = None):
+    """Write a value as one compact JSON document on its own line.
+
+    Args:
+        value: Engine result
+        stream: Output stream (defaults to stdout)
+    """
+    stream = stream or sys.stdout
+    stream.write(json.dumps(to_jsonable(value), ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def write_jsonl(records: Iterable[Any], stream: Optional[TextIO] = None):
+    """Write each record as its own JSON line.
+
+    Args:
+        records: Engine results
+        stream: Output stream (defaults to stdout)
+    """
+    stream = stream or sys.stdout
+    for record in records:
+        write_json(record, stream)
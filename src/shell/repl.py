@@ -1,22 +1,78 @@
 """MOOdBBS command shell REPL."""
 
+import argparse
+import shlex
+import sqlite3
 import sys
-from typing import List, Optional
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from typing import Any, Iterable, List, Optional
 
 from src.engine import MOOdBBSEngine
+from src.shell.json_output import write_json, write_jsonl
+
+OUTPUT_FORMATS = ("text", "json", "jsonl")
+
+
+def split_command(command: str) -> List[str]:
+    """Split a command line into words, honouring quotes where they balance.
+
+    Args:
+        command: Command line
+
+    Returns:
+        Words (plain whitespace split if the quotes don't balance, so
+        "log custom Mom's call 3" still works)
+    """
+    try:
+        return shlex.split(command)
+    except ValueError:
+        return command.split()
 
 
 class MOOdBBSShell:
     """Interactive command shell for MOOdBBS."""
 
-    def __init__(self):
-        """Initialize the shell."""
-        self.console = Console()
-        self.engine = MOOdBBSEngine()
+    def __init__(self, db_path: str = "data/moodbbs.db", interactive: bool = True, output_format: str = "text"):
+        """Initialize the shell.
+
+        Args:
+            db_path: Path to SQLite database
+            interactive: Whether commands may prompt for input (False in batch mode)
+            output_format: "text" for Rich output; "json" or "jsonl" to write
+                mood, quests, traits and stats as JSON on stdout (other
+                messages then go to stderr)
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        self._console = None
+        self.engine = MOOdBBSEngine(db_path=db_path)
         self.running = True
+        self.interactive = interactive
+        self.output_format = output_format
+        self.last_error: Optional[str] = None
+
+    @property
+    def console(self):
+        """Rich console, created on first use so JSON output never loads Rich."""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console(stderr=self.output_format != "text")
+        return self._console
+
+    @property
+    def json_output(self) -> bool:
+        """Whether results are written as JSON instead of rendered."""
+        return self.output_format != "text"
+
+    def _emit(self, value: Any):
+        """Write a result as JSON: lists as one array, or one line per item for jsonl.
+
+        Args:
+            value: Engine result
+        """
+        if self.output_format == "jsonl" and isinstance(value, list):
+            write_jsonl(value)
+        else:
+            write_json(value)
 
     def run(self):
         """Run the shell REPL."""
@@ -39,15 +95,81 @@ class MOOdBBSShell:
 
         self.console.print("\n[dim]Goodbye![/dim]")
 
-    def execute_command(self, command: str):
+    def run_batch(self, lines: Iterable[str], source: str = "<stdin>") -> int:
+        """Run a script of commands in one engine session and one transaction.
+
+        Blank lines and lines starting with # are skipped. Stops at the
+        first command that fails, rolling back everything the script did.
+
+        Args:
+            lines: Script lines
+            source: Script name for error messages
+
+        Returns:
+            Exit status: 0 if every command succeeded, 1 otherwise
+        """
+        self.interactive = False
+        line_number = 0
+        command = ""
+        try:
+            with self.engine.db.transaction():
+                for line_number, line in enumerate(lines, start=1):
+                    command = line.strip()
+                    if not command or command.startswith("#"):
+                        continue
+                    if not self.execute_command(command):
+                        raise ValueError(self.last_error)
+                    if not self.running:
+                        break
+        except Exception as e:
+            print(f"{source}:{line_number}: {command}: {e}", file=sys.stderr)
+            print("No changes were saved", file=sys.stderr)
+            return 1
+        return 0
+
+    def _error(self, message: str):
+        """Report a failed command.
+
+        Args:
+            message: Rich-markup error message
+        """
+        from rich.text import Text
+
+        self.last_error = Text.from_markup(message).plain
+        self.console.print(f"[red]{message}[/red]")
+
+    def _ask(self, prompt: str, default: Optional[str] = None) -> str:
+        """Prompt for a line of input.
+
+        Args:
+            prompt: Prompt text
+            default: Answer to use in batch mode
+
+        Returns:
+            The stripped answer
+
+        Raises:
+            ValueError: In batch mode, if the prompt has no default
+        """
+        if self.interactive:
+            return input(prompt).strip()
+        if default is None:
+            raise ValueError(f"needs input ('{prompt.strip()}'), which batch mode can't give")
+        return default
+
+    def execute_command(self, command: str) -> bool:
         """Execute a shell command.
 
         Args:
             command: Command string to execute
+
+        Returns:
+            False if the command failed
         """
-        parts = command.split()
+        self.last_error = None
+        parts = split_command(command)
         if not parts:
-            return
+            return True
 
         cmd = parts[0].lower()
         args = parts[1:]
@@ -71,17 +193,25 @@ class MOOdBBSShell:
             self.cmd_hide(args)
         elif cmd == "create":
             self.cmd_create(args)
+        elif cmd == "suggest":
+            self.cmd_suggest(args)
         elif cmd == "traits":
             self.cmd_traits(args)
         elif cmd == "stats":
             self.cmd_stats()
+        elif cmd == "export":
+            self.cmd_export(args)
+        elif cmd == "import":
+            self.cmd_import(args)
         else:
-            self.console.print(f"[red]Unknown command: {cmd}[/red]")
+            self._error(f"Unknown command: {cmd}")
             self.console.print("Type 'help' for available commands")
 
+        return self.last_error is None
+
     def cmd_help(self):
         """Show help message."""
-        help_text = """
+        help_text = r"""
 [bold]Available commands:[/bold]
 
 [cyan]Mood System:[/cyan]
@@ -96,15 +226,28 @@ class MOOdBBSShell:
   snooze <id>             - Snooze a quest
   hide <id>               - Hide a quest permanently
   create quest            - Create a new quest (interactive)
+  create quest <title> \[category=..] \[difficulty=..] \[location=..] \[description=..]
+  create ideas \[file]     - Create quests from a list of ideas (LLM)
+  suggest \[n]             - Suggest quests from the template library
+  suggest accept <id>     - Start a quest from a template
 
 [cyan]Traits:[/cyan]
   traits                  - List active traits
-  traits add <name>       - Add a trait
+  traits add <name>       - Add a trait (interactive)
+  traits add <name> <val> \[description]
+
+[cyan]Data:[/cyan]
+  export <kind> <file>    - Export quests/templates/completions (.jsonl or .csv)
+  import <kind> <file>    - Import quests/templates/completions (.jsonl or .csv)
 
 [cyan]General:[/cyan]
   stats                   - Show overall statistics
   help                    - Show this help
   exit                    - Exit shell
+
+[cyan]Scripts:[/cyan]
+  shell.py --batch FILE   - Run commands from FILE (or pipe them on stdin)
+                            in one transaction; stops at the first failure
 """
         self.console.print(help_text)
 
@@ -119,6 +262,9 @@ class MOOdBBSShell:
             return
 
         mood = self.engine.get_current_mood()
+        if self.json_output:
+            self._emit(mood)
+            return
 
         # Display mood
         mood_color = "green" if mood.score >= 10 else "yellow" if mood.score >= 0 else "red"
@@ -162,7 +308,7 @@ class MOOdBBSShell:
         if args[0] == "custom":
             # Custom event
             if len(args) < 3:
-                self.console.print("[red]Usage: log custom <description> <modifier>[/red]")
+                self._error("Usage: log custom <description> <modifier>")
                 return
 
             # Join description parts
@@ -170,7 +316,7 @@ class MOOdBBSShell:
             try:
                 modifier = int(args[-1])
             except ValueError:
-                self.console.print("[red]Modifier must be a number[/red]")
+                self._error("Modifier must be a number")
                 return
 
             event = self.engine.log_mood_event(
@@ -192,7 +338,7 @@ class MOOdBBSShell:
             modifier_def = next((m for m in modifier_lib if m.event_type == event_type), None)
 
             if not modifier_def:
-                self.console.print(f"[red]Unknown event: {event_type}[/red]")
+                self._error(f"Unknown event: {event_type}")
                 self.console.print("Run 'log' with no arguments to see available events")
                 return
 
@@ -218,7 +364,10 @@ class MOOdBBSShell:
             args: Command arguments
         """
         if args and args[0] == "history":
-            history = self.engine.get_quest_history(days=7)
+            history, _ = self.engine.get_quest_history_page(limit=50, days=7)
+            if self.json_output:
+                self._emit(history)
+                return
 
             if not history:
                 self.console.print("[yellow]No completed quests in the last 7 days[/yellow]")
@@ -226,15 +375,18 @@ class MOOdBBSShell:
 
             self.console.print("\n[bold]Recently Completed Quests:[/bold]\n")
             for completion in history:
-                quest = self.engine.get_quest_by_id(completion.quest_id)
-                self.console.print(f"✓ {quest.title} [green]+{completion.xp_awarded} XP[/green]")
-                if completion.location_visited:
-                    self.console.print(f"  Location: {completion.location_visited}")
-                self.console.print(f"  [dim]{completion.completed_at.strftime('%Y-%m-%d %H:%M')}[/dim]")
+                title = completion['title'] or f"Quest #{completion['quest_id']}"
+                self.console.print(f"✓ {title} [green]+{completion['xp_awarded']} XP[/green]")
+                if completion['location_visited']:
+                    self.console.print(f"  Location: {completion['location_visited']}")
+                self.console.print(f"  [dim]{completion['completed_at'].strftime('%Y-%m-%d %H:%M')}[/dim]")
                 self.console.print()
             return
 
         quests = self.engine.get_active_quests()
+        if self.json_output:
+            self._emit(quests)
+            return
 
         if not quests:
             self.console.print("[yellow]No active quests[/yellow]")
@@ -256,13 +408,13 @@ class MOOdBBSShell:
             args: Command arguments (quest_id)
         """
         if not args:
-            self.console.print("[red]Usage: complete <quest_id>[/red]")
+            self._error("Usage: complete <quest_id>")
             return
 
         try:
             quest_id = int(args[0])
         except ValueError:
-            self.console.print("[red]Quest ID must be a number[/red]")
+            self._error("Quest ID must be a number")
             return
 
         try:
@@ -277,11 +429,12 @@ class MOOdBBSShell:
                 self.console.print(f"  [{color}]{modifier:+d}[/{color}] {event_type}")
 
             # Ask about additional modifiers
-            self.console.print("\nLog additional modifiers? (y/n): ", end="")
-            response = input().strip().lower()
+            if self.interactive:
+                self.console.print("\nLog additional modifiers? (y/n): ", end="")
+                response = input().strip().lower()
 
-            if response == "y":
-                self._prompt_additional_modifiers(quest_id)
+                if response == "y":
+                    self._prompt_additional_modifiers(quest_id)
 
             # Show updated mood
             mood = self.engine.get_current_mood()
@@ -289,7 +442,7 @@ class MOOdBBSShell:
             self.console.print(f"\nMood updated: {mood.face} [{mood_color}]{mood.score:+d}[/{mood_color}]\n")
 
         except ValueError as e:
-            self.console.print(f"[red]Error: {e}[/red]")
+            self._error(f"Error: {e}")
 
     def _prompt_additional_modifiers(self, quest_id: int):
         """Prompt for additional mood modifiers after quest completion.
@@ -350,13 +503,13 @@ class MOOdBBSShell:
             args: Command arguments (quest_id)
         """
         if not args:
-            self.console.print("[red]Usage: snooze <quest_id>[/red]")
+            self._error("Usage: snooze <quest_id>")
             return
 
         try:
             quest_id = int(args[0])
         except ValueError:
-            self.console.print("[red]Quest ID must be a number[/red]")
+            self._error("Quest ID must be a number")
             return
 
         try:
@@ -364,13 +517,14 @@ class MOOdBBSShell:
             self.console.print(f"\nQuest snoozed: \"{quest.title}\"")
 
             # Ask for reason
-            self.console.print("\nWhy not now? (Enter to skip)")
-            self.console.print("  1. Weather")
-            self.console.print("  2. Don't have time")
-            self.console.print("  3. Not in the mood")
-            self.console.print("  4. Other (specify)")
+            if self.interactive:
+                self.console.print("\nWhy not now? (Enter to skip)")
+                self.console.print("  1. Weather")
+                self.console.print("  2. Don't have time")
+                self.console.print("  3. Not in the mood")
+                self.console.print("  4. Other (specify)")
 
-            choice = input("\nSelect (or Enter): ").strip()
+            choice = self._ask("\nSelect (or Enter): ", default="")
 
             reason_category = "unspecified"
             reason_text = None
@@ -397,7 +551,7 @@ class MOOdBBSShell:
             self.console.print("\n[green]Noted! Snoozed for 7 days.[/green]\n")
 
         except ValueError as e:
-            self.console.print(f"[red]Error: {e}[/red]")
+            self._error(f"Error: {e}")
 
     def cmd_hide(self, args: List[str]):
         """Hide a quest permanently.
@@ -406,7 +560,7 @@ class MOOdBBSShell:
             args: Command arguments (quest_id)
         """
         if not args:
-            self.console.print("[red]Usage: hide <quest_id>[/red]")
+            self._error("Usage: hide <quest_id>")
             return
 
         try:
@@ -414,7 +568,7 @@ class MOOdBBSShell:
             quest = self.engine.get_quest_by_id(quest_id)
 
             self.console.print(f"\nHide quest permanently: \"{quest.title}\"?")
-            confirm = input("Type 'yes' to confirm: ").strip().lower()
+            confirm = self._ask("Type 'yes' to confirm: ").lower()
 
             if confirm == "yes":
                 self.engine.hide_quest(quest_id)
@@ -423,7 +577,7 @@ class MOOdBBSShell:
                 self.console.print("[yellow]Cancelled[/yellow]\n")
 
         except ValueError as e:
-            self.console.print(f"[red]Error: {e}[/red]")
+            self._error(f"Error: {e}")
 
     def cmd_create(self, args: List[str]):
         """Create a new quest interactively.
@@ -431,17 +585,34 @@ class MOOdBBSShell:
         Args:
             args: Command arguments
         """
+        if args and args[0] == "ideas":
+            self.cmd_create_ideas(args[1:])
+            return
+
         if not args or args[0] != "quest":
-            self.console.print("[red]Usage: create quest[/red]")
+            self._error("Usage: create quest | create ideas \\[file]")
+            return
+
+        if len(args) > 1 or not self.interactive:
+            self._create_quest_from_args(args[1:])
             return
 
         self.console.print("\n[bold]Create New Quest[/bold]\n")
 
         title = input("Title: ").strip()
         if not title:
-            self.console.print("[red]Title required[/red]")
+            self._error("Title required")
             return
 
+        matches = self.engine.find_duplicate_quests(title)
+        if matches:
+            self.console.print("[yellow]Similar quests already exist:[/yellow]")
+            for match in matches[:3]:
+                status = match.status if match.kind == "quest" else "template"
+                self.console.print(f"  {match.title} [dim]({status}, {match.similarity:.0%} similar)[/dim]")
+            if input("Create anyway? (y/n): ").strip().lower() != "y":
+                return
+
         description = input("Description (optional): ").strip()
         location = input("Location (optional): ").strip()
 
@@ -484,7 +655,179 @@ class MOOdBBSShell:
             self.console.print(f"{quest.id}. {quest.title} [{xp} XP]\n")
 
         except ValueError as e:
-            self.console.print(f"[red]Error: {e}[/red]")
+            self._error(f"Error: {e}")
+
+    def _create_quest_from_args(self, args: List[str]):
+        """Create a quest from command-line words, without prompting.
+
+        Args:
+            args: Title words, then optional key=value options
+                (category, difficulty, location, description, xp)
+        """
+        title_words = []
+        options = {}
+        for arg in args:
+            key, sep, value = arg.partition("=")
+            if sep and key in ("category", "difficulty", "location", "description", "xp"):
+                options[key] = value
+            else:
+                title_words.append(arg)
+
+        title = " ".join(title_words)
+        if not title:
+            self._error(
+                "Usage: create quest <title> \\[category=..] \\[difficulty=..] \\[location=..] \\[description=..] \\[xp=..]"
+            )
+            return
+
+        difficulty = options.get("difficulty", "easy")
+        default_xp = {"easy": 10, "medium": 18, "hard": 30, "extreme": 50}.get(difficulty, 10)
+        try:
+            xp = int(options.get("xp", default_xp))
+            quest = self.engine.create_quest(
+                title=title,
+                description=options.get("description", ""),
+                category=options.get("category", "experiential"),
+                difficulty=difficulty,
+                location=options.get("location", ""),
+                xp_reward=xp
+            )
+        except ValueError as e:
+            self._error(f"Error: {e}")
+            return
+
+        self.console.print(f"[green]Quest created! {quest.id}. {quest.title} [{quest.xp_reward} XP][/green]")
+
+    def cmd_create_ideas(self, args: List[str]):
+        """Turn a list of quest ideas into quests with the LLM parser.
+
+        Ideas come from a text file (one per line) or are pasted at the
+        prompt, ending with an empty line. They're parsed concurrently and
+        reported in order; an idea that fails to parse, or looks like an
+        existing quest, is skipped. Only as many ideas as there are free
+        active quest slots are sent to the model at a time, and ideas left
+        over once the slots are full are reported as skipped.
+
+        Args:
+            args: Command arguments ([file])
+        """
+        if args:
+            try:
+                with open(args[0], "r", encoding="utf-8") as f:
+                    ideas = [line.strip() for line in f]
+            except OSError as e:
+                self._error(f"Error: {e}")
+                return
+        elif not self.interactive:
+            self._error("Usage: create ideas <file> (batch mode can't read pasted ideas)")
+            return
+        else:
+            self.console.print("Paste quest ideas, one per line. Finish with an empty line.")
+            ideas = []
+            while True:
+                try:
+                    line = input("  idea> ").strip()
+                except EOFError:
+                    break
+                if not line:
+                    break
+                ideas.append(line)
+
+        ideas = [idea for idea in ideas if idea and not idea.startswith("#")]
+        if not ideas:
+            self.console.print("[yellow]No ideas given[/yellow]")
+            return
+
+        slots = self.engine.get_open_quest_slots()
+        if not slots:
+            self._error(f"Already at maximum of {self.engine.quest_manager.max_active_quests} active quests")
+            return
+
+        from src.services.llm_quest_parser import LLMQuestParser
+        from src.services.parse_cache import ParseCache
+        from src.services.rule_quest_parser import RuleQuestParser
+
+        parser = LLMQuestParser(
+            cache=ParseCache(),
+            rule_parser=RuleQuestParser(),
+            call_recorder=self.engine.db.record_llm_call
+        )
+        if not parser.is_available():
+            self.console.print("[yellow]LLM is not available; only common phrasings will be parsed[/yellow]")
+
+        user_context = self.engine.get_user_profile().get_context_for_llm()
+        pending = list(enumerate(ideas))
+        created = 0
+
+        self.console.print(f"\nParsing {len(ideas)} ideas...")
+        if len(ideas) > slots:
+            self.console.print(f"[yellow]Room for {slots} more active quests; ideas past that are skipped[/yellow]")
+        self.console.print()
+        # Parse in waves no bigger than the free slots, so no model call is
+        # spent on an idea that couldn't become a quest; a wave that leaves
+        # slots open (failed parses, duplicates) is followed by another
+        while pending and slots:
+            wave, pending = pending[:slots], pending[slots:]
+            results = parser.parse_many([idea for _, idea in wave], user_context)
+            for (index, idea), (_, _, quest_data) in zip(wave, results):
+                label = f"[{index + 1}/{len(ideas)}]"
+                if quest_data is None:
+                    self.console.print(f"  {label} [red]✗[/red] {idea} [dim](could not parse)[/dim]")
+                    continue
+                try:
+                    quest = self.engine.create_quest_from_parsed(quest_data, allow_duplicate=False)
+                except (ValueError, KeyError) as e:
+                    self.console.print(f"  {label} [red]✗[/red] {idea} [dim]({e})[/dim]")
+                    continue
+                created += 1
+                self.console.print(f"  {label} [green]✓[/green] {quest.id}. {quest.title} [green][{quest.xp_reward} XP][/green]")
+            slots = self.engine.get_open_quest_slots()
+
+        self.console.print(f"\n[bold]Created {created} of {len(ideas)} quests[/bold]")
+        if pending:
+            self.console.print(
+                f"[yellow]Skipped {len(pending)} ideas: already at maximum of "
+                f"{self.engine.quest_manager.max_active_quests} active quests[/yellow]"
+            )
+            for index, idea in pending:
+                self.console.print(f"  [{index + 1}/{len(ideas)}] [dim]{idea}[/dim]")
+        self.console.print()
+
+    def cmd_suggest(self, args: List[str]):
+        """Suggest quests or accept a suggested template.
+
+        Args:
+            args: Command arguments ([n] or accept <template_id>)
+        """
+        if args and args[0] == "accept":
+            if len(args) < 2:
+                self._error("Usage: suggest accept <template_id>")
+                return
+            try:
+                quest = self.engine.create_quest_from_template(args[1])
+                self.console.print(f"[green]Quest created! {quest.id}. {quest.title} [{quest.xp_reward} XP][/green]\n")
+            except ValueError as e:
+                self._error(f"Error: {e}")
+            return
+
+        try:
+            k = int(args[0]) if args else 3
+        except ValueError:
+            self._error("Usage: suggest \\[n]")
+            return
+
+        suggestions = self.engine.suggest_quests(k=k)
+        if not suggestions:
+            self.console.print("[yellow]No quest templates available[/yellow]")
+            return
+
+        self.console.print("\n[bold]Suggested Quests:[/bold]\n")
+        for suggestion in suggestions:
+            template = suggestion.template
+            self.console.print(f"  {template.id}: {template.title} [green][{template.base_xp} XP][/green]")
+            for reason in suggestion.reasons:
+                self.console.print(f"     [dim]{reason}[/dim]")
+        self.console.print("\nUse 'suggest accept <id>' to start one.\n")
 
     def cmd_traits(self, args: List[str]):
         """Show or manage traits.
@@ -494,6 +837,9 @@ class MOOdBBSShell:
         """
         if not args:
             traits = self.engine.get_active_traits()
+            if self.json_output:
+                self._emit(traits)
+                return
 
             if not traits:
                 self.console.print("[yellow]No active traits[/yellow]")
@@ -510,12 +856,19 @@ class MOOdBBSShell:
 
         if args[0] == "add":
             if len(args) < 2:
-                self.console.print("[red]Usage: traits add <trait_name>[/red]")
+                self._error("Usage: traits add <trait_name>")
                 return
 
-            trait_name = " ".join(args[1:])
-            description = input("Description (optional): ").strip()
-            modifier_str = input("Mood modifier: ").strip()
+            if self.interactive:
+                trait_name = " ".join(args[1:])
+                description = input("Description (optional): ").strip()
+                modifier_str = input("Mood modifier: ").strip()
+            elif len(args) < 3:
+                self._error("Usage: traits add <trait_name> <modifier> \\[description]")
+                return
+            else:
+                trait_name, modifier_str = args[1], args[2]
+                description = " ".join(args[3:])
 
             try:
                 modifier = int(modifier_str)
@@ -523,11 +876,14 @@ class MOOdBBSShell:
                 color = "green" if modifier > 0 else "red"
                 self.console.print(f"[{color}]Trait added: {trait_name} ({modifier:+d})[/{color}]\n")
             except ValueError:
-                self.console.print("[red]Modifier must be a number[/red]")
+                self._error("Modifier must be a number")
 
     def cmd_stats(self):
         """Show overall statistics."""
         stats = self.engine.get_user_stats()
+        if self.json_output:
+            self._emit(stats)
+            return
 
         self.console.print("\n[bold]MOOdBBS Statistics[/bold]\n")
         self.console.print(f"Total XP:          {stats['total_xp']}")
@@ -539,11 +895,85 @@ class MOOdBBSShell:
         self.console.print(f"Active Traits:     {stats['active_traits']}")
         self.console.print(f"Active Modifiers:  {stats['active_modifiers']}\n")
 
+    def cmd_export(self, args: List[str]):
+        """Export records to a JSONL or CSV file.
 
-def main():
-    """Main entry point for the shell."""
-    shell = MOOdBBSShell()
-    shell.run()
+        Args:
+            args: Command arguments (kind, path)
+        """
+        if len(args) < 2:
+            self._error("Usage: export <quests|templates|completions> <file.jsonl|file.csv>")
+            return
+
+        kind, path = args[0], args[1]
+        try:
+            count = self.engine.export_records(kind, path)
+            self.console.print(f"[green]Exported {count} {kind} to {path}[/green]")
+        except (ValueError, OSError, sqlite3.Error) as e:
+            self._error(f"Error: {e}")
+
+    def cmd_import(self, args: List[str]):
+        """Import records from a JSONL or CSV file.
+
+        Args:
+            args: Command arguments (kind, path)
+        """
+        if len(args) < 2:
+            self._error("Usage: import <quests|templates|completions> <file.jsonl|file.csv>")
+            return
+
+        if not self.interactive:
+            # Imports write through their own connection, which would wait on the batch's transaction
+            self._error("import can't run inside a batch; run it on its own")
+            return
+
+        kind, path = args[0], args[1]
+        try:
+            count = self.engine.import_records(kind, path)
+            self.console.print(f"[green]Imported {count} {kind} from {path}[/green]")
+        except (ValueError, OSError, sqlite3.Error) as e:
+            self._error(f"Error: {e}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the shell.
+
+    Runs a single command when one is given (shell.py mood --json), a
+    batch when given --batch FILE or when commands are piped in on stdin,
+    and the interactive REPL otherwise. One-shot and batch runs exit with
+    status 1 if a command fails.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="MOOdBBS command shell")
+    parser.add_argument("command", nargs="*", help="run this one command and exit (e.g. 'mood')")
+    parser.add_argument("--batch", metavar="FILE", help="run commands from FILE ('-' for stdin) and exit")
+    parser.add_argument("--db", default="data/moodbbs.db", help="database path (default: %(default)s)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="text", help="output format (default: text)")
+    parser.add_argument("--json", dest="format", action="store_const", const="json", help="same as --format json")
+    args = parser.parse_args(argv)
+
+    if args.command:
+        shell = MOOdBBSShell(db_path=args.db, interactive=False, output_format=args.format)
+        sys.exit(0 if shell.execute_command(shlex.join(args.command)) else 1)
+
+    if args.batch is None and sys.stdin.isatty():
+        MOOdBBSShell(db_path=args.db, output_format=args.format).run()
+        return
+
+    shell = MOOdBBSShell(db_path=args.db, interactive=False, output_format=args.format)
+    if args.batch in (None, "-"):
+        status = shell.run_batch(sys.stdin.read().splitlines())
+    else:
+        try:
+            with open(args.batch, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        status = shell.run_batch(lines, source=args.batch)
+    sys.exit(status)
 
 
 if __name__ == "__main__":
@@ -1,43 +1,75 @@
 """Main TUI application for MOOdBBS."""
 
+import argparse
+from typing import Callable, List, Optional
+
+from rich.align import Align
+
 from src.engine import MOOdBBSEngine
+from src.tui import screens
 from src.tui.screens import (
     BootScreen,
     MainMenuScreen,
     MoodStatsScreen,
+    LiveDashboardScreen,
     WanderMOOScreen,
     QuickLogScreen,
     AboutScreen,
     SettingsScreen,
     SetupWizardScreen,
+    console,
 )
+from src.tui.diff_render import is_slow_link
+from src.tui.keys import KEY_LATENCY_BUDGET, KeyLatency, NumpadInput
+from src.tui.startup import EngineLoader
 
 
 class MOOdBBSApp:
     """Main TUI application."""
 
-    def __init__(self):
-        self.engine = MOOdBBSEngine()
+    def __init__(self, warm_up_llm: bool = True, engine_factory: Callable[[], MOOdBBSEngine] = MOOdBBSEngine):
+        """Start loading the engine; nothing is shown until run().
+
+        Args:
+            warm_up_llm: Start loading the smart-mode model once the engine is up
+            engine_factory: Builds the engine (on the loader thread)
+        """
         self.running = True
+        self.warm_up_llm = warm_up_llm
+        self.engine = None
 
-        # Initialize screens
+        # The engine loads in the background while the boot screen plays
         self.boot_screen = BootScreen()
-        self.setup_wizard = SetupWizardScreen(self.engine)
+        self.engine_loader = EngineLoader(engine_factory, on_ready=self._build_screens).start()
+
+    def _build_screens(self, engine):
+        """Create the screens for a ready engine (loader thread)."""
+        self.setup_wizard = SetupWizardScreen(engine)
         self.main_menu = MainMenuScreen()
-        self.mood_stats = MoodStatsScreen(self.engine)
-        self.wander_moo = WanderMOOScreen(self.engine)
-        self.quick_log = QuickLogScreen(self.engine)
+        self.mood_stats = MoodStatsScreen(engine)
+        self.dashboard = LiveDashboardScreen(engine)
+        self.wander_moo = WanderMOOScreen(engine)
+        self.quick_log = QuickLogScreen(engine)
         self.about = AboutScreen()
-        self.settings = SettingsScreen(self.engine)
+        self.settings = SettingsScreen(engine)
+
+        if self.warm_up_llm:
+            self.wander_moo.warm_up_llm()
+
+    def wait_for_engine(self):
+        """Block until the engine (and screens) are ready."""
+        if not self.engine_loader.done():
+            console.print(Align.center("Negotiating protocol...", style="dim"))
+        self.engine = self.engine_loader.result()
 
     def run(self):
         """Run the TUI application."""
         # Show boot screen
         self.boot_screen.show()
+        self.wait_for_engine()
 
         # Check if first run
-        profile = self.engine.db.get_user_profile()
-        if not profile.setup_completed:
+        if not self.engine.get_dashboard_snapshot().setup_completed:
             self.setup_wizard.show()
 
         # Main menu loop
@@ -55,26 +87,66 @@ class MOOdBBSApp:
                 self.settings.show()
             elif choice == '5':
                 self.about.show()
+            elif choice == 'd':
+                self.dashboard.show()
             elif choice == 'q':
                 self.running = False
 
         # Goodbye message
-        from rich.console import Console
-        from rich.align import Align
-        console = Console()
         console.clear()
         console.print()
         console.print(Align.center("Disconnecting from MOOdBBS...", style="yellow"))
         console.print()
         console.print(Align.center("Goodbye!", style="cyan bold"))
         console.print()
+        console.flush_frame()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for TUI.
 
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="MOOdBBS terminal interface")
+    parser.add_argument(
+        "--slow-link", action=argparse.BooleanOptionalAction, default=None,
+        help="redraw screens as minimal diffs, for serial consoles and laggy SSH "
+             "(default: on for serial lines at 19200 baud or slower)"
+    )
+    parser.add_argument(
+        "--numpad", action=argparse.BooleanOptionalAction, default=True,
+        help="answer menus with single keypresses, no Enter needed (default: on in a terminal)"
+    )
+    parser.add_argument(
+        "--key-latency", action="store_true",
+        help=f"measure keypress-to-redraw time and report it on exit "
+             f"(budget {KEY_LATENCY_BUDGET * 1000:.0f}ms; needs --numpad)"
+    )
+    args = parser.parse_args(argv)
+
+    console.minimal_redraw = is_slow_link() if args.slow_link is None else args.slow_link
+    latency = KeyLatency() if args.key_latency else None
+    screens.numpad = NumpadInput(latency=latency) if args.numpad else None
+    if latency is not None:
+        # A key's sample closes when the frame it triggers reaches the terminal
+        console.on_draw = latency.rendered
 
-def main():
-    """Entry point for TUI."""
     app = MOOdBBSApp()
     app.run()
 
+    if latency is not None:
+        stats = latency.summary()
+        if stats["count"]:
+            console.print(
+                f"[dim]Key latency: {stats['count']} keys, p50 {stats['p50_ms']}ms, "
+                f"p95 {stats['p95_ms']}ms, max {stats['max_ms']}ms, "
+                f"{stats['over_budget']} over {latency.budget * 1000:.0f}ms[/dim]"
+            )
+        else:
+            console.print("[dim]Key latency: no keypresses measured (not a terminal?)[/dim]")
+        console.flush_frame()
+
 
 if __name__ == "__main__":
     main()
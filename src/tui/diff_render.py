@@ -0,0 +1,309 @@
+"""Minimal-diff terminal output for slow serial and SSH links."""
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import Callable, List, Optional, TextIO, Tuple
+
+from rich.cells import cell_len
+from rich.color import ColorSystem
+from rich.console import COLOR_SYSTEMS, Console, RenderableType
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+
+Cell = Tuple[str, Optional[Style]]
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+ERASE_LINE_END = "\x1b[K"
+ERASE_BELOW = "\x1b[J"
+
+
+def is_slow_link(stream: Optional[TextIO] = None) -> bool:
+    """Whether a terminal is a serial line at 19200 baud or slower.
+
+    Pseudo-terminals (local terminals, SSH) report a nominal speed, so
+    this only catches real serial consoles.
+
+    Args:
+        stream: Terminal stream (defaults to stdout)
+
+    Returns:
+        True for slow serial lines; False otherwise or when unknown
+    """
+    try:
+        import termios
+
+        fd = (stream or sys.stdout).fileno()
+        if not os.isatty(fd):
+            return False
+        return termios.tcgetattr(fd)[5] <= termios.B19200
+    except (ImportError, OSError, ValueError, AttributeError):
+        return False
+
+
+def _cells(line: List[Segment]) -> List[Cell]:
+    """Split a rendered line into (character, style) cells."""
+    cells = []
+    for text, style, control in line:
+        if control:
+            continue
+        cells.extend((char, style) for char in text)
+    return cells
+
+
+def _width(cells: List[Cell]) -> int:
+    return sum(cell_len(char) for char, _ in cells)
+
+
+class DiffRenderer:
+    """Draws frames by sending only what changed since the last frame.
+
+    Keeps the cells of the frame on screen. Each new frame is compared
+    row by row: unchanged rows cost nothing, and a changed row is
+    rewritten only between its first and last differing cell, after one
+    cursor move.
+    """
+
+    def __init__(self, color_system: Optional[ColorSystem] = ColorSystem.STANDARD):
+        """Create a renderer.
+
+        Args:
+            color_system: Colors to emit (None for plain text)
+        """
+        self.color_system = color_system
+        self._rows: Optional[List[List[Cell]]] = None
+        self._cursor: Tuple[int, int] = (0, 0)
+        self.frames = 0
+        self.last_frame_bytes = 0
+        self.total_bytes = 0
+
+    def invalidate(self):
+        """Forget what's on screen; the next frame clears and repaints."""
+        self._rows = None
+
+    def line_fed(self, height: int):
+        """Note that the terminal moved to a new line (an echoed Enter).
+
+        Args:
+            height: Terminal height; a new line at the bottom scrolls the
+                screen, so the next frame repaints in full
+        """
+        row = self._cursor[0] + 1
+        if row >= height:
+            self.invalidate()
+        self._cursor = (row, 0)
+
+    def draw(self, lines: List[List[Segment]], file: TextIO, cursor: Optional[Tuple[int, int]] = None) -> int:
+        """Draw a frame.
+
+        Args:
+            lines: Rendered rows, top of the screen first
+            file: Terminal to write to
+            cursor: (row, column) to leave the cursor at (defaults to the
+                end of the last row)
+
+        Returns:
+            Bytes written for this frame
+        """
+        rows = [_cells(line) for line in lines]
+        out = []
+
+        previous = self._rows
+        if previous is None:
+            out.append(CLEAR_SCREEN)
+            previous = []
+            self._cursor = (0, 0)
+
+        for index, row in enumerate(rows):
+            old = previous[index] if index < len(previous) else []
+            self._diff_row(index, old, row, out)
+
+        if len(previous) > len(rows):
+            self._move(len(rows), 0, out)
+            out.append(ERASE_BELOW)
+
+        if cursor is None:
+            cursor = (len(rows) - 1, _width(rows[-1])) if rows else (0, 0)
+        self._move(*cursor, out)
+
+        self._rows = rows
+        data = "".join(out)
+        file.write(data)
+        file.flush()
+
+        self.frames += 1
+        self.last_frame_bytes = len(data.encode("utf-8"))
+        self.total_bytes += self.last_frame_bytes
+        return self.last_frame_bytes
+
+    def _diff_row(self, index: int, old: List[Cell], new: List[Cell], out: List[str]):
+        """Append the output turning row old into row new."""
+        start = 0
+        shortest = min(len(old), len(new))
+        while start < shortest and old[start] == new[start]:
+            start += 1
+        if start == len(old) == len(new):
+            return
+
+        # Skip an unchanged tail, as long as it stays in the same columns
+        end = len(new)
+        if len(old) == len(new):
+            while end > start and old[end - 1] == new[end - 1]:
+                end -= 1
+            if _width(old[start:end]) != _width(new[start:end]):
+                end = len(new)
+
+        self._move(index, _width(new[:start]), out)
+        out.append(self._render(new[start:end]))
+        column = _width(new[:end])
+        self._cursor = (index, column)
+
+        if end == len(new) and _width(new) < _width(old):
+            out.append(ERASE_LINE_END)
+
+    def _render(self, cells: List[Cell]) -> str:
+        """Render cells as text, one escape sequence per run of a style."""
+        parts = []
+        run_style, run = None, []
+        for char, style in cells:
+            if style != run_style and run:
+                parts.append(self._styled("".join(run), run_style))
+                run = []
+            run_style = style
+            run.append(char)
+        if run:
+            parts.append(self._styled("".join(run), run_style))
+        return "".join(parts)
+
+    def _styled(self, text: str, style: Optional[Style]) -> str:
+        if style is None or not style or self.color_system is None:
+            return text
+        return style.render(text, color_system=self.color_system)
+
+    def _move(self, row: int, column: int, out: List[str]):
+        """Move the cursor, using the shortest sequence available."""
+        if self._cursor == (row, column):
+            return
+        if column == 0 and row == self._cursor[0] + 1:
+            out.append("\r\n")
+        elif column == 0 and row == self._cursor[0]:
+            out.append("\r")
+        else:
+            out.append(f"\x1b[{row + 1};{column + 1}H")
+        self._cursor = (row, column)
+
+
+class DiffConsole(Console):
+    """Console that can draw each screen as a minimal diff of the last.
+
+    With minimal_redraw on, clear() starts a new frame instead of clearing
+    the terminal: output is collected, and drawn through a DiffRenderer
+    when the screen waits for input (or calls flush_frame()). Moving
+    between screens that share a layout then only sends the cells that
+    differ. With minimal_redraw off it behaves like Console.
+    """
+
+    def __init__(self, *args, minimal_redraw: bool = False, **kwargs):
+        """Create the console.
+
+        Args:
+            minimal_redraw: Draw screens as diffs (for slow links)
+            *args: Passed to Console
+            **kwargs: Passed to Console
+        """
+        super().__init__(*args, **kwargs)
+        self.minimal_redraw = minimal_redraw
+        self.renderer = DiffRenderer(COLOR_SYSTEMS.get(self.color_system))
+        self._frame: Optional[str] = None  # ANSI text of the current frame
+        # Called once what's been printed is on the terminal (key latency)
+        self.on_draw: Optional[Callable[[], None]] = None
+
+    def _drawn(self):
+        if self.on_draw is not None:
+            self.on_draw()
+
+    @property
+    def in_frame(self) -> bool:
+        """Whether output is being collected into a frame."""
+        return self._frame is not None
+
+    def clear(self, home: bool = True):
+        """Start a new screen: a fresh frame, or a plain clear."""
+        if not self.minimal_redraw:
+            super().clear(home)
+            return
+        if self.in_frame:
+            self.end_capture()
+        self._frame = ""
+        self.begin_capture()
+
+    def flush_frame(self) -> int:
+        """Draw the frame collected so far.
+
+        Returns:
+            Bytes written (0 when not in a frame)
+        """
+        if not self.in_frame:
+            # Printing wrote straight through; it's all on screen already
+            self._drawn()
+            return 0
+        self._frame += self.end_capture()
+        self.begin_capture()
+
+        lines = [list(line.render(self)) for line in Text.from_ansi(self._frame).split("\n", allow_blank=True)]
+        if self._frame.endswith("\n"):
+            lines.append([])  # The cursor sits on a fresh line
+        # Past the bottom the terminal would have scrolled; keep what's visible
+        written = self.renderer.draw(lines[-self.height:], self.file)
+        self._drawn()
+        return written
+
+    def input(self, prompt="", *, markup: bool = True, emoji: bool = True, password: bool = False, stream=None) -> str:
+        """Draw the frame with the prompt, then read a line."""
+        if not self.in_frame:
+            if prompt:
+                self.print(prompt, markup=markup, emoji=emoji, end="")
+            self._drawn()
+            return super().input("", password=password, stream=stream)
+
+        if prompt:
+            self.print(prompt, markup=markup, emoji=emoji, end="")
+        self.flush_frame()
+        result = super().input("", password=password, stream=stream)
+        # What the terminal now shows: the echoed answer and a new line
+        self._frame += ("" if password else result.rstrip("\n")) + "\n"
+        self.renderer.line_fed(self.height)
+        return result
+
+    def draw(self, renderable: RenderableType) -> int:
+        """Replace the screen with a renderable.
+
+        Args:
+            renderable: Everything the screen shows
+
+        Returns:
+            Bytes written (0 unless minimal_redraw is on)
+        """
+        self.clear()
+        self.print(renderable, end="")
+        return self.flush_frame()
+
+    @contextmanager
+    def passthrough(self):
+        """Write straight to the terminal inside the block (spinners, Live).
+
+        The current frame is drawn first; afterwards the screen's contents
+        are unknown, so the next frame repaints in full.
+        """
+        if not self.in_frame:
+            yield
+            return
+
+        self.flush_frame()
+        self.end_capture()
+        try:
+            yield
+        finally:
+            self.renderer.invalidate()
+            self.begin_capture()
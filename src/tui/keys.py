@@ -0,0 +1,336 @@
+"""Keypress input for the TUI: non-blocking polling and numpad menus."""
+
+import os
+import sys
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Numpad keys in application keypad mode (ESC O x), plus arrows (ESC [ x)
+ESCAPE_SEQUENCES = {
+    "Op": "0", "Oq": "1", "Or": "2", "Os": "3", "Ot": "4",
+    "Ou": "5", "Ov": "6", "Ow": "7", "Ox": "8", "Oy": "9",
+    "OM": "enter", "On": ".", "Ok": "+", "Om": "-", "Oj": "*", "Oo": "/",
+    "[A": "up", "[B": "down", "[C": "right", "[D": "left",
+}
+SINGLE_KEYS = {"\r": "enter", "\n": "enter", "\x7f": "backspace", "\x08": "backspace"}
+
+# Phase 2 input budget: keypress to finished redraw
+KEY_LATENCY_BUDGET = 0.1
+
+
+def decode_keys(data: str) -> List[str]:
+    """Split raw terminal input into key names.
+
+    Digits and other printable characters come back as themselves; Enter,
+    Backspace, Esc, arrows and keypad escape sequences get names, so
+    "1", "\\x1bOq" (keypad 1 with NumLock off) and "\\r" decode to
+    ["1", "1", "enter"].
+
+    Args:
+        data: Characters read from the terminal
+
+    Returns:
+        Key names, in order
+    """
+    keys = []
+    i = 0
+    while i < len(data):
+        if data[i] == "\x1b":
+            sequence = data[i + 1:i + 3]
+            if sequence in ESCAPE_SEQUENCES:
+                keys.append(ESCAPE_SEQUENCES[sequence])
+                i += 3
+                continue
+            keys.append("esc")
+        else:
+            keys.append(SINGLE_KEYS.get(data[i], data[i]))
+        i += 1
+    return keys
+
+
+class KeyPoller:
+    """Poll stdin for single keypresses without waiting for Enter.
+
+    On a POSIX terminal, stdin is put into cbreak mode for the duration of
+    the context. Elsewhere (Windows, pipes, tests) poll() reports no key,
+    waiting only on the optional wake pipe, and callers rely on Ctrl+C
+    instead. read_key() reads one decoded key at a time, falling back to
+    whole lines when there's no terminal.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self._saved_attrs = None
+        self._pending: List[str] = []
+
+    @property
+    def raw(self) -> bool:
+        """Whether keys arrive one at a time (a POSIX terminal in cbreak mode)."""
+        return self._saved_attrs is not None
+
+    def __enter__(self) -> "KeyPoller":
+        try:
+            import termios
+            import tty
+
+            if self.stream.isatty():
+                fd = self.stream.fileno()
+                self._saved_attrs = termios.tcgetattr(fd)
+                # TCSANOW keeps keys typed ahead of the prompt
+                tty.setcbreak(fd, termios.TCSANOW)
+        except (ImportError, OSError, ValueError, AttributeError):
+            self._saved_attrs = None
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._saved_attrs is not None:
+            import termios
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved_attrs)
+            self._saved_attrs = None
+        return False
+
+    def poll(self, timeout: float, wake_fd: Optional[int] = None) -> Optional[str]:
+        """Wait up to timeout seconds for a keypress.
+
+        Args:
+            timeout: Seconds to wait
+            wake_fd: Optional pipe read end; a write to the pipe ends the
+                wait early (it is drained before returning)
+
+        Returns:
+            The key pressed, or None
+        """
+        import select
+
+        sources = [] if self._saved_attrs is None else [self.stream]
+        if wake_fd is not None:
+            sources.append(wake_fd)
+
+        if not sources:
+            time.sleep(timeout)
+            return None
+
+        try:
+            readable, _, _ = select.select(sources, [], [], timeout)
+        except (OSError, ValueError):
+            # select() can't wait on pipes on Windows
+            time.sleep(timeout)
+            return None
+
+        if wake_fd is not None and wake_fd in readable:
+            _drain(wake_fd)
+        if self._saved_attrs is not None and self.stream in readable:
+            return self.stream.read(1)
+        return None
+
+    def read_key(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Read one key, decoded to a name (see decode_keys).
+
+        In raw mode this returns as soon as a key is pressed. Otherwise it
+        falls back to reading a whole line, returned stripped ("enter" for
+        an empty line).
+
+        Args:
+            timeout: Seconds to wait in raw mode (None waits forever)
+
+        Returns:
+            Key name, or None on timeout
+
+        Raises:
+            EOFError: If the input stream is closed
+        """
+        if self._pending:
+            return self._pending.pop(0)
+
+        if not self.raw:
+            line = self.stream.readline()
+            if not line:
+                raise EOFError
+            return line.strip() or "enter"
+
+        import select
+
+        readable, _, _ = select.select([self.stream], [], [], timeout)
+        if not readable:
+            return None
+        # os.read, not stream.read: a buffered read would swallow the rest of
+        # an escape sequence where select() can't see it
+        data = os.read(self.stream.fileno(), 64).decode("utf-8", errors="ignore")
+        if not data:
+            raise EOFError
+        self._pending.extend(decode_keys(data))
+        return self._pending.pop(0) if self._pending else None
+
+
+class KeyLatency:
+    """Measures keypress-to-redraw latency against the Phase 2 budget.
+
+    Call key_pressed() when a key is read and rendered() once the frame
+    it triggers has been drawn. If the screen waits on something else
+    first (a timed pause, a typed line), call discard() instead: the time
+    isn't redraw latency.
+    """
+
+    def __init__(
+        self,
+        budget: float = KEY_LATENCY_BUDGET,
+        hook: Optional[Callable[[str, float], None]] = None,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """Create a meter.
+
+        Args:
+            budget: Seconds allowed from keypress to finished redraw
+            hook: Called with (key, seconds) for every measurement
+            clock: Time source
+        """
+        self.budget = budget
+        self.hook = hook
+        self._clock = clock
+        self._pressed: Optional[Tuple[str, float]] = None
+        self.samples: List[float] = []
+        self.discarded = 0
+
+    def key_pressed(self, key: str):
+        self._pressed = (key, self._clock())
+
+    def discard(self):
+        """Drop the outstanding keypress without recording it."""
+        if self._pressed is not None:
+            self._pressed = None
+            self.discarded += 1
+
+    def rendered(self):
+        """Record the latency of the last keypress, if one is outstanding."""
+        if self._pressed is None:
+            return
+        key, pressed_at = self._pressed
+        self._pressed = None
+        latency = self._clock() - pressed_at
+        self.samples.append(latency)
+        if self.hook is not None:
+            self.hook(key, latency)
+
+    def summary(self) -> dict:
+        """Latency statistics.
+
+        Returns:
+            Dict with count, p50_ms, p95_ms, max_ms, over_budget and discarded
+        """
+        if not self.samples:
+            return {
+                "count": 0, "p50_ms": None, "p95_ms": None, "max_ms": None,
+                "over_budget": 0, "discarded": self.discarded,
+            }
+        ordered = sorted(self.samples)
+
+        def percentile(pct):
+            return round(ordered[max(int(len(ordered) * pct / 100 + 0.999999) - 1, 0)] * 1000, 1)
+
+        return {
+            "count": len(ordered),
+            "p50_ms": percentile(50),
+            "p95_ms": percentile(95),
+            "max_ms": round(ordered[-1] * 1000, 1),
+            "over_budget": sum(1 for sample in ordered if sample > self.budget),
+            "discarded": self.discarded,
+        }
+
+
+class NumpadInput:
+    """Menu choices from single keypresses (Phase 2: numpad primary).
+
+    A digit that can't start a longer valid number is dispatched at once;
+    otherwise digits collect until Enter. "." means back/cancel. Without a
+    terminal it falls back to reading whole lines.
+    """
+
+    def __init__(self, stream=None, latency: Optional[KeyLatency] = None):
+        """Create the reader.
+
+        Args:
+            stream: Input stream (defaults to stdin)
+            latency: Optional meter for keypress-to-redraw latency
+        """
+        self.stream = stream
+        self.latency = latency
+
+    @property
+    def available(self) -> bool:
+        """Whether single keypresses can be read (stdin is a POSIX terminal)."""
+        try:
+            import termios  # noqa: F401
+
+            return os.isatty((self.stream or sys.stdin).fileno())
+        except (ImportError, OSError, ValueError, AttributeError):
+            return False
+
+    def choose(
+        self,
+        choices: Sequence[str],
+        max_number: int = 0,
+        back: Optional[str] = None,
+        echo: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Read one menu choice.
+
+        Args:
+            choices: Accepted non-numeric keys (e.g. "c", "b", "enter")
+            max_number: Highest accepted number (0 for none)
+            back: Choice returned for "." (and Esc)
+            echo: Called with each accepted character, to show typing
+
+        Returns:
+            The choice: a key from choices, a number as a string, or back
+        """
+        if self.latency is not None:
+            # The screen is drawn and waiting: the previous key's redraw is done
+            self.latency.rendered()
+
+        digits = ""
+        with KeyPoller(self.stream) as keys:
+            while True:
+                key = keys.read_key()
+                if key is None:
+                    continue
+                key = key.lower()
+
+                if not keys.raw:
+                    # Line fallback: the whole line is the answer, for the caller to check
+                    if key == "." and back is not None:
+                        key = back
+                    return self._chosen(key)
+
+                if key.isdigit() and max_number and (digits or key != "0"):
+                    candidate = digits + key
+                    if int(candidate) > max_number:
+                        continue
+                    digits = candidate
+                    if echo:
+                        echo(key)
+                    if int(digits) * 10 > max_number:
+                        return self._chosen(digits)
+                elif key == "enter" and digits:
+                    return self._chosen(digits)
+                elif key == "backspace" and digits:
+                    digits = digits[:-1]
+                elif key in (".", "esc") and back is not None:
+                    return self._chosen(back)
+                elif key in choices:
+                    return self._chosen(key)
+
+    def _chosen(self, choice: str) -> str:
+        if self.latency is not None:
+            self.latency.key_pressed(choice)
+        return choice
+
+
+def _drain(fd: int):
+    """Empty a non-blocking pipe."""
+    import os
+
+    try:
+        while os.read(fd, 512):
+            pass
+    except (BlockingIOError, OSError):
+        pass
@@ -0,0 +1,120 @@
+"""Pre-rendered static screen fragments, keyed by terminal size and display mode."""
+
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+
+# Display size modes from the technical requirements, smallest first
+DISPLAY_MODES = ("tiny", "small", "medium", "large")
+
+# Narrowest terminal (in columns) for each mode above tiny. A 480x320
+# panel shows ~60 columns, 800x600 ~100, 1024x768 ~128, 1920x1080 ~240.
+MODE_MIN_WIDTHS = (("large", 160), ("medium", 110), ("small", 80))
+
+
+def display_mode_for(width: int) -> str:
+    """Pick the display mode for a terminal width.
+
+    Args:
+        width: Terminal width in columns
+
+    Returns:
+        "tiny", "small", "medium" or "large"
+    """
+    for mode, min_width in MODE_MIN_WIDTHS:
+        if width >= min_width:
+            return mode
+    return "tiny"
+
+
+class Prerendered:
+    """Lines rendered once at a fixed width, replayed without layout work."""
+
+    def __init__(self, lines: List[List[Segment]], width: int):
+        self.lines = lines
+        self.width = width
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        new_line = Segment.line()
+        for line in self.lines:
+            yield from line
+            yield new_line
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement(self.width, self.width)
+
+
+class RenderCache:
+    """Cache of static screen fragments (titles, menus, ASCII art).
+
+    Each fragment is built and laid out once per terminal size and display
+    mode, then replayed from its rendered lines. Screens compose cached
+    fragments with freshly built dynamic regions (mood, quests), so only
+    the parts that can change are laid out on each redraw.
+    """
+
+    def __init__(self, mode: Optional[str] = None, max_entries: int = 64):
+        """Create a cache.
+
+        Args:
+            mode: Display mode to force, or None to pick one from the
+                terminal width
+            max_entries: Fragments kept before the least recently used is
+                dropped (old terminal sizes after a resize)
+        """
+        if mode is not None and mode not in DISPLAY_MODES:
+            raise ValueError(f"Unknown display mode: {mode}")
+        self.mode = mode
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int, int, str], Prerendered]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def display_mode(self, console: Console) -> str:
+        """Get the display mode for a console.
+
+        Args:
+            console: Console being drawn to
+
+        Returns:
+            The forced mode, or the one matching the console's width
+        """
+        return self.mode or display_mode_for(console.width)
+
+    def get(self, console: Console, name: str, build: Callable[[str], RenderableType]) -> Prerendered:
+        """Get a fragment, building and rendering it on first use.
+
+        Args:
+            console: Console the fragment will be printed to
+            name: Fragment name, unique per screen
+            build: Builds the fragment's renderable for a display mode
+
+        Returns:
+            Renderable replaying the fragment's rendered lines
+        """
+        mode = self.display_mode(console)
+        key = (name, console.width, console.height, mode)
+        fragment = self._entries.get(key)
+        if fragment is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return fragment
+
+        self.misses += 1
+        options = console.options.update(width=console.width)
+        lines = console.render_lines(build(mode), options, pad=False)
+        fragment = Prerendered(lines, console.width)
+        self._entries[key] = fragment
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return fragment
+
+    def clear(self):
+        """Drop every fragment (e.g. after changing the display mode)."""
+        self._entries.clear()
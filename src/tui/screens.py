@@ -1,19 +1,98 @@
 """TUI screens for MOOdBBS using Rich."""
 
+import threading
 import time
 from typing import Optional, List, Dict, Any
-from rich.console import Console
+from rich.console import Group
 from rich.panel import Panel
 from rich.text import Text
-from rich.layout import Layout
 from rich.align import Align
 from rich.table import Table
 from rich import box
 
-from src.services.zipcode_validator import ZipcodeValidator
+from src.tui.diff_render import DiffConsole
+from src.tui.keys import NumpadInput
+from src.tui.render_cache import RenderCache
+
+# Subsystems a session may never touch (LLM parsing, YAML templates, zipcode
+# validation) are imported where they're first used, to keep startup fast
+
+console = DiffConsole()
+render_cache = RenderCache()
+# Set by the app to answer menus with single keypresses (None: type + Enter)
+numpad: Optional[NumpadInput] = None
+_zipcode_validator = None
+
+
+def pause(seconds: float):
+    """Show what's been printed so far, then wait."""
+    if numpad is not None and numpad.latency is not None:
+        # The next screen waits on the clock, not on redrawing
+        numpad.latency.discard()
+    console.flush_frame()
+    time.sleep(seconds)
+
+
+def print_title(title: str, style: str = "cyan bold"):
+    """Print a centered screen title between blank lines (cached)."""
+    console.print(render_cache.get(
+        console, f"title:{style}:{title}",
+        lambda mode: Group(Text(), Align.center(Text(title, style=style)), Text())
+    ))
+
+
+def choose(
+    prompt: str,
+    choices: List[str],
+    max_number: int = 0,
+    back: Optional[str] = None,
+    text_keys: str = ""
+) -> str:
+    """Prompt for a menu choice.
+
+    In numpad mode a single keypress answers (numbers above 9 need Enter);
+    otherwise the user types a line. Either way the answer comes back as
+    the line would have: stripped, lowercase, "" for Enter.
+
+    Args:
+        prompt: Prompt markup
+        choices: Accepted non-numeric keys ("" for Enter)
+        max_number: Highest accepted number (0 for none)
+        back: Choice that "." stands for
+        text_keys: Keys that start a typed command (e.g. "/" for a search);
+            the rest of it is read as a line
+
+    Returns:
+        The choice
+    """
+    if numpad is None or not numpad.available:
+        return console.input(prompt).strip().lower()
+
+    console.print(prompt, end="")
+    console.flush_frame()
+
+    def echo(key: str):
+        console.print(key, end="", markup=False)
+        console.flush_frame()
 
-console = Console()
-zipcode_validator = ZipcodeValidator()
+    keys = ["enter" if choice == "" else choice for choice in choices] + list(text_keys)
+    choice = numpad.choose(keys, max_number=max_number, back=back, echo=echo)
+    if choice in text_keys:
+        if numpad.latency is not None:
+            numpad.latency.discard()  # What follows is typing, not a redraw
+        echo(choice)
+        return (choice + console.input("")).strip().lower()
+    console.print()
+    return "" if choice == "enter" else choice
+
+
+def get_zipcode_validator():
+    """Get the shared zipcode validator, created on first use."""
+    global _zipcode_validator
+    if _zipcode_validator is None:
+        from src.services.zipcode_validator import ZipcodeValidator
+        _zipcode_validator = ZipcodeValidator()
+    return _zipcode_validator
 
 
 class BootScreen:
@@ -38,16 +117,16 @@ class BootScreen:
 
         # Connecting animation
         console.print(Align.center("Connecting to MOOdBBS...", style="yellow"))
-        time.sleep(0.5)
+        pause(0.5)
 
         console.print(Align.center("CONNECT 2400", style="green bold"))
-        time.sleep(0.8)
+        pause(0.8)
 
         console.print()
         console.print(Align.center("Welcome to MOOdBBS", style="cyan bold"))
         console.print(Align.center("Your mood. Your quests. Your world.", style="dim"))
         console.print()
-        time.sleep(1)
+        pause(1)
 
 
 class MainMenuScreen:
@@ -59,46 +138,61 @@ class MainMenuScreen:
         ("3", "QuickLog", "Log a mood-affecting event"),
         ("4", "Settings", "Configure MOOdBBS"),
         ("5", "About", "About this system"),
+        ("d", "Dashboard", "Live mood and quest display"),
         ("q", "Quit", "Exit MOOdBBS"),
     ]
 
     def show(self):
         """Display main menu."""
         console.clear()
+        console.print(render_cache.get(console, "main_menu", self.build))
 
-        # Title
-        title = Text("MOOdBBS Main Menu", style="cyan bold")
-        console.print()
-        console.print(Align.center(title))
-        console.print()
+    def build(self, mode: str) -> Group:
+        """Build the menu for a display mode.
+
+        Args:
+            mode: "tiny" drops the descriptions and padding; "small" keeps
+                descriptions but tightens padding
 
-        # Menu box
-        menu_table = Table.grid(padding=(0, 2))
+        Returns:
+            Title and menu panel
+        """
+        compact = mode in ("tiny", "small")
+        menu_table = Table.grid(padding=(0, 1 if compact else 2))
         menu_table.add_column(style="yellow", justify="right")
         menu_table.add_column(style="cyan bold")
-        menu_table.add_column(style="dim")
+        if mode != "tiny":
+            menu_table.add_column(style="dim")
 
         for key, name, desc in self.MENU_OPTIONS:
-            menu_table.add_row(f"  {key}  ", name, desc)
+            if mode == "tiny":
+                menu_table.add_row(f" {key} ", name)
+            else:
+                menu_table.add_row(f"  {key}  ", name, desc)
 
         panel = Panel(
             Align.center(menu_table),
             box=box.DOUBLE,
             border_style="cyan",
-            padding=(1, 2)
+            padding=(0, 1) if compact else (1, 2)
         )
 
-        console.print(Align.center(panel))
-        console.print()
+        return Group(
+            Text(),
+            Align.center(Text("MOOdBBS Main Menu", style="cyan bold")),
+            Text(),
+            Align.center(panel),
+            Text()
+        )
 
     def get_choice(self) -> str:
         """Get user menu choice."""
         while True:
-            choice = console.input("[yellow]Select option (1-5, q=quit):[/yellow] ").strip().lower()
             valid_choices = [opt[0] for opt in self.MENU_OPTIONS]
+            choice = choose("[yellow]Select option (1-5, d=dashboard, q=quit):[/yellow] ", valid_choices)
             if choice in valid_choices:
                 return choice
-            console.print("[red]Invalid choice. Please enter 1-5 or q.[/red]")
+            console.print("[red]Invalid choice. Please enter 1-5, d or q.[/red]")
 
 
 class MoodStatsScreen:
@@ -112,18 +206,15 @@ class MoodStatsScreen:
         console.clear()
 
         # Title
-        console.print()
-        console.print(Align.center(Text("MoodStats", style="cyan bold")))
-        console.print()
+        print_title("MoodStats")
 
-        # Get current mood (MoodState object)
-        mood_state = self.engine.get_current_mood()
+        snapshot = self.engine.get_dashboard_snapshot()
 
         # Mood display with border
         from rich.panel import Panel
         mood_text = Text()
-        mood_text.append(f"{mood_state.face} ", style="yellow bold")
-        mood_text.append(f"{mood_state.score:+d}", style="cyan bold")
+        mood_text.append(f"{snapshot.mood_face} ", style="yellow bold")
+        mood_text.append(f"{snapshot.mood_score:+d}", style="cyan bold")
 
         mood_panel = Panel(
             Align.center(mood_text),
@@ -135,47 +226,182 @@ class MoodStatsScreen:
         console.print()
 
         # Active traits
-        if mood_state.active_traits:
+        if snapshot.traits:
             console.print("[cyan bold]Active Traits:[/cyan bold]")
-            for trait in mood_state.active_traits:
+            for trait in snapshot.traits:
                 mod_style = "green" if trait.mood_modifier >= 0 else "red"
-                console.print(f"  [{mod_style}]{trait.mood_modifier:+d}[/{mod_style}] {trait.trait_name}")
+                console.print(f"  [{mod_style}]{trait.mood_modifier:+d}[/{mod_style}] {trait.name}")
                 console.print(f"      [dim]{trait.description}[/dim]")
             console.print()
 
-        # Combine moodlets and mood events into one list
-        active_moodlets = self.engine.get_active_moodlets()
-
-        if active_moodlets or mood_state.active_events:
+        # Moodlets and mood events in one list
+        if snapshot.modifiers:
             console.print("[cyan bold]Active Mood Modifiers:[/cyan bold]")
-
-            # Show moodlets
-            for moodlet in active_moodlets:
-                mod_style = "green" if moodlet['mood_value'] >= 0 else "red"
-                backoff_indicator = " (backoff)" if moodlet['is_in_backoff'] else ""
-                console.print(f"  [{mod_style}]{moodlet['mood_value']:+d}[/{mod_style}] {moodlet['name']}{backoff_indicator}")
-                console.print(f"      [dim]{moodlet['description']}[/dim]")
-
-            # Show mood events
-            for event in mood_state.active_events:
-                mod_style = "green" if event.modifier >= 0 else "red"
-                # Use description as title if event_type is generic (custom, ate_without_table, etc.)
-                # Otherwise use event_type
-                if event.event_type in ['custom'] or '_' in event.event_type:
-                    title = event.description
-                    show_description = False
-                else:
-                    title = event.event_type
-                    show_description = True
-
-                console.print(f"  [{mod_style}]{event.modifier:+d}[/{mod_style}] {title}")
-                if show_description and event.description:
-                    console.print(f"      [dim]{event.description}[/dim]")
+            for modifier in snapshot.modifiers:
+                mod_style = "green" if modifier.value >= 0 else "red"
+                backoff_indicator = " (backoff)" if modifier.is_in_backoff else ""
+                console.print(f"  [{mod_style}]{modifier.value:+d}[/{mod_style}] {modifier.title}{backoff_indicator}")
+                if modifier.description:
+                    console.print(f"      [dim]{modifier.description}[/dim]")
         else:
             console.print("[dim]No active mood modifiers[/dim]")
 
         console.print()
-        console.input("[yellow]Press Enter to return to menu...[/yellow]")
+        choose("[yellow]Press Enter to return to menu...[/yellow]", [""], back="")
+
+
+class LiveDashboardScreen:
+    """Always-current mood and quest display.
+
+    Redraws only when the engine's state changes or the snapshot's
+    valid_until passes (a modifier expiring, the day rolling over), and
+    otherwise sleeps in select(), so it costs nothing while idle.
+    """
+
+    EXIT_KEYS = ("q", "b", "\x1b", "\n", "\r")
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.redraws = 0
+
+    def show(self):
+        """Run the dashboard until the user presses q, b, Esc or Enter."""
+        from rich.live import Live
+        from src.tui.keys import KeyPoller
+
+        console.clear()
+        wake = _WakePipe()
+        self.engine.add_change_listener(wake.signal)
+        try:
+            with KeyPoller() as keys:
+                if console.minimal_redraw:
+                    self.run(keys, _DiffLive(), wake.fd)
+                    return
+                # auto_refresh off: Live would otherwise repaint 4x a second
+                with Live(console=console, auto_refresh=False) as live:
+                    self.run(keys, live, wake.fd)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.engine.remove_change_listener(wake.signal)
+            wake.close()
+
+    def run(self, keys, live, wake_fd: Optional[int] = None):
+        """Redraw loop.
+
+        Args:
+            keys: KeyPoller (or anything with poll(timeout, wake_fd))
+            live: rich Live display to update
+            wake_fd: Pipe that wakes the loop when the engine changes
+        """
+        from datetime import datetime, timezone
+
+        shown = None
+        while True:
+            snapshot = self.engine.get_dashboard_snapshot()
+            if snapshot is not shown:
+                live.update(self.render(snapshot), refresh=True)
+                if shown is None:
+                    console.flush_frame()  # First frame is up (closes the key latency sample)
+                self.redraws += 1
+                shown = snapshot
+
+            # Sleep until the snapshot goes stale, a key arrives or the engine changes
+            wait = (snapshot.valid_until - datetime.now(timezone.utc)).total_seconds()
+            key = keys.poll(max(wait, 0.0) + 0.01, wake_fd=wake_fd)
+            if key is not None and key.lower() in self.EXIT_KEYS:
+                return
+
+    @staticmethod
+    def render(snapshot):
+        """Build the dashboard renderable for a snapshot."""
+        from rich.console import Group
+
+        mood_text = Text()
+        mood_text.append(f"{snapshot.mood_face} ", style="yellow bold")
+        mood_text.append(f"{snapshot.mood_score:+d}", style="cyan bold")
+        mood_panel = Panel(Align.center(mood_text), title="Current Mood", border_style="cyan", padding=(0, 2))
+
+        modifiers = Table(box=None, show_header=False, padding=(0, 1))
+        modifiers.add_column(justify="right")
+        modifiers.add_column()
+        modifiers.add_column(style="dim")
+        for trait in snapshot.traits:
+            style = "green" if trait.mood_modifier >= 0 else "red"
+            modifiers.add_row(f"[{style}]{trait.mood_modifier:+d}[/{style}]", trait.name, "trait")
+        for modifier in snapshot.modifiers:
+            style = "green" if modifier.value >= 0 else "red"
+            # Absolute times, so the screen doesn't need a redraw every minute
+            until = f"until {modifier.expires_at.astimezone():%a %H:%M}" if modifier.expires_at else ""
+            if modifier.is_in_backoff:
+                until = f"backoff {until}".strip()
+            modifiers.add_row(f"[{style}]{modifier.value:+d}[/{style}]", modifier.title, until)
+        if not snapshot.traits and not snapshot.modifiers:
+            modifiers.add_row("", "[dim]No active mood modifiers[/dim]", "")
+
+        quests = Table(box=None, show_header=False, padding=(0, 1))
+        quests.add_column(justify="right", style="dim")
+        quests.add_column()
+        quests.add_column(justify="right")
+        for quest in snapshot.active_quests:
+            xp_style = "yellow" if quest.xp_reward <= 10 else "green" if quest.xp_reward <= 20 else "red"
+            quests.add_row(f"[{quest.id}]", quest.title, f"[{xp_style}]{quest.xp_reward} XP[/{xp_style}]")
+        if not snapshot.active_quests:
+            quests.add_row("", "[dim]No active quests[/dim]", "")
+
+        footer = Text(
+            f"Total XP: {snapshot.total_xp}  ·  Quests completed: {snapshot.quests_completed}  ·  "
+            f"Updated {snapshot.built_at.astimezone():%H:%M}  ·  q to return",
+            style="dim"
+        )
+
+        return Group(
+            Align.center(Text("MOOdBBS Dashboard", style="cyan bold")),
+            Text(),
+            Align.center(mood_panel),
+            Panel(modifiers, title="Mood Modifiers", border_style="cyan", box=box.ROUNDED),
+            Panel(quests, title="Active Quests", border_style="cyan", box=box.ROUNDED),
+            Align.center(footer)
+        )
+
+
+class _DiffLive:
+    """Stands in for rich Live, drawing each update as a diff of the last."""
+
+    def update(self, renderable, refresh: bool = False):
+        console.draw(renderable)
+
+
+class _WakePipe:
+    """Self-pipe that wakes a select() from any thread."""
+
+    def __init__(self):
+        import os
+
+        try:
+            self.fd, self._write_fd = os.pipe()
+            os.set_blocking(self.fd, False)
+            os.set_blocking(self._write_fd, False)
+        except (AttributeError, OSError):
+            self.fd = self._write_fd = None
+
+    def signal(self):
+        import os
+
+        if self._write_fd is None:
+            return
+        try:
+            os.write(self._write_fd, b"x")
+        except OSError:
+            pass  # Pipe full: the reader is going to wake anyway
+
+    def close(self):
+        import os
+
+        for fd in (self.fd, self._write_fd):
+            if fd is not None:
+                os.close(fd)
+        self.fd = self._write_fd = None
 
 
 class WanderMOOScreen:
@@ -183,6 +409,39 @@ class WanderMOOScreen:
 
     def __init__(self, engine):
         self.engine = engine
+        self._llm_parser = None
+        self._llm_parser_lock = threading.Lock()
+
+    def _get_llm_parser(self):
+        """Get the smart-mode parser, created once with a persistent parse cache."""
+        with self._llm_parser_lock:
+            if self._llm_parser is None:
+                from src.services.llm_quest_parser import LLMQuestParser
+                from src.services.parse_cache import ParseCache
+                from src.services.rule_quest_parser import RuleQuestParser
+                self._llm_parser = LLMQuestParser(
+                    cache=ParseCache(),
+                    stream=True,
+                    rule_parser=RuleQuestParser(),
+                    call_recorder=self.engine.db.record_llm_call
+                )
+            return self._llm_parser
+
+    def warm_up_llm(self) -> threading.Thread:
+        """Start loading the smart-mode model in the background.
+
+        The parser (and requests with it) is imported on the worker thread,
+        so this returns immediately. Also primes the parser's availability
+        check, so opening quest creation later doesn't wait on a probe.
+
+        Returns:
+            The started thread
+        """
+        thread = threading.Thread(
+            target=lambda: self._get_llm_parser().warm_up(), name="llm-warm-up", daemon=True
+        )
+        thread.start()
+        return thread
 
     def show(self):
         """Display quest list and management options."""
@@ -190,12 +449,9 @@ class WanderMOOScreen:
             console.clear()
 
             # Title
-            console.print()
-            console.print(Align.center(Text("WanderMOO - Quest System", style="cyan bold")))
-            console.print()
+            print_title("WanderMOO - Quest System")
 
-            # Get active quests
-            quests = self.engine.get_active_quests()
+            quests = self.engine.get_dashboard_snapshot().active_quests
 
             if not quests:
                 console.print("[dim]No active quests. Create one to get started![/dim]")
@@ -208,7 +464,7 @@ class WanderMOOScreen:
                     console.print(f"      [dim]{quest.description}[/dim]")
 
                     # Show category, renewal, and constraint info
-                    renewal_info = quest.renewal_policy.renewal_type if quest.renewal_policy else "one-time"
+                    renewal_info = quest.renewal_type or "one-time"
                     info_parts = [quest.category.title(), renewal_info]
 
                     if quest.constraint_note:
@@ -220,6 +476,7 @@ class WanderMOOScreen:
             # Options
             console.print("[yellow]Options:[/yellow]")
             console.print("  [cyan bold]c[/cyan bold] - Create new quest")
+            console.print("  [cyan bold]g[/cyan bold] - Get quest suggestions")
             console.print("  [cyan bold]x[/cyan bold] - Complete quest")
             console.print("  [cyan bold]s[/cyan bold] - Snooze quest")
             console.print("  [cyan bold]h[/cyan bold] - View history")
@@ -227,12 +484,14 @@ class WanderMOOScreen:
             console.print("  [cyan bold]b[/cyan bold] - Back to menu")
             console.print()
 
-            choice = console.input("[yellow]Enter choice (c/x/s/h/m/b):[/yellow] ").strip().lower()
+            choice = choose("[yellow]Enter choice (c/g/x/s/h/m/b):[/yellow] ", list("cgxshmb"), back="b")
 
             if choice == 'b':
                 break
             elif choice == 'c':
                 self._create_quest()
+            elif choice == 'g':
+                self._suggest_quests()
             elif choice == 'x':
                 self._complete_quest(quests)
             elif choice == 's':
@@ -248,20 +507,20 @@ class WanderMOOScreen:
         console.print("[cyan bold]Create New Quest[/cyan bold]")
         console.print()
 
-        # Check if LLM is available
-        from src.services.llm_quest_parser import LLMQuestParser
-        llm_parser = LLMQuestParser()
+        # Smart mode works offline for common phrasings via the rule-based fast path
+        llm_parser = self._get_llm_parser()
         llm_available = llm_parser.is_available()
 
+        console.print("[cyan bold]Mode:[/cyan bold]")
         if llm_available:
-            console.print("[cyan bold]Mode:[/cyan bold]")
             console.print("  [cyan bold]1[/cyan bold]. Smart mode (describe in your own words)")
-            console.print("  [cyan bold]2[/cyan bold]. Manual mode (step-by-step)")
-            mode_choice = console.input("[yellow]Select mode (1-2):[/yellow] ").strip()
+        else:
+            console.print("  [cyan bold]1[/cyan bold]. Smart mode [dim](LLM offline: common phrasings only)[/dim]")
+        console.print("  [cyan bold]2[/cyan bold]. Manual mode (step-by-step)")
+        mode_choice = console.input("[yellow]Select mode (1-2):[/yellow] ").strip()
 
-            if mode_choice == '1':
-                self._create_quest_smart(llm_parser)
-                return
+        if mode_choice == '1' and self._create_quest_smart(llm_parser):
+            return
 
         # Fall through to manual mode
         console.print()
@@ -271,7 +530,9 @@ class WanderMOOScreen:
         title = console.input("Title: ").strip()
         if not title:
             console.print("[red]Cancelled[/red]")
-            time.sleep(1)
+            pause(1)
+            return
+        if not self._confirm_not_duplicate(title):
             return
 
         description = console.input("Description: ").strip()
@@ -288,7 +549,7 @@ class WanderMOOScreen:
             category = categories[int(cat_choice) - 1]
         except (ValueError, IndexError):
             console.print("[red]Invalid category[/red]")
-            time.sleep(1)
+            pause(1)
             return
 
         # Difficulty selection
@@ -383,10 +644,14 @@ class WanderMOOScreen:
         renewal_msg = f" ({renewal_policy.renewal_type})" if renewal_policy else " (one-time)"
         constraint_msg = f" [{constraint_note}]" if constraint_note else ""
         console.print(f"[green]Quest created! [{quest.id}] {quest.title}{renewal_msg}{constraint_msg}[/green]")
-        time.sleep(1.5)
+        pause(1.5)
+
+    def _create_quest_smart(self, llm_parser) -> bool:
+        """Create quest using LLM parsing.
 
-    def _create_quest_smart(self, llm_parser):
-        """Create quest using LLM parsing."""
+        Returns:
+            False if parsing failed and the caller should fall back to manual mode
+        """
         console.print()
         console.print("[cyan bold]Smart Quest Creation[/cyan bold]")
         console.print("[dim]Describe your quest in natural language...[/dim]")
@@ -395,30 +660,35 @@ class WanderMOOScreen:
         user_input = console.input("[yellow]Quest:[/yellow] ").strip()
         if not user_input:
             console.print("[red]Cancelled[/red]")
-            time.sleep(1)
-            return
-
-        console.print()
-        console.print("[yellow]Parsing with LLM...[/yellow]")
+            pause(1)
+            return True
 
         # Get user profile for context
-        user_profile = self.engine.db.get_user_profile()
+        user_profile = self.engine.get_user_profile()
         user_context = user_profile.get_context_for_llm()
 
-        quest_data = llm_parser.parse_quest(user_input, user_context)
+        # Parse in the background while the user fills in optional details
+        from src.services.background_parse import ParseJob, merge_quest_fields
+        job = ParseJob(llm_parser, user_input, user_context)
+
+        # Fast-path and cached parses finish immediately; don't ask for details then
+        manual_fields = {} if job.wait(0.05) else self._ask_optional_quest_fields(job)
+        quest_data = merge_quest_fields(self._wait_for_parse(job), manual_fields)
 
         if not quest_data:
-            console.print("[red]Could not parse quest. Falling back to manual mode.[/red]")
-            time.sleep(2)
-            return
+            if job.cancelled:
+                console.print("[yellow]Parse cancelled. Switching to manual mode.[/yellow]")
+            else:
+                console.print("[red]Could not parse quest. Falling back to manual mode.[/red]")
+            pause(1)
+            return False
 
-        # Apply user profile adjustments to XP
+        # Apply user profile adjustments to XP (unless the user set it by hand)
         base_xp = quest_data['xp_reward']
         adjusted_xp = base_xp
         xp_notes = []
 
-        user_profile = self.engine.db.get_user_profile()
-        if user_profile.memberships:
+        if user_profile.memberships and 'xp_reward' not in manual_fields:
             # Check if quest location matches any membership
             quest_title = quest_data['title'].lower()
             for membership in user_profile.memberships:
@@ -455,7 +725,7 @@ class WanderMOOScreen:
         console.print()
 
         # Ask about renewal frequency if the LLM suggested one
-        if renewal_type:
+        if renewal_type and 'renewal_type' not in manual_fields:
             console.print("[yellow]How often would you like to do this?[/yellow]")
             console.print(f"  [cyan bold]1[/cyan bold]. One-time only")
             console.print(f"  [cyan bold]2[/cyan bold]. Daily")
@@ -496,8 +766,8 @@ class WanderMOOScreen:
 
             if confirm == 'n':
                 console.print("[dim]Cancelled[/dim]")
-                time.sleep(1)
-                return
+                pause(1)
+                return True
             elif confirm == 'e':
                 # Edit mode
                 console.print()
@@ -549,40 +819,159 @@ class WanderMOOScreen:
             elif confirm == 'y':
                 break
 
-        # Convert renewal_type to RenewalPolicy
-        renewal_policy = None
-        if renewal_type:
-            from src.domain.quests import RenewalPolicy
-            cooldown_map = {
-                "daily": 1,
-                "weekly": 7,
-                "monthly": 30,
-                "seasonal": 90
-            }
-            cooldown_days = cooldown_map.get(renewal_type, 7)
-            renewal_policy = RenewalPolicy(renewal_type=renewal_type, cooldown_days=cooldown_days)
+        if not self._confirm_not_duplicate(quest_data['title']):
+            return True
 
         # Create quest
-        quest = self.engine.create_quest(
-            title=quest_data['title'],
-            description=quest_data.get('description', ''),
-            category=quest_data['category'],
-            difficulty="easy" if quest_data['xp_reward'] <= 10 else "medium" if quest_data['xp_reward'] <= 20 else "hard",
-            xp_reward=quest_data['xp_reward'],
-            renewal_policy=renewal_policy,
-            constraint_type=quest_data.get('constraint_type'),
-            constraint_note=quest_data.get('constraint_note')
-        )
+        quest = self.engine.create_quest_from_parsed(quest_data)
 
         console.print()
         console.print(f"[green]✓ Quest created! [{quest.id}] {quest.title}[/green]")
-        time.sleep(1.5)
+        pause(1.5)
+        return True
+
+    def _confirm_not_duplicate(self, title: str) -> bool:
+        """Warn about existing quests with a similar title.
+
+        Returns:
+            True to go ahead and create the quest
+        """
+        matches = self.engine.find_duplicate_quests(title)
+        if not matches:
+            return True
+
+        console.print()
+        console.print("[yellow bold]This looks like a quest you already have:[/yellow bold]")
+        for match in matches[:3]:
+            where = f" @ {match.location}" if match.location else ""
+            status = match.status if match.kind == "quest" else "template"
+            console.print(f"  • {match.title}{where} [dim]({status})[/dim]")
+
+        confirm = console.input("[yellow]Create it anyway? (y/n):[/yellow] ").strip().lower()
+        if confirm != 'y':
+            console.print("[dim]Quest not created[/dim]")
+            pause(1)
+            return False
+        return True
+
+    def _ask_optional_quest_fields(self, job) -> Dict[str, Any]:
+        """Collect fields the user wants to set by hand while a parse runs.
+
+        Args:
+            job: The in-flight ParseJob (only used to report progress)
+
+        Returns:
+            Fields the user filled in; anything skipped is left to the parser
+        """
+        console.print()
+        console.print("[dim]Parsing in the background. Fill in any details you already know, or press Enter to let the LLM decide.[/dim]")
+        console.print()
+
+        manual = {}
+
+        categories = ["social", "constitutional", "creative", "experiential"]
+        cat_choice = console.input("[yellow]Category (1=social 2=constitutional 3=creative 4=experiential):[/yellow] ").strip()
+        if cat_choice in ("1", "2", "3", "4"):
+            manual['category'] = categories[int(cat_choice) - 1]
+
+        diff_choice = console.input("[yellow]Difficulty (1=easy 2=medium 3=hard 4=extreme):[/yellow] ").strip()
+        difficulty_map = {"1": 10, "2": 20, "3": 30, "4": 45}
+        if diff_choice in difficulty_map:
+            manual['xp_reward'] = difficulty_map[diff_choice]
+
+        renewal_choice = console.input("[yellow]Repeat (1=one-time 2=daily 3=weekly 4=monthly 5=seasonal):[/yellow] ").strip()
+        renewal_map = {"1": None, "2": "daily", "3": "weekly", "4": "monthly", "5": "seasonal"}
+        if renewal_choice in renewal_map:
+            manual['renewal_type'] = renewal_map[renewal_choice]
+
+        if job.done():
+            console.print(f"[dim]Parsed in {job.elapsed:.1f}s[/dim]")
+
+        return manual
+
+    def _wait_for_parse(self, job) -> Optional[Dict[str, Any]]:
+        """Show a spinner until the parse finishes or the user cancels.
+
+        Args:
+            job: The in-flight ParseJob
+
+        Returns:
+            Parsed quest data, or None if parsing failed or was cancelled
+        """
+        if not job.done():
+            from src.tui.keys import KeyPoller
+
+            console.print()
+            try:
+                with console.passthrough(), console.status("") as status, KeyPoller() as keys:
+                    while not job.done():
+                        status.update(self._parse_status_text(job))
+                        key = keys.poll(0.1)
+                        if key and key.lower() in ("c", "q", "\x1b"):
+                            job.cancel()
+            except KeyboardInterrupt:
+                job.cancel()
+
+        return job.result()
+
+    @staticmethod
+    def _parse_status_text(job) -> str:
+        """Spinner text: elapsed time plus whatever fields have streamed in."""
+        text = f"[yellow]Parsing with LLM... {job.elapsed:.1f}s[/yellow] [dim](c to cancel)[/dim]"
+        fields = dict(job.fields)
+        if 'title' in fields:
+            text += f"\n  Title: {fields['title']}"
+        if 'category' in fields:
+            text += f"\n  Category: {fields['category']}"
+        if 'xp_reward' in fields:
+            text += f"\n  XP Reward: {fields['xp_reward']}"
+        return text
+
+    def _suggest_quests(self):
+        """Show suggested quests from the template library."""
+        console.print()
+        suggestions = self.engine.suggest_quests(k=3)
+
+        if not suggestions:
+            console.print("[dim]No quest templates available to suggest[/dim]")
+            pause(1.5)
+            return
+
+        console.print("[cyan bold]Suggested Quests:[/cyan bold]")
+        for i, suggestion in enumerate(suggestions, 1):
+            template = suggestion.template
+            console.print(f"  [cyan bold]{i}[/cyan bold]. {template.title} [green]{template.base_xp} XP[/green]")
+            console.print(f"      [dim]{template.category.title()} | {template.difficulty}[/dim]")
+            for reason in suggestion.reasons:
+                console.print(f"      [dim italic]{reason}[/dim italic]")
+        console.print()
+
+        choice = console.input(f"[yellow]Accept a quest (1-{len(suggestions)}, Enter to skip):[/yellow] ").strip()
+        if not choice:
+            return
+
+        try:
+            idx = int(choice) - 1
+            if idx < 0 or idx >= len(suggestions):
+                raise ValueError
+        except ValueError:
+            console.print("[red]Invalid choice[/red]")
+            pause(1)
+            return
+
+        try:
+            quest = self.engine.create_quest_from_template(suggestions[idx].template.id)
+            console.print(f"[green]✓ Quest accepted! [{quest.id}] {quest.title}[/green]")
+            pause(1.5)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            pause(1.5)
 
     def _complete_quest(self, quests):
         """Complete a quest."""
         if not quests:
             console.print("[red]No active quests to complete[/red]")
-            time.sleep(1)
+            pause(1)
             return
 
         console.print()
@@ -591,7 +980,7 @@ class WanderMOOScreen:
             quest_id = int(quest_id)
         except ValueError:
             console.print("[red]Invalid ID[/red]")
-            time.sleep(1)
+            pause(1)
             return
 
         # Complete quest
@@ -605,16 +994,16 @@ class WanderMOOScreen:
             console.print("[cyan]Mood buffs applied:[/cyan]")
             for event_type, modifier in result.mood_buffs_applied:
                 console.print(f"  [green]{modifier:+d}[/green] {event_type}")
-            time.sleep(2)
+            pause(2)
         except ValueError as e:
             console.print(f"[red]{e}[/red]")
-            time.sleep(1)
+            pause(1)
 
     def _snooze_quest(self, quests):
         """Snooze a quest."""
         if not quests:
             console.print("[red]No active quests to snooze[/red]")
-            time.sleep(1)
+            pause(1)
             return
 
         console.print()
@@ -623,7 +1012,7 @@ class WanderMOOScreen:
             quest_id = int(quest_id)
         except ValueError:
             console.print("[red]Invalid ID[/red]")
-            time.sleep(1)
+            pause(1)
             return
 
         console.print()
@@ -650,43 +1039,51 @@ class WanderMOOScreen:
 
         self.engine.snooze_quest(quest_id, reason)
         console.print("[green]Quest snoozed[/green]")
-        time.sleep(1)
+        pause(1)
 
     def _show_history(self):
-        """Show completed quests."""
-        console.clear()
-        console.print()
-        console.print(Align.center(Text("Quest History", style="cyan bold")))
-        console.print()
+        """Show completed quests in a scrolling list."""
+        from src.tui.virtual_list import VirtualList
+
+        history = VirtualList(
+            lambda cursor, limit: self.engine.get_quest_history_page(limit=limit, cursor=cursor),
+            self._render_completion,
+            height=8,
+            matches=lambda completion, query: query.lower() in (completion['title'] or "").lower()
+        )
 
-        history = self.engine.get_quest_history()
+        while True:
+            console.clear()
+            print_title("Quest History")
+            console.print(history.render(empty="No completed quests yet"))
+            console.print()
 
-        if not history:
-            console.print("[dim]No completed quests yet[/dim]")
-        else:
-            for completion in history:
-                # Get the quest details
-                try:
-                    quest = self.engine.get_quest_by_id(completion.quest_id)
-                    console.print(f"[green]✓[/green] {quest.title} [{completion.xp_awarded} XP]")
-                    console.print(f"    [dim]{quest.description}[/dim]")
-                    if completion.notes:
-                        console.print(f"    [dim italic]Note: {completion.notes}[/dim italic]")
-                except ValueError:
-                    # Quest was deleted or not found
-                    console.print(f"[green]✓[/green] Quest #{completion.quest_id} [{completion.xp_awarded} XP]")
-                console.print()
+            choice = choose(
+                "[yellow]n/p page, g<N> jump, /text search, b back:[/yellow] ",
+                ["n", "p", "", "b"], back="b", text_keys="g/"
+            )
+            if choice == 'b' or (choice == '' and history.at_end):
+                return
+            history.navigate(choice)
 
-        console.print()
-        console.input("[yellow]Press Enter to continue...[/yellow]")
+    @staticmethod
+    def _render_completion(completion: Dict[str, Any]) -> Text:
+        """One history row: title, XP and notes."""
+        if completion['title'] is not None:
+            text = Text.from_markup(f"[green]✓[/green] {completion['title']} [{completion['xp_awarded']} XP]")
+        else:
+            # Quest was deleted or not found
+            text = Text.from_markup(f"[green]✓[/green] Quest #{completion['quest_id']} [{completion['xp_awarded']} XP]")
+        text.append(f"  {completion['completed_at'].astimezone():%Y-%m-%d}", style="dim")
+        if completion['notes']:
+            text.append(f"\n   Note: {completion['notes']}", style="dim italic")
+        return text
 
     def _manage_quests(self, quests):
         """Quest management submenu."""
         while True:
             console.clear()
-            console.print()
-            console.print(Align.center(Text("Quest Management", style="cyan bold")))
-            console.print()
+            print_title("Quest Management")
 
             console.print("[yellow]Management Options:[/yellow]")
             console.print("  [cyan bold]d[/cyan bold] - Delete a quest")
@@ -694,7 +1091,7 @@ class WanderMOOScreen:
             console.print("  [cyan bold]b[/cyan bold] - Back")
             console.print()
 
-            choice = console.input("[yellow]Enter choice (d/r/b):[/yellow] ").strip().lower()
+            choice = choose("[yellow]Enter choice (d/r/b):[/yellow] ", list("drb"), back="b")
 
             if choice == 'b':
                 break
@@ -708,7 +1105,7 @@ class WanderMOOScreen:
         """Delete a quest permanently."""
         if not quests:
             console.print("[red]No active quests to delete[/red]")
-            time.sleep(1)
+            pause(1)
             return
 
         console.print()
@@ -716,7 +1113,7 @@ class WanderMOOScreen:
 
         if not quest_id_input:
             console.print("[dim]Cancelled[/dim]")
-            time.sleep(1)
+            pause(1)
             return
 
         try:
@@ -729,15 +1126,7 @@ class WanderMOOScreen:
             confirm = console.input("[yellow]Are you sure? (y/n):[/yellow] ").strip().lower()
 
             if confirm == 'y':
-                # Remove from engine's internal state
-                if quest_id in self.engine.quest_manager._quests:
-                    del self.engine.quest_manager._quests[quest_id]
-
-                # Delete from database
-                with self.engine.db._get_connection() as conn:
-                    conn.execute("DELETE FROM quests WHERE id = ?", (quest_id,))
-                    conn.execute("DELETE FROM quest_completions WHERE quest_id = ?", (quest_id,))
-
+                self.engine.delete_quest(quest_id)
                 console.print("[green]✓ Quest deleted[/green]")
             else:
                 console.print("[dim]Cancelled[/dim]")
@@ -745,7 +1134,7 @@ class WanderMOOScreen:
         except (ValueError, KeyError):
             console.print("[red]Quest not found[/red]")
 
-        time.sleep(1)
+        pause(1)
 
     def _destroy_all_quests(self):
         """Destroy ALL quest data while keeping user profile."""
@@ -767,23 +1156,14 @@ class WanderMOOScreen:
 
         if confirm1 != 'DESTROY':
             console.print("[dim]Cancelled[/dim]")
-            time.sleep(1)
+            pause(1)
             return
 
-        # Clear all quest data
-        with self.engine.db._get_connection() as conn:
-            conn.execute("DELETE FROM quests")
-            conn.execute("DELETE FROM quest_completions")
-            conn.execute("DELETE FROM quest_completion_modifiers")
-            conn.execute("UPDATE user_stats SET total_xp = 0 WHERE id = 1")
-
-        # Clear engine state
-        self.engine.quest_manager._quests = {}
-        self.engine._completions = []
+        self.engine.destroy_quest_data()
 
         console.print()
         console.print("[green]✓ All quest data destroyed. Your profile has been preserved.[/green]")
-        time.sleep(2)
+        pause(2)
 
 
 class QuickLogScreen:
@@ -797,26 +1177,14 @@ class QuickLogScreen:
         while True:
             console.clear()
 
-            console.print()
-            console.print(Align.center(Text("QuickLog - Apply Moodlet", style="cyan bold")))
-            console.print()
-
-            # Get all event-based moodlets grouped by category
-            all_moodlets = self.engine.get_all_event_moodlets()
+            print_title("QuickLog - Apply Moodlet")
 
-            # Group by category
-            by_category = {}
-            for m in all_moodlets:
-                cat = m['category']
-                if cat not in by_category:
-                    by_category[cat] = []
-                by_category[cat].append(m)
+            # Categories and counts only; moodlets are paged in per category
+            categories = self.engine.get_event_moodlet_categories()
 
             # Display categories
             console.print("[cyan bold]Select Category:[/cyan bold]")
-            categories = sorted(by_category.keys())
-            for i, cat in enumerate(categories, 1):
-                count = len(by_category[cat])
+            for i, (cat, count) in enumerate(categories, 1):
                 console.print(f"  [cyan bold]{i}[/cyan bold]. {cat.title()} ({count} moodlets)")
 
             console.print()
@@ -824,7 +1192,7 @@ class QuickLogScreen:
             console.print(f"  [cyan bold]b[/cyan bold]. Back to menu")
             console.print()
 
-            choice = console.input("[yellow]Enter choice:[/yellow] ").strip().lower()
+            choice = choose("[yellow]Enter choice:[/yellow] ", ["c", "b"], max_number=len(categories), back="b")
 
             if choice == 'b':
                 break
@@ -836,55 +1204,67 @@ class QuickLogScreen:
                     if idx < 0 or idx >= len(categories):
                         raise ValueError
 
-                    selected_category = categories[idx]
-                    self._show_category_moodlets(selected_category, by_category[selected_category])
+                    self._show_category_moodlets(categories[idx][0])
                 except (ValueError, IndexError):
                     console.print("[red]Invalid choice[/red]")
-                    time.sleep(1)
+                    pause(1)
 
-    def _show_category_moodlets(self, category: str, moodlets: List[Dict[str, Any]]):
-        """Show moodlets in a specific category."""
-        console.clear()
+    def _show_category_moodlets(self, category: str):
+        """Show moodlets in a specific category, in a scrolling list."""
+        from src.tui.virtual_list import VirtualList
 
-        console.print()
-        console.print(Align.center(Text(f"QuickLog - {category.title()}", style="cyan bold")))
-        console.print()
-
-        console.print(f"[cyan bold]{category.title()} Moodlets:[/cyan bold]")
-        for i, moodlet in enumerate(moodlets, 1):
-            mod_style = "green" if moodlet['mood_value'] >= 0 else "red"
-            console.print(f"  [cyan bold]{i}[/cyan bold]. [{mod_style}]{moodlet['mood_value']:+d}[/{mod_style}] {moodlet['name']}")
-            console.print(f"      [dim]{moodlet['description']} ({moodlet['duration_hours']}h)[/dim]")
-
-        console.print()
-        console.print(f"  [cyan bold]0[/cyan bold]. Back")
-        console.print()
+        moodlets = VirtualList(
+            lambda cursor, limit: self.engine.get_event_moodlets_page(category, limit=limit, cursor=cursor),
+            self._render_moodlet,
+            height=9,
+            matches=lambda moodlet, query: query.lower() in moodlet['name'].lower()
+        )
 
-        choice = console.input("[yellow]Select moodlet:[/yellow] ").strip()
+        while True:
+            console.clear()
+            print_title(f"QuickLog - {category.title()}")
 
-        if choice == '0':
-            return
+            console.print(f"[cyan bold]{category.title()} Moodlets:[/cyan bold]")
+            console.print(moodlets.render(empty="No moodlets in this category"))
+            console.print()
+            console.print(f"  [cyan bold]0[/cyan bold]. Back")
+            console.print()
 
-        try:
-            idx = int(choice) - 1
-            if idx < 0 or idx >= len(moodlets):
-                raise ValueError
+            choice = choose(
+                "[yellow]Select moodlet (n/p page, /text search):[/yellow] ",
+                ["0", "n", "p", ""], max_number=len(moodlets.rows), back="0", text_keys="/"
+            )
 
-            moodlet = moodlets[idx]
-            self.engine.apply_moodlet(moodlet['id'])
-            console.print(f"[green]✓ Applied: {moodlet['name']} ({moodlet['mood_value']:+d})[/green]")
-            time.sleep(1.5)
-        except (ValueError, IndexError):
-            console.print("[red]Invalid choice[/red]")
-            time.sleep(1)
+            if choice == '0':
+                return
+            if choice.isdigit():
+                moodlet = moodlets.get(int(choice) - 1)
+                if moodlet is None:
+                    console.print("[red]Invalid choice[/red]")
+                    pause(1)
+                    continue
+                self.engine.apply_moodlet(moodlet['id'])
+                console.print(f"[green]✓ Applied: {moodlet['name']} ({moodlet['mood_value']:+d})[/green]")
+                pause(1.5)
+                return
+            if not moodlets.navigate(choice):
+                console.print("[red]Invalid choice[/red]")
+                pause(1)
+
+    @staticmethod
+    def _render_moodlet(moodlet: Dict[str, Any]) -> Text:
+        """One moodlet row: value, name, description and duration."""
+        mod_style = "green" if moodlet['mood_value'] >= 0 else "red"
+        text = Text(f"{moodlet['mood_value']:+d} ", style=mod_style)
+        text.append(moodlet['name'])
+        text.append(f"\n    {moodlet['description']} ({moodlet['duration_hours']}h)", style="dim")
+        return text
 
     def _create_custom_moodlet(self):
         """Create a custom moodlet (to be implemented with LLM)."""
         console.clear()
 
-        console.print()
-        console.print(Align.center(Text("Create Custom Moodlet", style="cyan bold")))
-        console.print()
+        print_title("Create Custom Moodlet")
 
         # Simple version for now - will add LLM later
         title = console.input("[yellow]Moodlet title:[/yellow] ").strip()
@@ -898,7 +1278,7 @@ class QuickLogScreen:
             mood_value = int(modifier_str)
         except ValueError:
             console.print("[red]Invalid mood value[/red]")
-            time.sleep(1)
+            pause(1)
             return
 
         duration_str = console.input("[yellow]Duration in hours:[/yellow] ").strip()
@@ -906,28 +1286,20 @@ class QuickLogScreen:
             duration_hours = int(duration_str)
         except ValueError:
             console.print("[red]Invalid duration[/red]")
-            time.sleep(1)
+            pause(1)
             return
 
         # For now, just log it via the old system (we'll migrate this to create actual moodlets later)
         self.engine.log_mood_event(title, mood_value, description or title, duration_hours)
 
         console.print(f"[green]✓ Applied: {title} ({mood_value:+d})[/green]")
-        time.sleep(1.5)
+        pause(1.5)
 
 
 class AboutScreen:
     """About MOOdBBS."""
 
-    def show(self):
-        """Display about information."""
-        console.clear()
-
-        console.print()
-        console.print(Align.center(Text("About MOOdBBS", style="cyan bold")))
-        console.print()
-
-        about_text = """
+    ABOUT_TEXT = """
 MOOdBBS v0.1.0
 
 A RimWorld-inspired mood tracking system with quest mechanics
@@ -939,11 +1311,17 @@ Built with Python + Rich
 Headless architecture for multiple frontends
 
 Created by nthmost
-        """
+"""
 
-        console.print(Align.center(about_text.strip(), style="dim"))
-        console.print()
-        console.input("[yellow]Press Enter to return...[/yellow]")
+    def show(self):
+        """Display about information."""
+        console.clear()
+
+        print_title("About MOOdBBS")
+        console.print(render_cache.get(
+            console, "about", lambda mode: Group(Align.center(self.ABOUT_TEXT.strip(), style="dim"), Text())
+        ))
+        choose("[yellow]Press Enter to return...[/yellow]", [""], back="")
 
 
 class SettingsScreen:
@@ -956,12 +1334,10 @@ class SettingsScreen:
         """Display settings menu."""
         while True:
             console.clear()
-            console.print()
-            console.print(Align.center(Text("Settings", style="cyan bold")))
-            console.print()
+            print_title("Settings")
 
             # Get current profile
-            profile = self.engine.db.get_user_profile()
+            profile = self.engine.get_user_profile()
 
             # Display current settings
             console.print("[cyan bold]Current Profile:[/cyan bold]")
@@ -999,7 +1375,7 @@ class SettingsScreen:
             console.print("  [cyan bold]b[/cyan bold] - Back to menu")
             console.print()
 
-            choice = console.input("[yellow]Enter choice (z/t/m/b):[/yellow] ").strip().lower()
+            choice = choose("[yellow]Enter choice (z/t/m/b):[/yellow] ", list("ztmb"), back="b")
 
             if choice == 'b':
                 break
@@ -1021,19 +1397,19 @@ class SettingsScreen:
 
             if not new_zipcode:
                 console.print("[dim]No change[/dim]")
-                time.sleep(1)
+                pause(1)
                 return
 
             # Validate zipcode
-            is_valid, error_msg = zipcode_validator.validate(new_zipcode)
+            is_valid, error_msg = get_zipcode_validator().validate(new_zipcode)
 
             if is_valid:
                 # Normalize the zipcode
-                normalized = zipcode_validator.normalize(new_zipcode)
+                normalized = get_zipcode_validator().normalize(new_zipcode)
                 profile.home_zipcode = normalized
-                self.engine.db.save_user_profile(profile)
+                self.engine.save_user_profile(profile)
                 console.print(f"[green]✓ Zipcode updated to {normalized}[/green]")
-                time.sleep(1)
+                pause(1)
                 return
             else:
                 console.print(f"[red]✗ {error_msg}[/red]")
@@ -1084,9 +1460,9 @@ class SettingsScreen:
             console.print("[dim]No preferences set, defaulting to walking[/dim]")
             profile.prefers_walking = True
 
-        self.engine.db.save_user_profile(profile)
+        self.engine.save_user_profile(profile)
         console.print("[green]✓ Transportation preferences updated[/green]")
-        time.sleep(1)
+        pause(1)
 
     def _update_memberships(self, profile):
         """Update user memberships."""
@@ -1113,16 +1489,16 @@ class SettingsScreen:
 
             if keep_or_clear == 'c':
                 profile.memberships = []
-                self.engine.db.save_user_profile(profile)
+                self.engine.save_user_profile(profile)
                 console.print("[green]✓ All memberships cleared[/green]")
             else:
                 console.print("[dim]No change[/dim]")
         else:
             profile.memberships = [m.strip() for m in memberships_input.split(',')]
-            self.engine.db.save_user_profile(profile)
+            self.engine.save_user_profile(profile)
             console.print(f"[green]✓ Memberships updated ({len(profile.memberships)} total)[/green]")
 
-        time.sleep(1)
+        pause(1)
 
 
 class SetupWizardScreen:
@@ -1136,21 +1512,17 @@ class SetupWizardScreen:
         console.clear()
 
         # Welcome message
-        console.print()
-        console.print(Align.center(Text("Welcome to MOOdBBS!", style="cyan bold")))
-        console.print()
+        print_title("Welcome to MOOdBBS!")
         console.print(Align.center("[yellow]Let's get you set up. This will only take a minute.[/yellow]"))
         console.print()
-        time.sleep(1)
+        pause(1)
 
         # Get user profile
-        profile = self.engine.db.get_user_profile()
+        profile = self.engine.get_user_profile()
 
         # Step 1: Zipcode
         console.clear()
-        console.print()
-        console.print(Align.center(Text("Setup: Location", style="cyan bold")))
-        console.print()
+        print_title("Setup: Location")
         console.print("[yellow]What's your zipcode?[/yellow]")
         console.print("[dim]This helps us suggest relevant quests in your area.[/dim]")
         console.print("[dim]Examples: 94118 or 94118-1234 (US), A1A 1A1 (CA), SW1A 1AA (UK)[/dim]")
@@ -1164,11 +1536,11 @@ class SetupWizardScreen:
                 break
 
             # Validate zipcode
-            is_valid, error_msg = zipcode_validator.validate(zipcode)
+            is_valid, error_msg = get_zipcode_validator().validate(zipcode)
 
             if is_valid:
                 # Normalize the zipcode
-                normalized = zipcode_validator.normalize(zipcode)
+                normalized = get_zipcode_validator().normalize(zipcode)
                 profile.home_zipcode = normalized
                 console.print(f"[green]✓[/green] Set to {normalized}")
                 break
@@ -1176,13 +1548,11 @@ class SetupWizardScreen:
                 console.print(f"[red]✗ {error_msg}[/red]")
                 console.print("[dim]Try again or press Enter to skip[/dim]")
 
-        time.sleep(0.5)
+        pause(0.5)
 
         # Step 2: Transportation
         console.clear()
-        console.print()
-        console.print(Align.center(Text("Setup: Transportation", style="cyan bold")))
-        console.print()
+        print_title("Setup: Transportation")
         console.print("[yellow]How do you usually get around? (select all that apply)[/yellow]")
         console.print()
         console.print("  [cyan bold]w[/cyan bold] - Walking")
@@ -1225,13 +1595,11 @@ class SetupWizardScreen:
             console.print("[dim]No preferences set, defaulting to walking[/dim]")
             profile.prefers_walking = True
 
-        time.sleep(0.5)
+        pause(0.5)
 
         # Step 3: Memberships
         console.clear()
-        console.print()
-        console.print(Align.center(Text("Setup: Memberships", style="cyan bold")))
-        console.print()
+        print_title("Setup: Memberships")
         console.print("[yellow]Do you have any museum or venue memberships?[/yellow]")
         console.print("[dim]We'll suggest these as easy weekday quests since there's no admission cost.[/dim]")
         console.print("[dim]Plus, we'll learn what kinds of places you're interested in![/dim]")
@@ -1247,13 +1615,11 @@ class SetupWizardScreen:
         else:
             console.print("[dim]Skipped[/dim]")
 
-        time.sleep(0.5)
+        pause(0.5)
 
         # Step 4: Confirmation
         console.clear()
-        console.print()
-        console.print(Align.center(Text("Setup Complete!", style="green bold")))
-        console.print()
+        print_title("Setup Complete!", style="green bold")
         console.print("[cyan]Your profile:[/cyan]")
         if profile.home_zipcode:
             console.print(f"  Location: {profile.home_zipcode}")
@@ -1276,7 +1642,7 @@ class SetupWizardScreen:
 
         # Mark setup as completed
         profile.setup_completed = True
-        self.engine.db.save_user_profile(profile)
+        self.engine.save_user_profile(profile)
 
         # Apply "First Login" moodlet
         self.engine.apply_moodlet(100)  # Moodlet ID 100 = "Joined MOOdBBS!" (+5, 24 hours)
@@ -1285,4 +1651,4 @@ class SetupWizardScreen:
         console.print()
         console.print(Align.center("[green]Let's start your MOOdBBS adventure![/green]"))
         console.print(Align.center("[dim]+5 mood bonus for joining MOOdBBS![/dim]"))
-        time.sleep(1)
+        pause(1)
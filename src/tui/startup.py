@@ -0,0 +1,81 @@
+"""Build the engine in the background while the boot screen plays."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from src.engine import MOOdBBSEngine
+
+
+class EngineLoader:
+    """Constructs and warms up the engine on a background thread.
+
+    Started as soon as the process starts, so schema setup, loading from
+    the database and the first dashboard snapshot overlap the boot
+    animation instead of following it. Callers only wait (via result())
+    when they first need data.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], MOOdBBSEngine] = MOOdBBSEngine,
+        on_ready: Optional[Callable[[MOOdBBSEngine], None]] = None
+    ):
+        """Create a loader.
+
+        Args:
+            factory: Builds the engine
+            on_ready: Called on the worker thread with the warmed-up engine,
+                for extra background work (e.g. LLM warm-up)
+        """
+        self._factory = factory
+        self._on_ready = on_ready
+        self._future: Future = Future()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at: Optional[float] = None
+        self.load_seconds: Optional[float] = None
+
+    def start(self) -> "EngineLoader":
+        """Start loading.
+
+        Returns:
+            The loader, for chaining
+        """
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._load, name="engine-loader", daemon=True)
+        self._thread.start()
+        return self
+
+    def _load(self):
+        """Build and warm up the engine (worker thread)."""
+        try:
+            engine = self._factory()
+            engine.warm_up()
+            if self._on_ready is not None:
+                self._on_ready(engine)
+        except BaseException as e:
+            self.load_seconds = time.monotonic() - self.started_at
+            self._future.set_exception(e)
+        else:
+            self.load_seconds = time.monotonic() - self.started_at
+            self._future.set_result(engine)
+
+    def done(self) -> bool:
+        """Whether loading has finished (successfully or not)."""
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> MOOdBBSEngine:
+        """Wait for the engine.
+
+        Args:
+            timeout: Seconds to wait (None waits as long as it takes)
+
+        Returns:
+            The ready engine
+
+        Raises:
+            TimeoutError: If the engine isn't ready within timeout
+            Exception: Whatever building the engine raised
+        """
+        return self._future.result(timeout)
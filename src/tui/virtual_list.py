@@ -0,0 +1,203 @@
+"""Scrolling list that renders one window of rows and fetches pages lazily."""
+
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
+
+from rich.console import Group
+from rich.table import Table
+from rich.text import Text
+
+Row = TypeVar("Row")
+
+# fetch_page(cursor, limit) -> (rows, next_cursor); next_cursor None on the last page
+PageFetcher = Callable[[Optional[Any], int], Tuple[List[Row], Optional[Any]]]
+
+
+class VirtualList(Generic[Row]):
+    """A list of any length, shown a window at a time.
+
+    Rows come from a paginated engine API and are fetched only when the
+    window (or a search) reaches them, so opening the list costs one page
+    and drawing it costs one window, however long the list gets.
+    """
+
+    def __init__(
+        self,
+        fetch_page: PageFetcher,
+        render_row: Callable[[Row], Any],
+        height: int = 10,
+        page_size: int = 50,
+        matches: Optional[Callable[[Row, str], bool]] = None
+    ):
+        """Create a list.
+
+        Args:
+            fetch_page: Fetches a page of rows after a cursor
+            render_row: Builds the renderable (or markup string) for a row
+            height: Rows shown at once
+            page_size: Rows fetched per page
+            matches: Whether a row matches a search query (defaults to a
+                case-insensitive substring match on str(row))
+        """
+        self._fetch_page = fetch_page
+        self._render_row = render_row
+        self.height = height
+        self.page_size = page_size
+        self._matches = matches or (lambda row, query: query.lower() in str(row).lower())
+        self.rows: List[Row] = []
+        self.top = 0
+        self.selected: Optional[int] = None
+        self.pages_fetched = 0
+        self._next_cursor: Optional[Any] = None
+        self._exhausted = False
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether every row has been fetched."""
+        return self._exhausted
+
+    @property
+    def at_end(self) -> bool:
+        """Whether the window shows the last row."""
+        return self._exhausted and self.top + self.height >= len(self.rows)
+
+    def _fetch_more(self) -> bool:
+        """Fetch the next page.
+
+        Returns:
+            False if there were no more rows
+        """
+        if self._exhausted:
+            return False
+        rows, self._next_cursor = self._fetch_page(self._next_cursor, self.page_size)
+        self.rows.extend(rows)
+        self.pages_fetched += 1
+        self._exhausted = self._next_cursor is None or not rows
+        return bool(rows)
+
+    def load_through(self, index: int) -> bool:
+        """Fetch pages until a row index is loaded.
+
+        Args:
+            index: 0-based row index
+
+        Returns:
+            Whether the row exists
+        """
+        while index >= len(self.rows) and self._fetch_more():
+            pass
+        return index < len(self.rows)
+
+    def window(self) -> List[Tuple[int, Row]]:
+        """Get the visible rows.
+
+        Returns:
+            (0-based index, row) pairs
+        """
+        self.load_through(self.top + self.height - 1)
+        return list(enumerate(self.rows[self.top:self.top + self.height], start=self.top))
+
+    def get(self, index: int) -> Optional[Row]:
+        """Get a row by 0-based index, fetching it if needed."""
+        if index < 0 or not self.load_through(index):
+            return None
+        return self.rows[index]
+
+    def scroll(self, delta: int):
+        """Move the window by delta rows, stopping at either end."""
+        top = max(self.top + delta, 0)
+        if delta > 0 and not self.load_through(top):
+            # Past the end: show the last full window instead
+            top = max(len(self.rows) - self.height, 0)
+        self.top = top
+
+    def page_down(self):
+        self.scroll(self.height)
+
+    def page_up(self):
+        self.scroll(-self.height)
+
+    def jump(self, index: int) -> bool:
+        """Put a row at the top of the window.
+
+        Args:
+            index: 0-based row index
+
+        Returns:
+            False if there's no such row
+        """
+        if index < 0 or not self.load_through(index):
+            return False
+        self.top = index
+        self.selected = index
+        return True
+
+    def search(self, query: str) -> bool:
+        """Jump to the next row matching a query, after the selected row.
+
+        Fetches further pages as needed.
+
+        Args:
+            query: Search text
+
+        Returns:
+            False if no later row matches
+        """
+        index = (self.selected + 1) if self.selected is not None else self.top
+        while self.load_through(index):
+            if self._matches(self.rows[index], query):
+                return self.jump(index)
+            index += 1
+        return False
+
+    def navigate(self, command: str) -> bool:
+        """Handle a navigation command typed at the list's prompt.
+
+        n (or Enter) pages down, p pages up, g<N> jumps to row N and
+        /text searches for the next match.
+
+        Args:
+            command: Stripped command text
+
+        Returns:
+            True if the command was a navigation command
+        """
+        if command in ("n", ""):
+            self.page_down()
+        elif command == "p":
+            self.page_up()
+        elif command.startswith("/") and len(command) > 1:
+            self.search(command[1:])
+        elif command.startswith("g") and command[1:].strip().isdigit():
+            self.jump(int(command[1:]) - 1)
+        else:
+            return False
+        return True
+
+    def status(self) -> str:
+        """Position text, e.g. "11-20 of 57" (or "of 60+" before the end is known)."""
+        if not self.rows:
+            return "0 of 0"
+        last = min(self.top + self.height, len(self.rows))
+        total = f"{len(self.rows)}" if self._exhausted else f"{len(self.rows)}+"
+        return f"{self.top + 1}-{last} of {total}"
+
+    def render(self, empty: str = "Nothing here yet") -> Group:
+        """Build the visible window.
+
+        Args:
+            empty: Text shown when the list has no rows
+
+        Returns:
+            Numbered rows plus a position line
+        """
+        rows = self.window()
+        if not rows:
+            return Group(Text(empty, style="dim"))
+
+        table = Table.grid(padding=(0, 1))
+        table.add_column(justify="right", style="cyan bold")
+        table.add_column()
+        for index, row in rows:
+            marker = ">" if index == self.selected else " "
+            table.add_row(f"{marker}{index + 1}", self._render_row(row))
+        return Group(table, Text(self.status(), style="dim"))
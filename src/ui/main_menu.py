@@ -1,19 +1,15 @@
 """Main menu UI for MOOdBBS."""
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
-from rich.layout import Layout
-from rich.align import Align
 
+from src.tui.render_cache import RenderCache
 
-def render_main_menu(console: Console):
-    """Render the MOOdBBS main menu.
+# Static fragments (menu, header, ASCII art) are laid out once per terminal size
+_render_cache = RenderCache()
 
-    Args:
-        console: Rich Console instance
-    """
-    menu_text = """
+MAIN_MENU_TEXT = """
 ====================================================
                     MOOdBBS MAIN
 ====================================================
@@ -27,7 +23,14 @@ def render_main_menu(console: Console):
 ====================================================
 """
 
-    console.print(menu_text, style="cyan")
+
+def render_main_menu(console: Console):
+    """Render the MOOdBBS main menu.
+
+    Args:
+        console: Rich Console instance
+    """
+    console.print(_render_cache.get(console, "main_menu", lambda mode: Text(MAIN_MENU_TEXT, style="cyan")))
 
 
 def render_dashboard(console: Console, mood_score: int, mood_face: str, quests: list, active_events: list):
@@ -43,9 +46,10 @@ def render_dashboard(console: Console, mood_score: int, mood_face: str, quests:
     console.clear()
 
     # Header
-    header = Text("MOOdBBS", style="bold cyan", justify="center")
-    console.print(Panel(header, border_style="cyan"))
-    console.print()
+    console.print(_render_cache.get(console, "dashboard_header", lambda mode: Group(
+        Panel(Text("MOOdBBS", style="bold cyan", justify="center"), border_style="cyan"),
+        Text()
+    )))
 
     # Mood display
     mood_color = "green" if mood_score >= 10 else "yellow" if mood_score >= 0 else "red"
@@ -113,5 +117,4 @@ def render_connection_screen(console: Console):
     """Render the connection/boot screen."""
     console.clear()
 
-    art = render_ascii_art()
-    console.print(art, style="bold cyan")
+    console.print(_render_cache.get(console, "ascii_art", lambda mode: Text(render_ascii_art(), style="bold cyan")))
@@ -21,6 +21,17 @@ def temp_db():
     Path(db_path).unlink(missing_ok=True)
 
 
+@pytest.fixture
+def migrated_db(temp_db):
+    """Temporary database with base schema and all migrations applied."""
+    from src.database.db import Database
+    from src.database.migrate import MigrationRunner
+
+    Database(temp_db)
+    MigrationRunner(temp_db).run_migrations()
+    return temp_db
+
+
 @pytest.fixture
 def now():
     """Current timestamp for testing."""
@@ -0,0 +1,310 @@
+"""Local stand-in for an Ollama server.
+
+Implements the parts of the Ollama HTTP API that LLMQuestParser uses
+(/api/generate, streaming and not, and /api/tags) so the parser can be
+tested and benchmarked without a live model. Latency, failures and
+responses are all configurable.
+
+Run standalone:
+
+    python -m tests.fake_ollama --port 11434 --latency 0.5
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+
+Responder = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+_INPUT_LINE = re.compile(r'Input: "(.*)"\s*\nOutput:\s*$', re.DOTALL)
+
+
+def default_responder(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer a generate request with a plausible quest parse.
+
+    Uses the quoted input from the end of the prompt as the title.
+    """
+    match = _INPUT_LINE.search(request.get("prompt", ""))
+    title = match.group(1) if match else "Quest"
+    return {
+        "title": title[:1].upper() + title[1:],
+        "description": title,
+        "category": "experiential",
+        "xp_reward": 20,
+        "renewal_type": None,
+        "constraint_type": None,
+        "constraint_note": None,
+        "time_note": None,
+    }
+
+
+@dataclass
+class ScriptedReply:
+    """One scripted reply, consumed by the next generate request.
+
+    Attributes:
+        response: Object to return (serialized as the model's JSON output),
+            or a raw string to return verbatim
+        status: HTTP status to answer with
+        delay: Seconds to wait before answering
+        drop: Close the connection without answering
+    """
+    response: Any = None
+    status: int = 200
+    delay: float = 0.0
+    drop: bool = False
+
+
+@dataclass
+class FakeOllamaStats:
+    """Request counters."""
+    generate: int = 0
+    generate_streaming: int = 0
+    tags: int = 0
+    failures: int = 0
+    aborted_streams: int = 0
+    requests: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class FakeOllamaServer:
+    """Threaded HTTP server that imitates Ollama.
+
+    Attributes can be changed while the server runs (e.g. to take it
+    "down" mid-test via failure_rate=1.0).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        token_delay: float = 0.0,
+        chunk_size: int = 4,
+        failure_rate: float = 0.0,
+        failure_status: int = 500,
+        responder: Responder = default_responder,
+        models: Iterable[str] = ("qwen2.5:7b",),
+        seed: Optional[int] = None
+    ):
+        """Initialize the server (not started).
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds before the first byte of a generate response
+                (prompt evaluation time)
+            token_delay: Seconds between streamed chunks (generation speed)
+            chunk_size: Characters of output per streamed chunk
+            failure_rate: Fraction of generate requests answered with failure_status
+            failure_status: HTTP status for injected failures
+            responder: Builds the model output for a request body
+            models: Model names reported by /api/tags
+            seed: Seed for failure injection
+        """
+        self.latency = latency
+        self.token_delay = token_delay
+        self.chunk_size = chunk_size
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.responder = responder
+        self.models = list(models)
+        self.stats = FakeOllamaStats()
+
+        self._script: Deque[ScriptedReply] = deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    # ==================== Lifecycle ====================
+
+    @property
+    def url(self) -> str:
+        """Base URL, e.g. http://127.0.0.1:54321."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOllamaServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-ollama", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "FakeOllamaServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # ==================== Scripting ====================
+
+    def script(self, *replies: ScriptedReply):
+        """Queue replies for the next generate requests, in order."""
+        with self._lock:
+            self._script.extend(replies)
+
+    def _next_reply(self, body: Dict[str, Any]) -> ScriptedReply:
+        with self._lock:
+            self.stats.requests.append(body)
+            if self._script:
+                return self._script.popleft()
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                return ScriptedReply(status=self.failure_status)
+        return ScriptedReply(response=self.responder(body))
+
+    # ==================== HTTP ====================
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # Otherwise delayed ACKs add ~40ms per response
+
+            def log_message(self, format, *args):
+                pass  # Keep test and benchmark output quiet
+
+            def do_GET(self):
+                if self.path != "/api/tags":
+                    self._send_json(404, {"error": "not found"})
+                    return
+                with server._lock:
+                    server.stats.tags += 1
+                self._send_json(200, {"models": [{"name": name, "model": name} for name in server.models]})
+
+            def do_POST(self):
+                if self.path != "/api/generate":
+                    self._send_json(404, {"error": "not found"})
+                    return
+
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self._send_json(400, {"error": "invalid JSON"})
+                    return
+
+                reply = server._next_reply(body)
+                time.sleep(server.latency + reply.delay)
+
+                if reply.drop:
+                    with server._lock:
+                        server.stats.failures += 1
+                    self.close_connection = True
+                    return
+                if reply.status != 200:
+                    with server._lock:
+                        server.stats.failures += 1
+                    self._send_json(reply.status, {"error": "injected failure"})
+                    return
+
+                output = reply.response if isinstance(reply.response, str) else json.dumps(reply.response)
+                prompt_tokens = len((body.get("system", "") + body.get("prompt", "")).split())
+                stats = {
+                    "model": body.get("model"),
+                    "done": True,
+                    "total_duration": int((server.latency + reply.delay) * 1e9),
+                    "load_duration": 0,
+                    "prompt_eval_count": prompt_tokens,
+                    "prompt_eval_duration": int(server.latency * 1e9),
+                    "eval_count": len(output) // server.chunk_size + 1,
+                    "eval_duration": 0,
+                }
+
+                if body.get("stream", True):
+                    with server._lock:
+                        server.stats.generate_streaming += 1
+                    self._stream(output, stats)
+                else:
+                    with server._lock:
+                        server.stats.generate += 1
+                    # Generation takes as long as it would have streamed
+                    time.sleep(server.token_delay * len(range(0, len(output), max(1, server.chunk_size))))
+                    self._send_json(200, {"response": output, **stats})
+
+            def _stream(self, output: str, stats: Dict[str, Any]):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                model = stats["model"]
+                step = max(1, server.chunk_size)
+                try:
+                    for i in range(0, len(output), step):
+                        self._write_chunk({"model": model, "response": output[i:i + step], "done": False})
+                        if server.token_delay:
+                            time.sleep(server.token_delay)
+                    self._write_chunk({"response": "", **stats})
+                    self.wfile.write(b"0\r\n\r\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client stopped reading: the real server would stop generating
+                    with server._lock:
+                        server.stats.aborted_streams += 1
+                    self.close_connection = True
+
+            def _write_chunk(self, obj: Dict[str, Any]):
+                data = (json.dumps(obj) + "\n").encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+            def _send_json(self, status: int, obj: Dict[str, Any]):
+                data = json.dumps(obj).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def main():
+    """Run a fake Ollama server in the foreground."""
+    parser = argparse.ArgumentParser(description="Fake Ollama server for offline parser testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each generate response")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="seconds between streamed chunks")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of generate requests that fail")
+    args = parser.parse_args()
+
+    server = FakeOllamaServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        token_delay=args.token_delay,
+        failure_rate=args.failure_rate
+    )
+    print(f"Fake Ollama listening on {server.url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
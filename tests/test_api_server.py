@@ -0,0 +1,246 @@
+"""Tests for the HTTP JSON API."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from src.api.server import ApiServer, LatencyHistogram
+from src.engine import MOOdBBSEngine
+
+
+@pytest.fixture
+def engine(migrated_db):
+    return MOOdBBSEngine(db_path=migrated_db)
+
+
+async def request(port, method, path, body=None, reader_writer=None):
+    """Send one request; returns (status, parsed JSON body)."""
+    reader, writer = reader_writer or await asyncio.open_connection("127.0.0.1", port)
+    data = b"" if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode())
+    connection = "keep-alive" if reader_writer else "close"
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: {connection}\r\n"
+        f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+    payload = json.loads(await reader.readexactly(int(headers["content-length"])))
+    if reader_writer is None:
+        writer.close()
+    return status, payload
+
+
+def serve(engine, scenario):
+    """Run scenario(server) against a live server on a free port."""
+    async def run():
+        server = await ApiServer(engine, port=0).start()
+        try:
+            return await scenario(server)
+        finally:
+            await server.close()
+    return asyncio.run(run())
+
+
+class TestEndpoints:
+    """Test each endpoint's responses."""
+
+    def test_mood_current(self, engine):
+        engine.apply_moodlet(100)  # Joined MOOdBBS! (+5)
+        engine.add_trait("Optimist", "Sees the bright side", 2)
+
+        status, body = serve(engine, lambda server: request(server.port, "GET", "/api/mood/current"))
+
+        assert status == 200
+        assert body["mood_score"] == 7
+        assert [m["title"] for m in body["modifiers"]] == ["Joined MOOdBBS!"]
+        assert body["traits"][0]["name"] == "Optimist"
+
+    def test_log_event_then_history(self, engine):
+        async def scenario(server):
+            created = await request(server.port, "POST", "/api/mood/event", {
+                "event_type": "Sunny day", "modifier": 3, "description": "Nice weather", "duration_hours": 2
+            })
+            return created, await request(server.port, "GET", "/api/mood/history?days=1")
+
+        (status, event), (_, history) = serve(engine, scenario)
+
+        assert status == 201
+        assert event["modifier"] == 3 and event["expires_at"]
+        assert history["days"] == 1
+        assert [e["event_type"] for e in history["events"]] == ["Sunny day"]
+
+    def test_quests_and_completion(self, engine):
+        quest = engine.create_quest(title="Walk to Ocean Beach", xp_reward=15)
+
+        async def scenario(server):
+            active = await request(server.port, "GET", "/api/quests/active")
+            completed = await request(server.port, "POST", "/api/quests/complete", {"quest_id": quest.id})
+            again = await request(server.port, "POST", "/api/quests/complete", {"quest_id": quest.id})
+            after = await request(server.port, "GET", "/api/quests/active")
+            return active, completed, again, after
+
+        active, completed, again, after = serve(engine, scenario)
+
+        assert [q["title"] for q in active[1]["quests"]] == ["Walk to Ocean Beach"]
+        assert completed[0] == 200 and completed[1]["xp_awarded"] == 15
+        assert again[0] == 400 and "already completed" in again[1]["error"]
+        assert after[1]["quests"] == []
+
+    def test_traits(self, engine):
+        engine.add_trait("Night owl", "Up late", -1)
+
+        status, body = serve(engine, lambda server: request(server.port, "GET", "/api/traits"))
+
+        assert status == 200
+        assert body["traits"] == [{"name": "Night owl", "description": "Up late", "mood_modifier": -1}]
+
+    @pytest.mark.parametrize("body, message", [
+        ({"modifier": 3}, "event_type is required"),
+        ({"event_type": "Rain", "modifier": "3"}, "modifier must be an integer"),
+        ({"event_type": "Rain", "modifier": True}, "modifier must be an integer"),
+        ({"event_type": "Rain", "modifier": 3, "duration_hours": 0}, "duration_hours must be positive"),
+        (b"{not json", "Expecting property name"),
+        (b"[1, 2]", "must be a JSON object"),
+    ])
+    def test_validation(self, engine, body, message):
+        status, payload = serve(engine, lambda server: request(server.port, "POST", "/api/mood/event", body))
+
+        assert status == 400
+        assert message in payload["error"]
+        assert engine.get_active_mood_events() == []
+
+    def test_unknown_routes(self, engine):
+        async def scenario(server):
+            return (
+                await request(server.port, "GET", "/api/nope"),
+                await request(server.port, "POST", "/api/traits", {}),
+                await request(server.port, "GET", "/api/mood/history?days=0"),
+            )
+
+        missing, wrong_method, bad_param = serve(engine, scenario)
+
+        assert missing[0] == 404
+        assert wrong_method[0] == 405
+        assert bad_param == (400, {"error": "days must be between 1 and 365"})
+
+
+class TestConcurrency:
+    """Test the cached readers and the single writer."""
+
+    def test_concurrent_reads_share_one_rebuild(self, engine):
+        builds = []
+        original = engine.get_dashboard_snapshot
+        engine.get_dashboard_snapshot = lambda: builds.append(1) or original()
+
+        async def scenario(server):
+            first = await asyncio.gather(*(request(server.port, "GET", "/api/mood/current") for _ in range(100)))
+            await request(server.port, "POST", "/api/mood/event", {"event_type": "Rain", "modifier": -2})
+            second = await asyncio.gather(*(request(server.port, "GET", "/api/mood/current") for _ in range(100)))
+            return first, second
+
+        first, second = serve(engine, scenario)
+
+        assert {body["mood_score"] for _, body in first} == {0}
+        assert {body["mood_score"] for _, body in second} == {-2}
+        # One rebuild before the change and one after, however many clients asked
+        assert len(builds) == 2
+
+    def test_writes_run_one_at_a_time_on_one_thread(self, engine):
+        threads = set()
+        active = []
+        overlapped = []
+        original = engine.log_mood_event
+
+        def log_mood_event(*args, **kwargs):
+            threads.add(threading.get_ident())
+            active.append(1)
+            overlapped.append(len(active) > 1)
+            try:
+                return original(*args, **kwargs)
+            finally:
+                active.pop()
+
+        engine.log_mood_event = log_mood_event
+
+        async def scenario(server):
+            return await asyncio.gather(*(
+                request(server.port, "POST", "/api/mood/event", {"event_type": f"Event {i}", "modifier": 1})
+                for i in range(50)
+            ))
+
+        responses = serve(engine, scenario)
+
+        assert {status for status, _ in responses} == {201}
+        assert len({body["id"] for _, body in responses}) == 50
+        assert len(threads) == 1 and threading.get_ident() not in threads
+        assert not any(overlapped)
+
+    def test_keep_alive_and_stats(self, engine):
+        async def scenario(server):
+            connection = await asyncio.open_connection("127.0.0.1", server.port)
+            for _ in range(3):
+                await request(server.port, "GET", "/api/traits", reader_writer=connection)
+            stats = await request(server.port, "GET", "/api/stats", reader_writer=connection)
+            connection[1].close()
+            return stats
+
+        status, stats = serve(engine, scenario)
+
+        traits = stats["routes"]["GET /api/traits"]
+        assert status == 200
+        assert traits["count"] == 3
+        assert sum(traits["buckets"].values()) == 3
+        assert stats["cache"] == {"hits": 2, "misses": 1}
+
+
+class TestOtherProcesses:
+    """Test serving changes the TUI or shell made to the database."""
+
+    def test_changes_from_another_engine_are_served(self, engine, migrated_db):
+        async def scenario(server):
+            before = await request(server.port, "GET", "/api/mood/current")
+            tui = MOOdBBSEngine(db_path=migrated_db)
+            tui.log_mood_event("Sunny day", 9)
+            quest = tui.create_quest(title="Walk to Ocean Beach", xp_reward=15)
+            await asyncio.sleep(server.sync_interval)
+
+            mood = await request(server.port, "GET", "/api/mood/current")
+            quests = await request(server.port, "GET", "/api/quests/active")
+            completed = await request(server.port, "POST", "/api/quests/complete", {"quest_id": quest.id})
+            return before, mood, quests, completed, tui, quest
+
+        before, mood, quests, completed, tui, quest = serve(engine, scenario)
+
+        assert before[1]["mood_score"] == 0
+        assert mood[1]["mood_score"] == 9
+        assert [q["id"] for q in quests[1]["quests"]] == [quest.id]
+        assert completed[0] == 200
+        # ...and the TUI sees the completion instead of awarding the XP twice
+        with pytest.raises(ValueError, match="already completed"):
+            tui.complete_quest(quest.id)
+
+
+class TestLatencyHistogram:
+    """Test bucketing and percentiles."""
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for ms in [0.3] * 90 + [4] * 9 + [2000]:
+            histogram.observe(ms / 1000)
+
+        assert histogram.percentile(50) == 0.5
+        assert histogram.percentile(95) == 5
+        assert histogram.percentile(100) == pytest.approx(2000)
+        summary = histogram.to_dict()
+        assert summary["buckets"]["<=0.5ms"] == 90
+        assert summary["buckets"][">1000ms"] == 1
+
+    def test_empty(self):
+        assert LatencyHistogram().to_dict()["p50_ms"] is None
@@ -0,0 +1,88 @@
+"""Tests for background quest parsing."""
+
+import threading
+import time
+
+from src.services.background_parse import ParseJob, merge_quest_fields
+
+
+PARSED = {"title": "Visit SFMOMA", "category": "experiential", "xp_reward": 25, "renewal_type": "seasonal"}
+
+
+class SlowParser:
+    """Parser that blocks until released."""
+
+    def __init__(self, result=PARSED):
+        self.result = result
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def parse_quest(self, user_input, user_context="", on_field=None):
+        on_field("title", self.result["title"])
+        self.started.set()
+        self.release.wait(5)
+        return self.result
+
+
+class TestParseJob:
+    """Test the background job wrapper."""
+
+    def test_submit_does_not_block(self):
+        parser = SlowParser()
+
+        start = time.perf_counter()
+        job = ParseJob(parser, "visit sfmoma")
+        assert time.perf_counter() - start < 0.1
+
+        assert parser.started.wait(1)
+        assert not job.done()
+        assert job.result() is None
+        assert job.fields == {"title": "Visit SFMOMA"}
+        assert job.first_field_at is not None
+
+        parser.release.set()
+        assert job.wait(1)
+        assert job.result() == PARSED
+        assert job.elapsed > 0
+
+    def test_cancel_discards_result(self):
+        parser = SlowParser()
+        job = ParseJob(parser, "visit sfmoma")
+        parser.started.wait(1)
+
+        job.cancel()
+        parser.release.set()
+
+        assert job.done()
+        assert job.cancelled
+        assert job.result() is None
+
+    def test_parser_exception_is_a_failed_parse(self):
+        class BrokenParser:
+            def parse_quest(self, user_input, user_context="", on_field=None):
+                raise RuntimeError("boom")
+
+        job = ParseJob(BrokenParser(), "anything")
+        job.wait(1)
+
+        assert job.result() is None
+
+
+class TestMergeQuestFields:
+    """Test merging manual fields over a parse."""
+
+    def test_manual_fields_win(self):
+        merged = merge_quest_fields(PARSED, {"category": "social", "xp_reward": 10})
+
+        assert merged["category"] == "social"
+        assert merged["xp_reward"] == 10
+        assert merged["title"] == "Visit SFMOMA"
+        assert PARSED["category"] == "experiential"  # Parse left untouched
+
+    def test_explicit_none_overrides(self):
+        merged = merge_quest_fields(PARSED, {"renewal_type": None})
+
+        assert merged["renewal_type"] is None
+
+    def test_failed_parse(self):
+        assert merge_quest_fields(None, {"category": "social"}) is None
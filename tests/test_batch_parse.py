@@ -0,0 +1,173 @@
+"""Tests for concurrent batch quest parsing."""
+
+import json
+import sqlite3
+import threading
+import time
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.llm_quest_parser import LLMQuestParser
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return {"response": json.dumps(self._payload)}
+
+
+class SlowOllama:
+    """Answers each request after a delay, tracking peak concurrency."""
+
+    def __init__(self, delay=0.1, fail_on=()):
+        self.delay = delay
+        self.fail_on = set(fail_on)
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None):
+        idea = json["prompt"].rsplit('Input: "', 1)[1].split('"', 1)[0]
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if idea in self.fail_on:
+                raise ConnectionError("dropped")
+            return FakeResponse({"title": idea.title(), "category": "social", "xp_reward": 10})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def make_parser(session):
+    # High threshold so isolated failures don't trip the breaker mid-batch
+    return LLMQuestParser(session=session, breaker=CircuitBreaker(failure_threshold=100))
+
+
+class TestParseMany:
+    """Test LLMQuestParser.parse_many."""
+
+    def test_one_round_of_latency(self):
+        session = SlowOllama(delay=0.1)
+        ideas = [f"idea {i}" for i in range(8)]
+
+        start = time.perf_counter()
+        results = list(make_parser(session).parse_many(ideas, max_concurrency=8))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5  # Sequential would be 0.8s
+        assert session.peak == 8
+        assert [index for index, _, _ in results] == list(range(8))
+        assert [data["title"] for _, _, data in results] == [idea.title() for idea in ideas]
+
+    def test_concurrency_is_bounded(self):
+        session = SlowOllama(delay=0.02)
+
+        list(make_parser(session).parse_many([f"idea {i}" for i in range(10)], max_concurrency=3))
+
+        assert session.peak <= 3
+
+    def test_failures_are_isolated(self):
+        session = SlowOllama(delay=0.01, fail_on={"idea 1"})
+
+        results = list(make_parser(session).parse_many(["idea 0", "idea 1", "idea 2"]))
+
+        assert results[0][2]["title"] == "Idea 0"
+        assert results[1] == (1, "idea 1", None)
+        assert results[2][2]["title"] == "Idea 2"
+
+    def test_duplicate_ideas_parsed_once(self):
+        session = SlowOllama(delay=0.01)
+
+        results = list(make_parser(session).parse_many(["game night", "Game night.", "walk"]))
+
+        assert session.calls == 2
+        assert results[0][2] == results[1][2]
+        assert results[0][2] is not results[1][2]
+
+    def test_empty_input(self):
+        assert list(make_parser(SlowOllama()).parse_many([])) == []
+
+
+class TestCreateQuestFromParsed:
+    """Test turning parser output into quests."""
+
+    def test_maps_difficulty_and_renewal(self, migrated_db):
+        from src.engine import MOOdBBSEngine
+
+        engine = MOOdBBSEngine(db_path=migrated_db)
+        quest = engine.create_quest_from_parsed({
+            "title": "Weekly game night",
+            "description": None,
+            "category": "social",
+            "xp_reward": 15,
+            "renewal_type": "weekly",
+            "constraint_type": "day_of_week",
+            "constraint_note": "Friday",
+        })
+
+        assert quest.difficulty == "medium"
+        assert quest.description == ""
+        assert quest.renewal_policy.renewal_type == "weekly"
+        assert quest.renewal_policy.cooldown_days == 7
+        assert quest.constraint_note == "Friday"
+
+
+class TestRecordingCalls:
+    """Test where parse_many hands calls to the recorder."""
+
+    def test_calls_recorded_on_calling_thread(self):
+        threads = []
+        parser = LLMQuestParser(
+            session=SlowOllama(delay=0.01),
+            breaker=CircuitBreaker(failure_threshold=100),
+            call_recorder=lambda call: threads.append(threading.get_ident())
+        )
+
+        list(parser.parse_many(["idea 1", "idea 2", "idea 1"]))
+
+        assert threads == [threading.get_ident()] * 2
+
+
+class TestCreateIdeas:
+    """Test the shell's create ideas command against the active quest limit."""
+
+    IDEAS = [
+        "Walk to Ocean Beach", "Visit SFMOMA", "Knit a scarf", "Bake sourdough",
+        "Call grandma", "Climb Bernal Hill", "Paint a watercolor", "Swim at Aquatic Park",
+    ]
+
+    def test_only_parses_ideas_that_fit(self, migrated_db, tmp_path, monkeypatch, capsys):
+        from src.services import llm_quest_parser, parse_cache
+        from src.shell.repl import MOOdBBSShell
+
+        session = SlowOllama(delay=0)
+        session.get = lambda url, timeout=None: FakeResponse({})
+        monkeypatch.setattr(llm_quest_parser, "LLMQuestParser", lambda **kwargs: LLMQuestParser(
+            session=session, breaker=CircuitBreaker(failure_threshold=100), **kwargs
+        ))
+        memory_cache = parse_cache.ParseCache(path=None)
+        monkeypatch.setattr(parse_cache, "ParseCache", lambda: memory_cache)
+        ideas = tmp_path / "ideas.txt"
+        ideas.write_text("\n".join(self.IDEAS))
+
+        shell = MOOdBBSShell(db_path=migrated_db)
+        shell.engine.create_quest(title="Read a novel")
+        shell.cmd_create_ideas([str(ideas)])
+
+        # The first two ideas match library templates, so a second wave fills the slots
+        titles = [q.title for q in shell.engine.get_active_quests()]
+        assert titles == ["Read a novel", "Knit A Scarf", "Bake Sourdough"]
+        # Nothing parsed for ideas that couldn't have become quests
+        with sqlite3.connect(migrated_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM llm_calls").fetchone()[0] == 4
+        output = capsys.readouterr().out
+        assert "Created 2 of 8 quests" in output
+        assert "Skipped 4 ideas" in output
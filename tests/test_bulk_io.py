@@ -0,0 +1,144 @@
+"""Tests for streaming bulk import/export."""
+
+import json
+import sqlite3
+import pytest
+
+from src.database.bulk_io import BulkTransfer, detect_format
+from src.database.db import Database
+
+
+TEMPLATES = [
+    {
+        "id": f"template_{i:03d}",
+        "title": f"Template {i}",
+        "description": "Walk somewhere",
+        "category": "constitutional",
+        "difficulty": "easy",
+        "base_xp": 10,
+        "optionality": "high",
+        "suggested_locations": [{"name": "Green Apple Books", "neighborhood": "Inner Richmond"}],
+        "duration_estimate": "30 minutes",
+        "tags": ["outdoor", "walk"],
+        "difficulty_factors": None,
+        "renewal_type": "daily",
+        "renewal_cooldown_days": 1,
+        "renewal_active_months": None,
+    }
+    for i in range(25)
+]
+
+
+@pytest.fixture
+def templates_jsonl(tmp_path):
+    path = tmp_path / "templates.jsonl"
+    with open(path, "w") as f:
+        for template in TEMPLATES:
+            f.write(json.dumps(template) + "\n")
+    return str(path)
+
+
+class TestDetectFormat:
+    """Test file format detection."""
+
+    def test_detect_from_extension(self):
+        assert detect_format("quests.csv") == "csv"
+        assert detect_format("quests.jsonl") == "jsonl"
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError):
+            detect_format("quests.xml")
+
+
+class TestTemplateImport:
+    """Test importing a template library."""
+
+    def test_import_jsonl_in_batches(self, migrated_db, templates_jsonl):
+        """Should import every template even when spanning several batches."""
+        count = BulkTransfer(migrated_db, chunk_size=10).import_records("templates", templates_jsonl)
+
+        assert count == 25
+        templates = Database(migrated_db).load_quest_templates()
+        assert len(templates) == 25
+        assert templates[0].tags == ["outdoor", "walk"]
+        assert templates[0].renewal_policy.renewal_type == "daily"
+
+    def test_round_trip_through_csv(self, migrated_db, templates_jsonl, tmp_path):
+        """Export to CSV and re-import should preserve JSON columns."""
+        transfer = BulkTransfer(migrated_db, chunk_size=7)
+        transfer.import_records("templates", templates_jsonl)
+
+        csv_path = str(tmp_path / "templates.csv")
+        assert transfer.export_records("templates", csv_path) == 25
+
+        conn = sqlite3.connect(migrated_db)
+        conn.execute("DELETE FROM quest_templates")
+        conn.commit()
+        conn.close()
+
+        assert transfer.import_records("templates", csv_path) == 25
+        templates = Database(migrated_db).load_quest_templates()
+        assert templates[3].suggested_locations[0]["neighborhood"] == "Inner Richmond"
+        assert templates[3].difficulty_factors is None
+
+    def test_bad_record_rolls_back_whole_import(self, migrated_db, tmp_path):
+        """A malformed line should leave the database untouched."""
+        path = tmp_path / "bad.jsonl"
+        with open(path, "w") as f:
+            for template in TEMPLATES[:15]:
+                f.write(json.dumps(template) + "\n")
+            f.write("{not json\n")
+
+        with pytest.raises(ValueError, match="bad.jsonl:16"):
+            BulkTransfer(migrated_db, chunk_size=10).import_records("templates", str(path))
+
+        assert Database(migrated_db).load_quest_templates() == []
+
+
+class TestQuestExport:
+    """Test exporting quests and completions through the engine."""
+
+    def test_engine_round_trip(self, migrated_db, tmp_path):
+        """Quests and completions exported from one DB should load into another."""
+        from src.engine import MOOdBBSEngine
+
+        engine = MOOdBBSEngine(db_path=migrated_db)
+        quest = engine.create_quest(title="Visit SFMOMA", category="experiential", xp_reward=25)
+        engine.complete_quest(quest.id)
+
+        quests_path = str(tmp_path / "quests.jsonl")
+        completions_path = str(tmp_path / "completions.csv")
+        assert engine.export_records("quests", quests_path) == 1
+        assert engine.export_records("completions", completions_path) == 1
+
+        other_db = str(tmp_path / "other.db")
+        other = MOOdBBSEngine(db_path=other_db)
+        assert other.import_records("quests", quests_path) == 1
+        assert other.import_records("completions", completions_path) == 1
+
+        assert other.get_quest_by_id(quest.id).title == "Visit SFMOMA"
+        assert other.get_quest_stats().total_completed == 1
+
+    @pytest.mark.parametrize("suffix", ["jsonl", "csv"])
+    def test_completion_modifiers_round_trip(self, migrated_db, tmp_path, suffix):
+        from src.engine import MOOdBBSEngine
+
+        engine = MOOdBBSEngine(db_path=migrated_db)
+        quest = engine.create_quest(title="Visit SFMOMA", category="experiential", xp_reward=25)
+        engine.complete_quest(quest.id, additional_modifiers=[("Inspired", 3)])
+        logged = Database(migrated_db).load_quest_completions()[0].mood_modifiers_logged
+        assert ("Inspired", 3) in logged
+
+        quests_path = str(tmp_path / "quests.jsonl")
+        completions_path = str(tmp_path / f"completions.{suffix}")
+        engine.export_records("quests", quests_path)
+        engine.export_records("completions", completions_path)
+
+        other_db = str(tmp_path / "other.db")
+        other = MOOdBBSEngine(db_path=other_db)
+        other.import_records("quests", quests_path)
+        other.import_records("completions", completions_path)
+        # Importing again replaces the modifiers rather than adding to them
+        other.import_records("completions", completions_path)
+
+        assert Database(other_db).load_quest_completions()[0].mood_modifiers_logged == logged
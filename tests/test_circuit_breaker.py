@@ -0,0 +1,127 @@
+"""Tests for the circuit breaker and its use in the Ollama client."""
+
+import pytest
+import requests
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.llm_quest_parser import LLMQuestParser, get_session
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class DownSession:
+    """Session whose every request fails to connect."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def _fail(self, *args, **kwargs):
+        self.requests += 1
+        raise requests.ConnectionError("connection refused")
+
+    post = _fail
+    get = _fail
+
+
+class UpSession:
+    def __init__(self):
+        self.requests = 0
+
+    def get(self, url, timeout=None):
+        self.requests += 1
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=3, reset_timeout=30, availability_ttl=60, clock=clock)
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_trial(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now += 30
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.now += 30
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_known_availability_expires(self, breaker, clock):
+        assert breaker.known_availability() is None
+
+        breaker.record_success()
+        assert breaker.known_availability() is True
+
+        clock.now += 60
+        assert breaker.known_availability() is None
+
+
+class TestParserFailFast:
+    """Test that the parser stops calling a dead host."""
+
+    def test_down_host_fails_fast(self, breaker):
+        session = DownSession()
+        parser = LLMQuestParser(session=session, breaker=breaker)
+
+        for _ in range(3):
+            assert parser.parse_quest("walk") is None
+        assert breaker.state == CircuitBreaker.OPEN
+
+        # Further calls are refused without touching the network
+        assert parser.parse_quest("walk") is None
+        assert parser.is_available() is False
+        assert session.requests == 3
+
+    def test_availability_is_remembered(self, breaker):
+        session = UpSession()
+        parser = LLMQuestParser(session=session, breaker=breaker)
+
+        assert parser.is_available()
+        assert parser.is_available()
+        assert session.requests == 1
+
+    def test_shared_session_per_host(self):
+        assert get_session("http://example.invalid:11434") is get_session("http://example.invalid:11434")
+        assert get_session("http://example.invalid:11434") is not get_session("http://other.invalid:11434")
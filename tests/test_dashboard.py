@@ -0,0 +1,201 @@
+"""Tests for the engine's dashboard snapshot."""
+
+import dataclasses
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.engine import MOOdBBSEngine
+
+
+@pytest.fixture
+def engine(migrated_db):
+    return MOOdBBSEngine(db_path=migrated_db)
+
+
+class CountingDatabase:
+    """Counts SQL statements run through the engine's database."""
+
+    def __init__(self, db):
+        self.statements = 0
+        original = db._get_connection
+        counter = self
+
+        class Connection:
+            def __init__(self, conn):
+                self._conn = conn
+
+            def execute(self, *args):
+                counter.statements += 1
+                return self._conn.execute(*args)
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        @contextmanager
+        def counting_connection():
+            with original() as conn:
+                yield Connection(conn)
+
+        db._get_connection = counting_connection
+
+
+class TestDashboardSnapshot:
+    """Test building and caching the snapshot."""
+
+    def test_contents(self, engine):
+        engine.apply_moodlet(100)  # Joined MOOdBBS! (+5)
+        engine.log_mood_event("Sunny day", 3, "Nice weather", duration_hours=2)
+        engine.add_trait("Optimist", "Sees the bright side", 2)
+        quest = engine.create_quest(title="Walk to Ocean Beach", xp_reward=15)
+
+        snapshot = engine.get_dashboard_snapshot()
+
+        assert snapshot.mood_score == 10
+        assert snapshot.mood_face == ":)"
+        assert [m.title for m in snapshot.moodlets] == ["Joined MOOdBBS!"]
+        assert [(e.title, e.description) for e in snapshot.events] == [("Sunny day", "Nice weather")]
+        assert [t.name for t in snapshot.traits] == ["Optimist"]
+        assert [q.id for q in snapshot.active_quests] == [quest.id]
+        assert snapshot.active_quests[0].renewal_type is None
+        assert snapshot.setup_completed is False
+        assert snapshot.valid_until <= datetime.now(timezone.utc) + timedelta(hours=2)
+
+    def test_is_immutable(self, engine):
+        snapshot = engine.get_dashboard_snapshot()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.mood_score = 99
+        assert isinstance(snapshot.active_quests, tuple)
+
+    def test_reused_until_state_changes(self, engine):
+        first = engine.get_dashboard_snapshot()
+        assert engine.get_dashboard_snapshot() is first
+
+        engine.create_quest(title="Sketch at the Legion of Honor")
+        second = engine.get_dashboard_snapshot()
+
+        assert second is not first
+        assert second.state_version > first.state_version
+        assert len(second.active_quests) == 1
+        assert len(first.active_quests) == 0
+
+    def test_rebuilt_after_valid_until(self, engine):
+        stale = dataclasses.replace(
+            engine.get_dashboard_snapshot(), valid_until=datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+        engine._snapshot = stale
+
+        fresh = engine.get_dashboard_snapshot()
+
+        assert fresh is not stale
+        assert fresh.valid_until > fresh.built_at
+
+    def test_moodlets_not_requeried_while_unchanged(self, engine):
+        engine.apply_moodlet(100)
+        engine.get_dashboard_snapshot()
+        counter = CountingDatabase(engine.db)
+
+        engine.log_mood_event("Sunny day", 3)
+        snapshot = engine.get_dashboard_snapshot()
+
+        # Only the mood event insert; moodlets came from the cache
+        assert counter.statements == 1
+        assert len(snapshot.moodlets) == 1
+
+    def test_expired_moodlet_drops_out(self, engine, migrated_db):
+        engine.apply_moodlet(100)
+        assert len(engine.get_dashboard_snapshot().moodlets) == 1
+
+        past = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+        with sqlite3.connect(migrated_db) as conn:
+            conn.execute("UPDATE active_moodlets SET expires_at = ?, backoff_expires_at = NULL", (past,))
+        engine._moodlets_valid_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+        engine._snapshot = None
+
+        assert engine.get_dashboard_snapshot().moodlets == ()
+
+    def test_profile_changes_through_engine(self, engine):
+        profile = engine.get_user_profile()
+        profile.setup_completed = True
+        assert engine.get_dashboard_snapshot().setup_completed is False
+
+        engine.save_user_profile(profile)
+        assert engine.get_dashboard_snapshot().setup_completed is True
+
+    def test_delete_and_destroy_quests(self, engine):
+        keep = engine.create_quest(title="Knit a scarf")
+        gone = engine.create_quest(title="Visit SFMOMA")
+
+        engine.delete_quest(gone.id)
+        assert [q.id for q in engine.get_dashboard_snapshot().active_quests] == [keep.id]
+
+        engine.destroy_quest_data()
+        snapshot = engine.get_dashboard_snapshot()
+        assert snapshot.active_quests == ()
+        assert snapshot.total_xp == 0
+
+    def test_delete_and_destroy_remove_snoozes_and_modifiers(self, engine, migrated_db):
+        def rows(table):
+            with sqlite3.connect(migrated_db) as conn:
+                return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+        done = engine.create_quest(title="Knit a scarf")
+        engine.complete_quest(done.id, additional_modifiers=[("proud", 2)])
+        snoozed = engine.create_quest(title="Visit SFMOMA")
+        engine.snooze_quest(snoozed.id, reason_category="weather")
+        other = engine.create_quest(title="Walk to Ocean Beach")
+        engine.snooze_quest(other.id, reason_category="tired")
+        assert rows("quest_completion_modifiers") > 0
+
+        engine.delete_quest(done.id)
+        engine.delete_quest(snoozed.id)
+        assert rows("quest_completion_modifiers") == 0
+        assert rows("quest_snoozes") == 1
+        assert [s.quest_id for s in engine.quest_manager._snoozes.values()] == [other.id]
+
+        engine.destroy_quest_data()
+        assert rows("quest_snoozes") == 0
+        assert engine.quest_manager._snoozes == {}
+
+
+class TestOtherProcesses:
+    """Test picking up changes another engine made to the same database."""
+
+    def test_changes_made_elsewhere_are_loaded(self, engine, migrated_db):
+        other = MOOdBBSEngine(db_path=migrated_db)
+        other.log_mood_event("Sunny day", 9)
+        quest = other.create_quest(title="Walk to Ocean Beach", xp_reward=15)
+
+        snapshot = engine.get_dashboard_snapshot()
+
+        assert snapshot.mood_score == 9
+        assert [q.id for q in snapshot.active_quests] == [quest.id]
+
+    def test_quest_completed_elsewhere_cannot_be_completed_again(self, engine, migrated_db):
+        quest = engine.create_quest(title="Walk to Ocean Beach", xp_reward=15)
+        other = MOOdBBSEngine(db_path=migrated_db)
+        other.complete_quest(quest.id)
+
+        with pytest.raises(ValueError, match="already completed"):
+            engine.complete_quest(quest.id)
+        assert engine.get_dashboard_snapshot().total_xp == 15
+
+    def test_ids_are_not_reused(self, engine, migrated_db):
+        other = MOOdBBSEngine(db_path=migrated_db)
+        first = other.log_mood_event("Sunny day", 3)
+        second = engine.log_mood_event("Rain", -2)
+
+        assert second.id != first.id
+        assert {e.event_type for e in MOOdBBSEngine(db_path=migrated_db).get_active_mood_events()} == {
+            "Sunny day", "Rain"
+        }
+
+    def test_own_writes_do_not_trigger_a_reload(self, engine):
+        engine.log_mood_event("Sunny day", 3)
+        engine.create_quest(title="Knit a scarf")
+
+        assert not engine.db.changed_elsewhere()
+        assert engine.refresh_if_changed() is False
@@ -0,0 +1,135 @@
+"""Tests for minimal-diff terminal output."""
+
+import io
+import re
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from src.tui.diff_render import DiffConsole
+
+
+class Screen:
+    """Just enough of a VT100 to replay what the renderer sends."""
+
+    def __init__(self, width=80, height=24):
+        self.width, self.height = width, height
+        self.rows = [[" "] * width for _ in range(height)]
+        self.row = self.col = 0
+
+    def feed(self, data):
+        for token in re.findall(r"\x1b\[[0-9;]*[A-Za-z]|.", data, re.S):
+            if token.startswith("\x1b["):
+                args, command = token[2:-1], token[-1]
+                if command == "H":
+                    row, _, col = args.partition(";")
+                    self.row, self.col = int(row or 1) - 1, int(col or 1) - 1
+                elif command == "J":
+                    if args == "2":
+                        self.rows = [[" "] * self.width for _ in range(self.height)]
+                    else:
+                        self.rows[self.row][self.col:] = [" "] * (self.width - self.col)
+                        for row in self.rows[self.row + 1:]:
+                            row[:] = [" "] * self.width
+                elif command == "K":
+                    self.rows[self.row][self.col:] = [" "] * (self.width - self.col)
+            elif token == "\r":
+                self.col = 0
+            elif token == "\n":
+                self.row += 1
+            else:
+                self.rows[self.row][self.col] = token
+                self.col += 1
+
+    def text(self):
+        return "\n".join("".join(row).rstrip() for row in self.rows).rstrip("\n")
+
+
+def screen_text(renderable, width=80):
+    console = Console(record=True, width=width, file=io.StringIO())
+    console.print(renderable, end="")
+    return "\n".join(line.rstrip() for line in console.export_text().split("\n")).rstrip("\n")
+
+
+def make_console(**kwargs):
+    return DiffConsole(
+        file=io.StringIO(), width=80, height=24, force_terminal=True, color_system="standard",
+        minimal_redraw=True, **kwargs
+    )
+
+
+def quest_table(xp, title="Walk Ocean Beach"):
+    table = Table(title="Active Quests")
+    table.add_column("Quest")
+    table.add_column("XP", justify="right")
+    table.add_row(title, str(xp))
+    table.add_row("Knit a scarf", "10")
+    return Panel(table, title="MOOdBBS")
+
+
+class TestDiffRenderer:
+    """Test frames drawn through the renderer."""
+
+    def test_frames_replay_to_the_same_screen(self):
+        console = make_console()
+        screen = Screen()
+
+        for renderable in (quest_table(15), quest_table(25), quest_table(25, "Visit SFMOMA"), "Goodbye"):
+            console.draw(renderable)
+            screen.feed(console.file.getvalue())
+            console.file.seek(0)
+            console.file.truncate()
+
+            assert screen.text() == screen_text(renderable)
+
+    def test_redraw_sends_a_fraction_of_the_bytes(self):
+        console = make_console()
+
+        full = console.draw(quest_table(15))
+        changed = console.draw(quest_table(25))
+        unchanged = console.draw(quest_table(25))
+
+        assert changed < full / 10
+        assert unchanged == 0
+        assert console.renderer.frames == 3
+        assert console.renderer.total_bytes == full + changed
+
+    def test_screens_between_prompts(self):
+        console = make_console()
+        screen = Screen()
+
+        console.clear()
+        console.print("[cyan]MOOdBBS Main Menu[/cyan]")
+        console.print("  1  WanderMOO")
+        choice = console.input("Select: ", stream=io.StringIO("1\n"))
+        screen.feed(console.file.getvalue())
+
+        assert choice.strip() == "1"
+        assert screen.text() == "MOOdBBS Main Menu\n  1  WanderMOO\nSelect:"
+        # The terminal echoes the answer; the model expects the cursor below it
+        assert console.renderer._cursor == (3, 0)
+
+    def test_passthrough_forces_a_repaint(self):
+        console = make_console()
+        console.draw("MOOdBBS")
+        console.clear()
+
+        with console.passthrough():
+            console.print("spinner")
+        console.print("MOOdBBS")
+        before = console.renderer.total_bytes
+        console.flush_frame()
+
+        assert console.renderer.total_bytes > before
+        assert console.file.getvalue().count("\x1b[H\x1b[2J") == 2
+
+    def test_off_by_default(self):
+        console = DiffConsole(file=io.StringIO(), width=80, force_terminal=True)
+
+        console.clear()
+        console.print("MOOdBBS")
+
+        assert not console.in_frame
+        assert "MOOdBBS" in console.file.getvalue()
+        assert console.flush_frame() == 0
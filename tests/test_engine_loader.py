@@ -0,0 +1,67 @@
+"""Tests for loading the engine behind the boot screen."""
+
+import time
+
+import pytest
+
+from src.engine import MOOdBBSEngine
+from src.tui.app import MOOdBBSApp
+from src.tui.startup import EngineLoader
+
+
+class TestEngineLoader:
+    """Test the background engine loader."""
+
+    def test_loads_and_warms_up_in_background(self, migrated_db):
+        def slow_factory():
+            time.sleep(0.2)
+            return MOOdBBSEngine(db_path=migrated_db)
+
+        start = time.monotonic()
+        loader = EngineLoader(slow_factory).start()
+        assert time.monotonic() - start < 0.1
+        assert not loader.done()
+
+        engine = loader.result(timeout=5)
+
+        assert loader.load_seconds >= 0.2
+        assert engine._snapshot is not None
+        assert engine._template_repository is not None
+        # Nothing changed since warm-up, so the first screen reuses its snapshot
+        assert engine.get_dashboard_snapshot() is engine._snapshot
+
+    def test_on_ready_runs_before_result(self, migrated_db):
+        ready = []
+        loader = EngineLoader(lambda: MOOdBBSEngine(db_path=migrated_db), on_ready=ready.append).start()
+
+        engine = loader.result(timeout=5)
+
+        assert ready == [engine]
+
+    def test_errors_surface_when_awaited(self):
+        def broken_factory():
+            raise ValueError("database is locked")
+
+        loader = EngineLoader(broken_factory).start()
+
+        with pytest.raises(ValueError, match="locked"):
+            loader.result(timeout=5)
+
+
+class TestAppStartup:
+    """Test that the boot screen hides the load time."""
+
+    def test_boot_screen_overlaps_engine_load(self, migrated_db):
+        def slow_factory():
+            time.sleep(0.3)
+            return MOOdBBSEngine(db_path=migrated_db)
+
+        start = time.monotonic()
+        app = MOOdBBSApp(warm_up_llm=False, engine_factory=slow_factory)
+        time.sleep(0.3)  # Stands in for the boot animation
+        app.wait_for_engine()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert app.mood_stats.engine is app.engine
+        assert app.wander_moo.engine is app.engine
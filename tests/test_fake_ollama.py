@@ -0,0 +1,95 @@
+"""Tests for LLMQuestParser against the fake Ollama server."""
+
+import time
+
+import pytest
+import requests
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.llm_quest_parser import LLMQuestParser, REQUIRED_FIELDS
+from src.services.parse_cache import ParseCache
+from tests.fake_ollama import FakeOllamaServer, ScriptedReply
+
+
+@pytest.fixture
+def server():
+    with FakeOllamaServer(seed=1) as srv:
+        yield srv
+
+
+def make_parser(server, **kwargs):
+    kwargs.setdefault("breaker", CircuitBreaker())
+    return LLMQuestParser(ollama_host=server.url, session=requests.Session(), **kwargs)
+
+
+class TestFakeOllamaServer:
+    """Test the parser end to end over HTTP."""
+
+    def test_tags_and_availability(self, server):
+        assert make_parser(server).is_available()
+        assert server.stats.tags == 1
+
+    def test_non_streaming_generate(self, server):
+        result = make_parser(server).parse_quest("Visit the Exploratorium")
+
+        assert result["title"] == "Visit the Exploratorium"
+        assert server.stats.generate == 1
+        assert server.stats.requests[0]["stream"] is False
+
+    def test_streaming_generate_aborts_early(self, server):
+        server.token_delay = 0.005
+        fields = []
+
+        result = make_parser(server, stream=True).parse_quest(
+            "Visit the Exploratorium", on_field=lambda k, v: fields.append(k), stop_after=REQUIRED_FIELDS
+        )
+
+        assert result["xp_reward"] == 20
+        assert fields[:4] == ["title", "description", "category", "xp_reward"]
+        assert "time_note" not in fields
+        assert server.stats.generate_streaming == 1
+
+    def test_scripted_replies(self, server):
+        server.script(
+            ScriptedReply(status=503),
+            ScriptedReply(response={"title": "Scripted", "category": "social", "xp_reward": 15}),
+            ScriptedReply(response="not json"),
+        )
+        parser = make_parser(server)
+
+        assert parser.parse_quest("a") is None
+        assert parser.parse_quest("b")["title"] == "Scripted"
+        assert parser.parse_quest("c") is None
+        assert parser.parse_quest("d")["title"] == "D"
+
+    def test_dropped_connection_is_a_failure(self, server):
+        server.script(ScriptedReply(drop=True))
+        breaker = CircuitBreaker()
+
+        assert make_parser(server, breaker=breaker).parse_quest("a") is None
+        assert breaker.known_availability() is False
+
+    def test_read_timeout(self, server):
+        server.latency = 0.5
+        parser = make_parser(server, timeout=(1.0, 0.1))
+
+        start = time.perf_counter()
+        assert parser.parse_quest("slow") is None
+        assert time.perf_counter() - start < 0.4
+
+    def test_failure_injection_opens_breaker(self, server):
+        server.failure_rate = 1.0
+        parser = make_parser(server, breaker=CircuitBreaker(failure_threshold=3))
+
+        for _ in range(5):
+            assert parser.parse_quest("x") is None
+
+        assert server.stats.failures == 3  # The breaker stopped the rest
+
+    def test_cache_hits_skip_server(self, server, tmp_path):
+        parser = make_parser(server, cache=ParseCache(str(tmp_path / "cache.db")))
+
+        parser.parse_quest("Visit the Exploratorium")
+        parser.parse_quest("visit the exploratorium")
+
+        assert server.stats.generate == 1
@@ -0,0 +1,143 @@
+"""Tests for streaming JSON field extraction and streaming parses."""
+
+import json
+
+import pytest
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.json_stream import JSONFieldStream
+from src.services.llm_quest_parser import LLMQuestParser, REQUIRED_FIELDS
+from src.services.parse_cache import ParseCache
+
+
+QUEST_JSON = json.dumps({
+    "title": "Weekly game night",
+    "description": "Play board games, {with} \"friends\", ok",
+    "category": "social",
+    "xp_reward": 15,
+    "renewal_type": "weekly",
+    "constraint_type": "day_of_week",
+    "constraint_note": "Friday",
+    "time_note": None,
+})
+
+
+def feed_in_chunks(text, size):
+    stream = JSONFieldStream()
+    fields = []
+    for i in range(0, len(text), size):
+        fields.extend(stream.feed(text[i:i + size]))
+    return stream, fields
+
+
+class TestJSONFieldStream:
+    """Test incremental field extraction."""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 1000])
+    def test_fields_match_full_parse_for_any_chunking(self, size):
+        stream, fields = feed_in_chunks(QUEST_JSON, size)
+
+        assert stream.complete
+        assert dict(fields) == json.loads(QUEST_JSON)
+        assert [name for name, _ in fields][:4] == ["title", "description", "category", "xp_reward"]
+
+    def test_field_surfaces_when_it_closes(self):
+        stream = JSONFieldStream()
+
+        assert stream.feed('{"title": "Wa') == []
+        assert stream.feed('lk", "xp_re') == [("title", "Walk")]
+        assert stream.feed('ward": 10') == []
+        assert stream.feed('}') == [("xp_reward", 10)]
+        assert stream.complete
+
+    def test_nested_values_and_leading_noise(self):
+        _, fields = feed_in_chunks(' \n{"tags": ["a", "b"], "meta": {"x": [1, 2]}, "n": null}', 4)
+
+        assert fields == [("tags", ["a", "b"]), ("meta", {"x": [1, 2]}), ("n", None)]
+
+    def test_ignores_text_after_object(self):
+        stream = JSONFieldStream()
+        stream.feed('{"a": 1}')
+
+        assert stream.feed(', "b": 2}') == []
+
+    def test_invalid_member_raises(self):
+        with pytest.raises(ValueError):
+            JSONFieldStream().feed('{"a": tru,')
+
+
+class StreamingResponse:
+    """Streams NDJSON chunks like Ollama, recording how far it was read."""
+
+    status_code = 200
+
+    def __init__(self, text, chunk_size=4):
+        self.chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        self.lines_read = 0
+        self.closed = False
+
+    def iter_lines(self):
+        for chunk in self.chunks:
+            self.lines_read += 1
+            yield json.dumps({"response": chunk, "done": False}).encode()
+        self.lines_read += 1
+        yield json.dumps({"response": "", "done": True}).encode()
+
+    def close(self):
+        self.closed = True
+
+
+class StreamingSession:
+    def __init__(self, text):
+        self.response = StreamingResponse(text)
+        self.requests = []
+
+    def post(self, url, json=None, timeout=None, stream=False):
+        self.requests.append(json)
+        return self.response
+
+
+def make_parser(session):
+    return LLMQuestParser(session=session, breaker=CircuitBreaker(), stream=True)
+
+
+class TestStreamingParser:
+    """Test parse_quest in streaming mode."""
+
+    def test_streams_all_fields(self):
+        session = StreamingSession(QUEST_JSON)
+        seen = []
+
+        result = make_parser(session).parse_quest("game night fridays", on_field=lambda k, v: seen.append(k))
+
+        assert result == json.loads(QUEST_JSON)
+        assert seen[0] == "title"
+        assert session.requests[0]["stream"] is True
+        assert session.response.closed
+
+    def test_aborts_once_required_fields_arrive(self):
+        session = StreamingSession(QUEST_JSON)
+
+        result = make_parser(session).parse_quest("game night fridays", stop_after=REQUIRED_FIELDS)
+
+        assert result["xp_reward"] == 15
+        assert result["renewal_type"] is None  # Defaulted, never generated
+        assert session.response.lines_read < len(session.response.chunks)
+        assert session.response.closed
+
+    def test_cut_short_parse_is_not_cached(self):
+        session = StreamingSession(QUEST_JSON)
+        parser = LLMQuestParser(session=session, breaker=CircuitBreaker(), stream=True, cache=ParseCache(path=None))
+
+        parser.parse_quest("game night fridays", stop_after=REQUIRED_FIELDS)
+        full = parser.parse_quest("game night fridays")
+        again = parser.parse_quest("game night fridays")
+
+        assert full["renewal_type"] == "weekly"
+        assert len(session.requests) == 2
+        assert again == full
+
+    def test_malformed_stream_fails_parse(self):
+        session = StreamingSession('{"title": "Walk", "category": oops}')
+
+        assert make_parser(session).parse_quest("walk") is None
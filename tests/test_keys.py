@@ -0,0 +1,203 @@
+"""Tests for single-keypress input."""
+
+import io
+import os
+
+import pytest
+
+from src.tui import screens
+from src.tui.diff_render import DiffConsole
+from src.tui.keys import KeyLatency, KeyPoller, NumpadInput, decode_keys
+
+
+@pytest.fixture
+def terminal():
+    """A pseudo-terminal: type into it with terminal.type(), read from terminal.stream."""
+    pytest.importorskip("termios")
+    master, slave = os.openpty()
+    stream = os.fdopen(slave, "r")
+
+    class Terminal:
+        def type(self, data):
+            os.write(master, data.encode())
+
+    term = Terminal()
+    term.stream = stream
+    yield term
+    stream.close()
+    os.close(master)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDecodeKeys:
+    """Test turning terminal input into key names."""
+
+    def test_plain_keys(self):
+        assert decode_keys("12.+-q") == ["1", "2", ".", "+", "-", "q"]
+
+    def test_named_keys(self):
+        assert decode_keys("\r\n\x7f\x1b") == ["enter", "enter", "backspace", "esc"]
+
+    def test_keypad_and_arrow_sequences(self):
+        # Keypad 7, Enter and "." with NumLock off, then an up arrow
+        assert decode_keys("\x1bOw\x1bOM\x1bOn\x1b[A") == ["7", "enter", ".", "up"]
+
+
+class TestKeyPoller:
+    """Test reading decoded keys."""
+
+    def test_reads_single_keys_from_a_terminal(self, terminal):
+        terminal.type("3\x1bOr")
+        with KeyPoller(terminal.stream) as keys:
+            assert keys.raw
+            assert keys.read_key(timeout=1) == "3"
+            assert keys.read_key(timeout=1) == "2"
+            assert keys.read_key(timeout=0.01) is None
+
+    def test_falls_back_to_lines(self):
+        with KeyPoller(io.StringIO("12\n\n")) as keys:
+            assert not keys.raw
+            assert keys.read_key() == "12"
+            assert keys.read_key() == "enter"
+            with pytest.raises(EOFError):
+                keys.read_key()
+
+
+class TestNumpadInput:
+    """Test answering menus with keypresses."""
+
+    def test_unambiguous_digit_answers_at_once(self, terminal):
+        terminal.type("7")
+        assert NumpadInput(terminal.stream).choose(["b"], max_number=9) == "7"
+
+    def test_longer_numbers_need_enter(self, terminal):
+        echoed = []
+        terminal.type("1\x0812\r")  # 1, Backspace, 12, Enter
+        assert NumpadInput(terminal.stream).choose([], max_number=12, echo=echoed.append) == "12"
+        assert echoed == ["1", "1", "2"]
+
+    def test_digit_that_cannot_grow_answers_at_once(self, terminal):
+        terminal.type("2")
+        # Nothing from 20 up exists, so 2 can only mean 2
+        assert NumpadInput(terminal.stream).choose([], max_number=12) == "2"
+
+    def test_ignores_invalid_keys(self, terminal):
+        terminal.type("9xd")
+        assert NumpadInput(terminal.stream).choose(["d", "q"], max_number=5) == "d"
+
+    def test_dot_means_back(self, terminal):
+        terminal.type(".")
+        assert NumpadInput(terminal.stream).choose(["c"], max_number=3, back="b") == "b"
+
+    def test_line_fallback(self):
+        assert NumpadInput(io.StringIO("q\n")).choose(["q"]) == "q"
+        assert NumpadInput(io.StringIO(".\n")).choose([], back="b") == "b"
+        assert not NumpadInput(io.StringIO()).available
+
+
+class TestKeyLatency:
+    """Test keypress-to-redraw measurement."""
+
+    def test_measures_from_key_to_next_prompt(self):
+        clock = FakeClock()
+        seen = []
+        latency = KeyLatency(hook=lambda key, seconds: seen.append((key, seconds)), clock=clock)
+
+        latency.rendered()  # First prompt: nothing pressed yet
+        for key, redraw in (("1", 0.02), ("b", 0.04), ("3", 0.15)):
+            latency.key_pressed(key)
+            clock.now += redraw
+            latency.rendered()
+
+        assert seen == [("1", pytest.approx(0.02)), ("b", pytest.approx(0.04)), ("3", pytest.approx(0.15))]
+        stats = latency.summary()
+        assert stats["count"] == 3
+        assert stats["p50_ms"] == 40.0
+        assert stats["max_ms"] == 150.0
+        assert stats["over_budget"] == 1
+
+    def test_numpad_input_feeds_the_meter(self, terminal):
+        clock = FakeClock()
+        latency = KeyLatency(clock=clock)
+        numpad = NumpadInput(terminal.stream, latency=latency)
+
+        terminal.type("1")
+        numpad.choose([], max_number=5)
+        clock.now += 0.03
+        terminal.type("b")
+        numpad.choose(["b"])
+
+        assert latency.samples == [pytest.approx(0.03)]
+
+    def test_empty_summary(self):
+        assert KeyLatency().summary()["count"] == 0
+
+    def test_discard(self):
+        latency = KeyLatency()
+        latency.key_pressed("3")
+        latency.discard()
+        latency.rendered()
+
+        assert latency.samples == []
+        assert latency.summary()["discarded"] == 1
+
+
+class TestScreenChoices:
+    """Test menus answered through the screens' choose()."""
+
+    def test_main_menu_takes_one_keypress(self, terminal, monkeypatch):
+        console = DiffConsole(file=io.StringIO(), width=80, force_terminal=True)
+        monkeypatch.setattr(screens, "console", console)
+        monkeypatch.setattr(screens, "numpad", NumpadInput(terminal.stream))
+
+        terminal.type("3")
+        assert screens.MainMenuScreen().get_choice() == "3"
+        assert "Select option" in console.file.getvalue()
+
+    def test_text_key_reads_the_rest_as_a_line(self, terminal, monkeypatch):
+        console = DiffConsole(file=io.StringIO(), width=80, force_terminal=True)
+        monkeypatch.setattr(screens, "console", console)
+        monkeypatch.setattr(screens, "numpad", NumpadInput(terminal.stream))
+        monkeypatch.setattr("builtins.input", lambda prompt="": "Beach")
+
+        terminal.type("/")
+        assert screens.choose("Search: ", ["n"], text_keys="/") == "/beach"
+
+    def test_enter_comes_back_empty(self, terminal, monkeypatch):
+        monkeypatch.setattr(screens, "console", DiffConsole(file=io.StringIO(), width=80))
+        monkeypatch.setattr(screens, "numpad", NumpadInput(terminal.stream))
+
+        terminal.type("\r")
+        assert screens.choose("Press Enter", [""], back="") == ""
+
+    def test_latency_closes_at_the_next_frame(self, monkeypatch):
+        clock = FakeClock()
+        latency = KeyLatency(clock=clock)
+        console = DiffConsole(file=io.StringIO(), width=80, force_terminal=True, minimal_redraw=True)
+        console.on_draw = latency.rendered
+        monkeypatch.setattr(screens, "console", console)
+        monkeypatch.setattr(screens, "numpad", NumpadInput(io.StringIO(), latency=latency))
+        monkeypatch.setattr(screens.time, "sleep", lambda seconds: None)
+
+        latency.key_pressed("1")
+        clock.now += 0.02
+        console.clear()
+        console.print("WanderMOO")
+        console.flush_frame()
+        clock.now += 5  # Sitting at the prompt isn't part of anything
+        console.flush_frame()
+
+        latency.key_pressed("3")
+        clock.now += 0.01
+        screens.pause(1.5)  # The next screen waits on the clock: no sample
+        console.flush_frame()
+
+        assert latency.samples == [pytest.approx(0.02)]
+        assert latency.discarded == 1
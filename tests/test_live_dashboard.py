@@ -0,0 +1,127 @@
+"""Tests for the live dashboard's redraw loop."""
+
+import io
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from rich.console import Console
+
+from src.engine import MOOdBBSEngine
+from src.tui.keys import KeyPoller
+from src.tui.screens import LiveDashboardScreen, _WakePipe
+
+
+@pytest.fixture
+def engine(migrated_db):
+    return MOOdBBSEngine(db_path=migrated_db)
+
+
+class FakeLive:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, renderable, refresh=False):
+        self.updates.append(renderable)
+
+
+class ScriptedKeys:
+    """Stands in for KeyPoller: runs one action per poll, then presses q."""
+
+    def __init__(self, *actions, sleep=False):
+        self.actions = list(actions)
+        self.timeouts = []
+        self.sleep = sleep
+
+    def poll(self, timeout, wake_fd=None):
+        self.timeouts.append(timeout)
+        if not self.actions:
+            return "q"
+        action = self.actions.pop(0)
+        if self.sleep:
+            time.sleep(timeout)
+        if action is not None:
+            action()
+        return None
+
+
+class TestRedrawLoop:
+    """Test when the dashboard redraws."""
+
+    def test_idle_dashboard_draws_once_and_sleeps_until_deadline(self, engine):
+        screen = LiveDashboardScreen(engine)
+        keys = ScriptedKeys(None, None)
+
+        screen.run(keys, FakeLive())
+
+        assert screen.redraws == 1
+        # Nothing expires, so it sleeps until the snapshot's deadline (midnight UTC)
+        until_deadline = (engine.get_dashboard_snapshot().valid_until - datetime.now(timezone.utc)).total_seconds()
+        assert keys.timeouts[0] == pytest.approx(until_deadline, abs=1)
+
+    def test_redraws_on_engine_change(self, engine):
+        screen = LiveDashboardScreen(engine)
+        live = FakeLive()
+        keys = ScriptedKeys(lambda: engine.create_quest(title="Knit a scarf"), None)
+
+        screen.run(keys, live)
+
+        assert screen.redraws == 2
+
+    def test_redraws_when_a_modifier_expires(self, engine):
+        event = engine.log_mood_event("Sunny day", 3, duration_hours=1)
+        event.expires_at = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+        engine._mark_changed()
+
+        screen = LiveDashboardScreen(engine)
+        keys = ScriptedKeys(None, sleep=True)
+        screen.run(keys, FakeLive())
+
+        assert keys.timeouts[0] < 0.5
+        assert screen.redraws == 2
+        assert engine.get_dashboard_snapshot().events == ()
+
+    def test_exit_keys(self, engine):
+        screen = LiveDashboardScreen(engine)
+
+        class EnterKeys:
+            def poll(self, timeout, wake_fd=None):
+                return "\n"
+
+        screen.run(EnterKeys(), FakeLive())
+        assert screen.redraws == 1
+
+    def test_render(self, engine):
+        engine.apply_moodlet(100)
+        engine.create_quest(title="Knit a scarf", xp_reward=15)
+
+        console = Console(record=True, width=80)
+        console.print(LiveDashboardScreen.render(engine.get_dashboard_snapshot()))
+        output = console.export_text()
+
+        assert ":|" in output and "+5" in output
+        assert "Joined MOOdBBS!" in output
+        assert "Knit a scarf" in output
+
+
+class TestWakePipe:
+    """Test waking a blocked poll from another thread."""
+
+    def test_change_listener_wakes_poll(self, engine):
+        wake = _WakePipe()
+        engine.add_change_listener(wake.signal)
+        try:
+            timer = threading.Timer(0.05, lambda: engine.create_quest(title="Knit a scarf"))
+            timer.start()
+
+            start = time.monotonic()
+            key = KeyPoller(stream=io.StringIO()).poll(5.0, wake_fd=wake.fd)
+            elapsed = time.monotonic() - start
+            timer.join()
+        finally:
+            engine.remove_change_listener(wake.signal)
+            wake.close()
+
+        assert key is None
+        assert elapsed < 1.0
@@ -0,0 +1,162 @@
+"""Tests for LLM call instrumentation and the llm_calls report."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from src.database.db import Database, _percentile
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.llm_quest_parser import LLMCall, LLMQuestParser
+from src.services.parse_cache import ParseCache
+from src.services.rule_quest_parser import RuleQuestParser
+from tests.fake_ollama import FakeOllamaServer, ScriptedReply
+
+
+@pytest.fixture
+def server():
+    with FakeOllamaServer(seed=1) as srv:
+        yield srv
+
+
+def make_parser(server, **kwargs):
+    kwargs.setdefault("breaker", CircuitBreaker())
+    return LLMQuestParser(ollama_host=server.url, session=requests.Session(), **kwargs)
+
+
+class TestCallOutcomes:
+    """Test that every parse is recorded with its outcome."""
+
+    def test_successful_parse_keeps_ollama_stats(self, server):
+        server.latency = 0.02
+        parser = make_parser(server)
+
+        parser.parse_quest("Visit the Exploratorium")
+
+        call = parser.calls[-1]
+        assert call.kind == "parse"
+        assert call.outcome == "ok"
+        assert call.source == "llm"
+        assert call.prompt_eval_count > 0
+        assert call.eval_count > 0
+        assert call.total_ms == pytest.approx(20, abs=1)
+        assert call.wall_ms >= 20
+
+    def test_timeout(self, server):
+        server.script(ScriptedReply(response={"title": "Slow"}, delay=0.5))
+        parser = make_parser(server, timeout=(1.0, 0.1))
+
+        assert parser.parse_quest("slow idea") is None
+        assert parser.calls[-1].outcome == "timeout"
+        assert "Timeout" in parser.calls[-1].error
+
+    def test_http_error(self, server):
+        server.script(ScriptedReply(status=500))
+        parser = make_parser(server)
+
+        assert parser.parse_quest("broken idea") is None
+        assert parser.calls[-1].outcome == "http_error"
+
+    def test_invalid_json(self, server):
+        server.script(ScriptedReply(response="not json at all"))
+        parser = make_parser(server)
+
+        assert parser.parse_quest("garbled idea") is None
+        assert parser.calls[-1].outcome == "invalid_json"
+
+    def test_missing_fields(self, server):
+        server.script(ScriptedReply(response={"title": "Only a title"}))
+        parser = make_parser(server)
+
+        assert parser.parse_quest("thin idea") is None
+        assert parser.calls[-1].outcome == "missing_fields"
+
+    def test_circuit_open(self, server):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+        parser = make_parser(server, breaker=breaker)
+
+        assert parser.parse_quest("any idea") is None
+        assert parser.calls[-1].outcome == "circuit_open"
+        assert server.stats.generate == 0
+
+    def test_cache_hit(self, server, tmp_path):
+        parser = make_parser(server, cache=ParseCache(str(tmp_path / "cache.db")))
+
+        parser.parse_quest("Visit the Exploratorium")
+        parser.parse_quest("visit the exploratorium")
+
+        assert [c.source for c in parser.calls] == ["llm", "cache"]
+        assert parser.calls[-1].cache_hit
+        assert parser.calls[-1].eval_count is None
+
+    def test_rule_fast_path(self, server):
+        parser = make_parser(server, rule_parser=RuleQuestParser())
+
+        parser.parse_quest("Walk in Golden Gate Park every Sunday")
+
+        assert parser.calls[-1].source == "rules"
+        assert server.stats.generate == 0
+
+    def test_recorder_errors_do_not_break_parsing(self, server):
+        def broken_recorder(call):
+            raise sqlite3.OperationalError("no such table: llm_calls")
+
+        parser = make_parser(server, call_recorder=broken_recorder)
+
+        assert parser.parse_quest("Visit the Exploratorium") is not None
+
+
+class TestLLMCallStorage:
+    """Test saving calls and the latency report."""
+
+    def test_parser_records_to_database(self, server, migrated_db):
+        db = Database(migrated_db)
+        server.script(ScriptedReply(status=500))
+        parser = make_parser(server, call_recorder=db.record_llm_call)
+
+        parser.parse_quest("first idea")
+        parser.parse_quest("second idea")
+
+        with sqlite3.connect(migrated_db) as conn:
+            rows = conn.execute("SELECT outcome, source, cache_hit FROM llm_calls ORDER BY id").fetchall()
+        assert rows == [("http_error", "llm", 0), ("ok", "llm", 0)]
+
+    def test_report_percentiles_and_failure_rate(self, migrated_db):
+        db = Database(migrated_db)
+        for i in range(1, 21):
+            db.record_llm_call(LLMCall(
+                kind="parse", model="qwen2.5:7b", prompt_version=2,
+                outcome="ok" if i <= 18 else "timeout",
+                wall_ms=i * 100.0, eval_count=50, eval_ms=1000.0
+            ))
+        db.record_llm_call(LLMCall(kind="parse", model="qwen2.5:7b", prompt_version=2, source="cache", wall_ms=0.5))
+
+        report = db.get_llm_call_report()
+
+        llm = next(r for r in report if r["source"] == "llm")
+        assert llm["count"] == 20
+        assert llm["p50_ms"] == 1000.0
+        assert llm["p95_ms"] == 1900.0
+        assert llm["max_ms"] == 2000.0
+        assert llm["failure_rate"] == pytest.approx(0.1)
+        assert llm["outcomes"] == {"ok": 18, "timeout": 2}
+        assert llm["tokens_per_second"] == pytest.approx(50.0)
+
+        cache = next(r for r in report if r["source"] == "cache")
+        assert cache["count"] == 1
+        assert cache["failure_rate"] == 0
+
+    def test_report_excludes_old_calls(self, migrated_db):
+        db = Database(migrated_db)
+        old = datetime.now(timezone.utc) - timedelta(days=30)
+        db.record_llm_call(LLMCall(kind="parse", model="m", prompt_version=2, wall_ms=10.0, called_at=old))
+
+        assert db.get_llm_call_report(days=7) == []
+        assert db.get_llm_call_report(days=60)[0]["count"] == 1
+
+    def test_percentile_nearest_rank(self):
+        assert _percentile([5.0], 95) == 5.0
+        assert _percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+        assert _percentile([1.0, 2.0, 3.0, 4.0], 95) == 4.0
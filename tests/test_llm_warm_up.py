@@ -0,0 +1,118 @@
+"""Tests for prompt-prefix reuse, keep-alive and warm-up."""
+
+import json
+
+import requests
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.llm_quest_parser import LLMCall, LLMQuestParser, SYSTEM_PROMPT
+
+
+PARSED_TEXT = json.dumps({"title": "Walk", "category": "constitutional", "xp_reward": 10})
+
+OLLAMA_STATS = {
+    "total_duration": 900_000_000,
+    "load_duration": 1_000_000,
+    "prompt_eval_count": 24,
+    "prompt_eval_duration": 30_000_000,
+    "eval_count": 60,
+    "eval_duration": 800_000_000,
+}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, body):
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class RecordingSession:
+    def __init__(self):
+        self.bodies = []
+
+    def post(self, url, json=None, timeout=None):
+        self.bodies.append(json)
+        return FakeResponse({"response": PARSED_TEXT, "done": True, **OLLAMA_STATS})
+
+
+class DownSession:
+    def post(self, *args, **kwargs):
+        raise requests.ConnectionError("refused")
+
+
+def make_parser(session, **kwargs):
+    return LLMQuestParser(session=session, breaker=CircuitBreaker(), **kwargs)
+
+
+class TestPromptReuse:
+    """Test that only the user input varies between requests."""
+
+    def test_system_prompt_is_stable_and_prompt_is_short(self):
+        session = RecordingSession()
+        parser = make_parser(session)
+
+        parser.parse_quest("Daily morning walk")
+        parser.parse_quest("Visit the de Young", user_context="Member of: de Young")
+
+        first, second = session.bodies
+        assert first["system"] == second["system"] == SYSTEM_PROMPT
+        assert "Daily morning walk" in first["prompt"]
+        assert "Member of: de Young" in second["prompt"]
+        assert len(first["prompt"]) < 100
+        assert "Examples" not in first["prompt"]
+
+    def test_keep_alive(self):
+        session = RecordingSession()
+
+        make_parser(session).parse_quest("walk")
+        make_parser(session, keep_alive=None).parse_quest("walk")
+
+        assert session.bodies[0]["keep_alive"] == "30m"
+        assert "keep_alive" not in session.bodies[1]
+
+    def test_records_timings(self):
+        parser = make_parser(RecordingSession())
+
+        parser.parse_quest("walk")
+
+        call = parser.calls[-1]
+        assert call.kind == "parse"
+        assert call.prompt_eval_count == 24
+        assert call.prompt_eval_ms == 30.0
+        assert call.wall_ms >= 0
+
+
+class TestWarmUp:
+    """Test background model warm-up."""
+
+    def test_warm_up_generates_one_token(self):
+        session = RecordingSession()
+        parser = make_parser(session)
+
+        assert parser.warm_up() is True
+        assert parser.calls[-1].kind == "warm_up"
+
+        body = session.bodies[0]
+        assert body["system"] == SYSTEM_PROMPT
+        assert body["options"] == {"num_predict": 1}
+        assert "format" not in body
+        assert parser.breaker.known_availability() is True
+
+    def test_warm_up_marks_down_host_unavailable(self):
+        parser = make_parser(DownSession())
+
+        assert parser.warm_up() is False
+        assert parser.is_available() is False
+
+
+class TestLLMCall:
+    def test_missing_stats(self):
+        call = LLMCall(kind="parse", model="m", prompt_version=1)
+        call.add_response_stats({"eval_count": 5})
+
+        assert call.prompt_eval_ms is None
+        assert call.eval_count == 5
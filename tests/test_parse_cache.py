@@ -0,0 +1,160 @@
+"""Tests for the LLM parse cache."""
+
+import json
+import time
+
+import pytest
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.llm_quest_parser import LLMQuestParser
+from src.services.parse_cache import ParseCache, normalize_input
+
+
+PARSED = {
+    "title": "Weekly game night",
+    "description": "Play board games with friends",
+    "category": "social",
+    "xp_reward": 15,
+    "renewal_type": "weekly",
+    "constraint_type": "day_of_week",
+    "constraint_note": "Friday",
+    "time_note": None,
+}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return {"response": json.dumps(self._payload)}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "parse_cache.db")
+
+
+class FakeSession:
+    """Stands in for requests.Session, counting generate calls."""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def post(self, url, json=None, timeout=None):
+        self.calls.append(json["prompt"])
+        if self.error:
+            raise self.error
+        return FakeResponse(PARSED)
+
+
+def make_parser(cache, session):
+    return LLMQuestParser(cache=cache, session=session, breaker=CircuitBreaker())
+
+
+@pytest.fixture
+def fake_ollama():
+    return FakeSession()
+
+
+class TestNormalizeInput:
+    """Test input normalization."""
+
+    def test_case_whitespace_and_punctuation(self):
+        assert normalize_input("  Weekly  game night on Fridays. ") == "weekly game night on fridays"
+        assert normalize_input('"weekly game night on fridays"') == "weekly game night on fridays"
+
+
+class TestParseCache:
+    """Test the two-level cache."""
+
+    def test_key_depends_on_model_context_and_prompt_version(self):
+        base = ParseCache.make_key("walk", "", "qwen2.5:7b", 1)
+        assert base == ParseCache.make_key("Walk!", "", "qwen2.5:7b", 1)
+        assert base != ParseCache.make_key("walk", "", "llama3", 1)
+        assert base != ParseCache.make_key("walk", "member of SFMOMA", "qwen2.5:7b", 1)
+        assert base != ParseCache.make_key("walk", "", "qwen2.5:7b", 2)
+
+    def test_persists_across_instances(self, cache_path):
+        cache = ParseCache(cache_path)
+        cache.put("k", PARSED)
+        cache.close()
+
+        reopened = ParseCache(cache_path)
+        assert reopened.get("k") == PARSED
+        reopened.close()
+
+    def test_returns_copies(self, cache_path):
+        cache = ParseCache(cache_path)
+        cache.put("k", PARSED)
+
+        cache.get("k")["xp_reward"] = 999
+
+        assert cache.get("k")["xp_reward"] == 15
+        cache.close()
+
+    def test_ttl_expiry(self, cache_path):
+        cache = ParseCache(cache_path, ttl_seconds=0.05)
+        cache.put("k", PARSED)
+        assert cache.get("k") is not None
+
+        time.sleep(0.06)
+
+        assert cache.get("k") is None
+        cache.close()
+
+    def test_size_eviction_keeps_recently_used(self, cache_path):
+        cache = ParseCache(cache_path, memory_size=2, max_entries=3)
+        for key in ("a", "b", "c"):
+            cache.put(key, PARSED)
+            time.sleep(0.001)
+
+        cache.get("a")  # Touch 'a' in the store (it has fallen out of memory)
+        time.sleep(0.001)
+        cache.put("d", PARSED)
+
+        assert len(cache) == 3
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        cache.close()
+
+    def test_memory_only(self):
+        cache = ParseCache(path=None)
+        cache.put("k", PARSED)
+        assert cache.get("k") == PARSED
+        assert len(cache) == 1
+
+
+class TestCachedParser:
+    """Test LLMQuestParser with a cache."""
+
+    def test_repeat_parse_skips_model(self, cache_path, fake_ollama):
+        parser = make_parser(ParseCache(cache_path), fake_ollama)
+
+        first = parser.parse_quest("weekly game night on fridays")
+        second = parser.parse_quest("Weekly game night on Fridays")
+
+        assert first == second == PARSED
+        assert len(fake_ollama.calls) == 1
+        assert parser.cache.hits == 1
+
+    def test_cache_survives_restart(self, cache_path, fake_ollama):
+        make_parser(ParseCache(cache_path), fake_ollama).parse_quest("Visit SFMOMA")
+
+        restarted = make_parser(ParseCache(cache_path), fake_ollama)
+        start = time.perf_counter()
+        result = restarted.parse_quest("visit sfmoma")
+        elapsed = time.perf_counter() - start
+
+        assert result == PARSED
+        assert len(fake_ollama.calls) == 1
+        assert elapsed < 0.01
+
+    def test_failures_are_not_cached(self, cache_path):
+        parser = make_parser(ParseCache(cache_path), FakeSession(error=ConnectionError("ollama down")))
+
+        assert parser.parse_quest("walk") is None
+        assert len(parser.cache) == 0
@@ -0,0 +1,121 @@
+"""Tests for near-duplicate quest detection."""
+
+import random
+import time
+
+import pytest
+
+from src.services.quest_dedup import DuplicateQuestError, TrigramIndex, similarity, trigrams
+
+
+class TestTrigrams:
+    """Test trigram extraction and similarity."""
+
+    def test_word_order_and_case_do_not_matter(self):
+        assert trigrams("Visit SFMOMA") == trigrams("sfmoma visit")
+
+    def test_stopwords_are_ignored(self):
+        assert trigrams("Visit the SFMOMA") == trigrams("Visit SFMOMA")
+
+    def test_similarity(self):
+        assert similarity(trigrams("Walk along Ocean Beach"), trigrams("Ocean Beach walk")) > 0.6
+        assert similarity(trigrams("Call mom"), trigrams("Call dad")) < 0.6
+        assert similarity(trigrams(""), trigrams("Walk")) == 0.0
+
+
+class TestTrigramIndex:
+    """Test duplicate lookups."""
+
+    def test_finds_reordered_title(self):
+        index = TrigramIndex()
+        index.add("quest", 1, "Visit SFMOMA")
+        index.add("quest", 2, "Call mom")
+
+        matches = index.find("SFMOMA visit")
+
+        assert [(m.kind, m.id) for m in matches] == [("quest", 1)]
+        assert matches[0].similarity == 1.0
+
+    def test_different_locations_are_not_duplicates(self):
+        index = TrigramIndex()
+        index.add("quest", 1, "Morning walk", location="Ocean Beach")
+
+        assert index.find("Morning walk", location="Dolores Park") == []
+        assert len(index.find("Morning walk", location="ocean beach")) == 1
+        assert len(index.find("Morning walk")) == 1
+
+    def test_different_numbers_are_not_duplicates(self):
+        index = TrigramIndex()
+        index.add("quest", 1, "Read chapter 3")
+
+        assert index.find("Read chapter 4") == []
+        assert len(index.find("read chapter 3")) == 1
+
+    def test_remove_and_replace(self):
+        index = TrigramIndex()
+        index.add("template", "sfmoma", "Visit SFMOMA")
+        index.add("template", "sfmoma", "Sketch at the Legion of Honor")
+
+        assert len(index) == 1
+        assert index.find("Visit SFMOMA") == []
+
+        index.remove("template", "sfmoma")
+        assert len(index) == 0
+        assert index.find("Legion of Honor sketch") == []
+
+    def test_lookup_over_large_history_is_fast(self):
+        rng = random.Random(7)
+        verbs = ["Visit", "Walk", "Sketch", "Bike", "Picnic", "Read", "Call", "Cook", "Hike", "Swim"]
+        places = ["Ocean Beach", "Dolores Park", "Twin Peaks", "Presidio", "Lands End", "Coit Tower",
+                  "Golden Gate Park", "Bernal Hill", "Crissy Field", "Glen Canyon"]
+        index = TrigramIndex()
+        for i in range(30000):
+            index.add("quest", i, f"{rng.choice(verbs)} {rng.choice(places)} {rng.choice(places)} {i}")
+        index.add("quest", "target", "Visit the Exploratorium")
+
+        start = time.perf_counter()
+        for _ in range(10):
+            matches = index.find("Exploratorium visit")
+            common = index.find("Walk Ocean Beach Dolores Park")
+        elapsed = (time.perf_counter() - start) / 20
+
+        assert matches[0].id == "target"
+        assert len(common) == 5
+        assert elapsed < 0.01
+
+
+class TestEngineDuplicates:
+    """Test duplicate checks through the engine."""
+
+    @pytest.fixture
+    def engine(self, migrated_db):
+        from src.engine import MOOdBBSEngine
+        return MOOdBBSEngine(db_path=migrated_db)
+
+    def test_flags_existing_quest_and_template(self, engine):
+        engine.create_quest(title="Visit SFMOMA", xp_reward=25)
+
+        quest_match = engine.find_duplicate_quests("SFMOMA visit")[0]
+        assert quest_match.kind == "quest"
+        assert quest_match.status == "active"
+
+        template_match = engine.find_duplicate_quests("Ocean Beach walk")[0]
+        assert (template_match.kind, template_match.id) == ("template", "ocean_beach_walk")
+
+    def test_create_quest_refuses_duplicates_on_request(self, engine):
+        engine.create_quest(title="Visit SFMOMA")
+
+        with pytest.raises(DuplicateQuestError) as excinfo:
+            engine.create_quest(title="sfmoma visit", allow_duplicate=False)
+        assert excinfo.value.matches[0].title == "Visit SFMOMA"
+
+        # Default still creates, and new quests are indexed incrementally
+        engine.create_quest(title="Knit a scarf")
+        assert engine.find_duplicate_quests("Scarf knitting")[0].title == "Knit a scarf"
+
+    def test_status_reflects_current_state(self, engine):
+        quest = engine.create_quest(title="Visit SFMOMA")
+        engine.find_duplicate_quests("Visit SFMOMA")
+        engine.hide_quest(quest.id)
+
+        assert engine.find_duplicate_quests("Visit SFMOMA")[0].status == "hidden"
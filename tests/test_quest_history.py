@@ -0,0 +1,107 @@
+"""Tests for paginated quest completion history."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from src.database.db import Database
+from src.domain.quests import Quest, QuestCompletion
+
+
+def _make_quest(quest_id: int, title: str) -> Quest:
+    return Quest(
+        id=quest_id,
+        template_id=None,
+        title=title,
+        description=f"{title} description",
+        category="social",
+        difficulty="easy",
+        location="",
+        xp_reward=10,
+        status="completed",
+        renewal_policy=None,
+        next_eligible_renewal=None,
+        renewal_count=0,
+        created_at=datetime.now(timezone.utc)
+    )
+
+
+def _make_completion(completion_id: int, quest_id: int, completed_at: datetime) -> QuestCompletion:
+    return QuestCompletion(
+        id=completion_id,
+        quest_id=quest_id,
+        completed_at=completed_at,
+        location_visited="",
+        duration_minutes=None,
+        notes="",
+        mood_modifiers_logged=[],
+        xp_awarded=10
+    )
+
+
+@pytest.fixture
+def history_db(temp_db):
+    """Database with 25 completions, one per day, newest first by id."""
+    db = Database(temp_db)
+    now = datetime.now(timezone.utc)
+    for i in range(1, 26):
+        db.save_quest(_make_quest(i, f"Quest {i}"))
+        db.save_quest_completion(_make_completion(i, i, now - timedelta(days=25 - i)))
+    return db
+
+
+class TestCompletionHistoryPage:
+    """Test keyset-paginated completion history."""
+
+    def test_first_page_is_most_recent(self, history_db):
+        """First page should start with the most recent completion."""
+        page, next_cursor = history_db.get_completion_history_page(limit=10)
+
+        assert len(page) == 10
+        assert page[0]['id'] == 25
+        assert page[0]['title'] == "Quest 25"
+        assert next_cursor is not None
+
+    def test_pages_cover_all_rows_once(self, history_db):
+        """Walking the cursor should visit every completion exactly once."""
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = history_db.get_completion_history_page(limit=10, cursor=cursor)
+            seen.extend(row['id'] for row in page)
+            if cursor is None:
+                break
+
+        assert seen == list(range(25, 0, -1))
+
+    def test_ties_on_completed_at_are_broken_by_id(self, temp_db):
+        """Completions sharing a timestamp should not be skipped or repeated."""
+        db = Database(temp_db)
+        same_time = datetime.now(timezone.utc)
+        db.save_quest(_make_quest(1, "Quest 1"))
+        for i in range(1, 6):
+            db.save_quest_completion(_make_completion(i, 1, same_time))
+
+        first, cursor = db.get_completion_history_page(limit=3)
+        second, cursor_after = db.get_completion_history_page(limit=3, cursor=cursor)
+
+        assert [r['id'] for r in first] == [5, 4, 3]
+        assert [r['id'] for r in second] == [2, 1]
+        assert cursor_after is None
+
+    def test_since_limits_range(self, history_db):
+        """Only completions after the lower bound should be returned."""
+        since = datetime.now(timezone.utc) - timedelta(days=2, hours=12)
+        page, next_cursor = history_db.get_completion_history_page(limit=10, since=since)
+
+        assert [r['id'] for r in page] == [25, 24, 23]
+        assert next_cursor is None
+
+    def test_deleted_quest_has_no_title(self, temp_db):
+        """A completion whose quest is gone should still be listed."""
+        db = Database(temp_db)
+        db.save_quest_completion(_make_completion(1, 99, datetime.now(timezone.utc)))
+
+        page, _ = db.get_completion_history_page()
+
+        assert page[0]['quest_id'] == 99
+        assert page[0]['title'] is None
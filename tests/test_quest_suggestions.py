@@ -0,0 +1,155 @@
+"""Tests for quest suggestion scoring."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.domain.quests import QuestCompletion, QuestSnooze, QuestTemplate, RenewalPolicy
+from src.domain.user_profile import UserProfile
+from src.services.quest_suggestions import QuestSuggester
+
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def _template(template_id, category="social", difficulty="easy", neighborhood=None, tags=None,
+              location_name=None, active_months=None):
+    locations = []
+    if neighborhood or location_name:
+        locations.append({"name": location_name or template_id, "neighborhood": neighborhood or ""})
+    renewal = RenewalPolicy(renewal_type="seasonal", cooldown_days=365, active_months=active_months) if active_months else None
+    return QuestTemplate(
+        id=template_id, title=template_id, description="", category=category,
+        difficulty=difficulty, base_xp=10, optionality="high",
+        suggested_locations=locations, duration_estimate="", tags=tags or [],
+        renewal_policy=renewal
+    )
+
+
+def _completion(completion_id, quest_id, location="", days_ago=1):
+    return QuestCompletion(
+        id=completion_id, quest_id=quest_id, completed_at=NOW - timedelta(days=days_ago),
+        location_visited=location, duration_minutes=None, notes="",
+        mood_modifiers_logged=[], xp_awarded=10
+    )
+
+
+def _snooze(snooze_id, reason_category):
+    return QuestSnooze(
+        id=snooze_id, quest_id=1, snoozed_at=NOW - timedelta(days=1),
+        return_at=NOW + timedelta(days=6), reason=None,
+        reason_category=reason_category, context={}
+    )
+
+
+def _suggest(suggester, k=3, **kwargs):
+    kwargs.setdefault("profile", UserProfile())
+    kwargs.setdefault("completions", [])
+    kwargs.setdefault("snoozes", [])
+    return suggester.suggest(k=k, now=NOW, **kwargs)
+
+
+class TestSuggestionScoring:
+    """Test the v2 generation heuristic."""
+
+    def test_prefers_unvisited_neighborhood(self):
+        suggester = QuestSuggester([
+            _template("visited", neighborhood="Inner Richmond"),
+            _template("unvisited", neighborhood="Mission"),
+        ])
+
+        results = _suggest(suggester, k=1, completions=[_completion(1, 1, location="Richmond (Inner)")])
+
+        assert results[0].template.id == "unvisited"
+        assert "New neighborhood to explore" in results[0].reasons
+
+    def test_balances_categories(self):
+        suggester = QuestSuggester([
+            _template("social_quest", category="social"),
+            _template("creative_quest", category="creative"),
+        ])
+        completions = [_completion(i, i) for i in range(1, 4)]
+
+        results = _suggest(
+            suggester, k=1, completions=completions,
+            completed_template_ids={1: "social_quest", 2: "social_quest", 3: "social_quest"}
+        )
+
+        assert results[0].template.id == "creative_quest"
+
+    def test_weather_snoozes_penalize_outdoor(self):
+        suggester = QuestSuggester([
+            _template("a_outdoor", tags=["outdoor"]),
+            _template("b_indoor", tags=["indoor"]),
+        ])
+
+        assert _suggest(suggester, k=1)[0].template.id == "a_outdoor"
+
+        results = _suggest(suggester, k=1, snoozes=[_snooze(1, "weather"), _snooze(2, "weather")])
+        assert results[0].template.id == "b_indoor"
+
+    def test_low_mood_prefers_easy(self):
+        suggester = QuestSuggester([
+            _template("a_hard", difficulty="hard"),
+            _template("b_easy", difficulty="easy"),
+        ])
+
+        assert _suggest(suggester, k=1, mood_score=-10)[0].template.id == "b_easy"
+
+    def test_excludes_in_progress_and_out_of_season(self):
+        suggester = QuestSuggester([
+            _template("active"),
+            _template("winter_only", active_months=[12, 1, 2]),
+            _template("available"),
+        ])
+
+        results = _suggest(suggester, exclude_template_ids={"active"})
+
+        assert [s.template.id for s in results] == ["available"]
+
+    def test_membership_bonus(self):
+        suggester = QuestSuggester([
+            _template("a_museum", location_name="Some Museum"),
+            _template("b_sfmoma", location_name="SFMOMA"),
+        ])
+
+        results = _suggest(suggester, k=1, profile=UserProfile(memberships=["SFMOMA"]))
+
+        assert results[0].template.id == "b_sfmoma"
+
+    def test_top_k_over_large_pool_is_fast(self):
+        categories = ["social", "constitutional", "creative", "experiential"]
+        difficulties = ["easy", "medium", "hard", "extreme"]
+        templates = [
+            _template(
+                f"t{i:05d}", category=categories[i % 4], difficulty=difficulties[i % 4],
+                neighborhood=f"Neighborhood {i % 40}", tags=["outdoor"] if i % 3 else ["indoor"]
+            )
+            for i in range(10000)
+        ]
+        suggester = QuestSuggester(templates)
+        completions = [_completion(i, i, location=f"Neighborhood {i}") for i in range(20)]
+
+        start = time.perf_counter()
+        results = _suggest(suggester, k=5, completions=completions, snoozes=[_snooze(1, "weather")])
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 5
+        assert results == sorted(results, key=lambda s: s.score, reverse=True)
+        assert elapsed < 0.05
+
+
+class TestEngineSuggestions:
+    """Test suggestions through the engine."""
+
+    def test_accept_suggestion_creates_quest(self, migrated_db):
+        from src.engine import MOOdBBSEngine
+
+        engine = MOOdBBSEngine(db_path=migrated_db)
+        suggestions = engine.suggest_quests(k=2)
+        assert len(suggestions) == 2
+
+        quest = engine.create_quest_from_template(suggestions[0].template.id)
+        assert quest.template_id == suggestions[0].template.id
+
+        # Accepted template is no longer suggested
+        assert quest.template_id not in [s.template.id for s in engine.suggest_quests(k=10)]
@@ -0,0 +1,147 @@
+"""Tests for the indexed quest template library."""
+
+import os
+import pytest
+from pathlib import Path
+
+from src.domain.quests import QuestTemplate
+from src.services.quest_templates import QuestTemplateRepository, normalize_key
+
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+TEMPLATE_YAML = """
+templates:
+  - id: coffee_clement
+    title: "Coffee on Clement Street"
+    category: social
+    difficulty: easy
+    base_xp: 15
+    optionality: high
+    suggested_locations:
+      - name: Clement Street
+        neighborhood: Richmond (Inner)
+    tags: [outdoor, food]
+
+  - id: dim_sum
+    title: "Dim sum in Chinatown"
+    category: social
+    difficulty: easy
+    base_xp: 15
+    optionality: high
+    suggested_locations:
+      - name: Chinatown
+        neighborhood: Chinatown
+    tags: [indoor, food]
+
+  - id: lands_end
+    title: "Hike Lands End"
+    category: constitutional
+    difficulty: medium
+    base_xp: 20
+    optionality: medium
+    suggested_locations:
+      - name: Lands End
+        neighborhood: Richmond (Outer)
+    renewal_policy:
+      type: monthly
+      cooldown_days: 30
+    tags: [outdoor, exercise]
+"""
+
+
+@pytest.fixture
+def template_file(tmp_path):
+    path = tmp_path / "quest_templates.yaml"
+    path.write_text(TEMPLATE_YAML)
+    return path
+
+
+class TestNormalizeKey:
+    """Test index key normalization."""
+
+    def test_neighborhood_word_order(self):
+        assert normalize_key("Richmond (Inner)") == normalize_key("Inner Richmond")
+
+    def test_case_insensitive(self):
+        assert normalize_key("Outdoor") == normalize_key("outdoor")
+
+
+class TestTemplateQueries:
+    """Test filtering through the inverted indexes."""
+
+    def test_load_from_yaml(self, template_file):
+        repo = QuestTemplateRepository.load([template_file], cache_path=None)
+
+        assert len(repo) == 3
+        assert repo.get("lands_end").renewal_policy.cooldown_days == 30
+
+    def test_combined_filters_intersect(self, template_file):
+        """Easy social quests tagged outdoor near Inner Richmond."""
+        repo = QuestTemplateRepository.load([template_file], cache_path=None)
+
+        results = repo.find(category="social", difficulty="easy", tags=["outdoor"], location="Inner Richmond")
+
+        assert [t.id for t in results] == ["coffee_clement"]
+
+    def test_any_of_values(self, template_file):
+        repo = QuestTemplateRepository.load([template_file], cache_path=None)
+
+        results = repo.find(difficulty=["easy", "medium"], tags="outdoor")
+
+        assert [t.id for t in results] == ["coffee_clement", "lands_end"]
+
+    def test_no_filters_returns_all(self, template_file):
+        repo = QuestTemplateRepository.load([template_file], cache_path=None)
+        assert len(repo.find()) == 3
+
+    def test_unknown_value_returns_nothing(self, template_file):
+        repo = QuestTemplateRepository.load([template_file], cache_path=None)
+        assert repo.find(category="social", tags="nonexistent") == []
+
+    def test_replacing_template_updates_indexes(self, template_file):
+        repo = QuestTemplateRepository.load([template_file], cache_path=None)
+        original = repo.get("dim_sum")
+
+        repo.add_templates([QuestTemplate(
+            id="dim_sum", title=original.title, description="", category="experiential",
+            difficulty="easy", base_xp=15, optionality="high",
+            suggested_locations=[], duration_estimate="", tags=["food"]
+        )])
+
+        assert [t.id for t in repo.find(category="social")] == ["coffee_clement"]
+        assert repo.find(location="Chinatown") == []
+
+
+class TestTemplateCache:
+    """Test the compiled template cache."""
+
+    def test_cache_used_when_yaml_unchanged(self, template_file, tmp_path, monkeypatch):
+        cache_path = tmp_path / "cache" / "templates.pickle"
+        QuestTemplateRepository.load([template_file], cache_path=cache_path)
+        assert cache_path.exists()
+
+        def fail_parse(path):
+            raise AssertionError("YAML should not be re-parsed")
+
+        monkeypatch.setattr(QuestTemplateRepository, "_parse_yaml", staticmethod(fail_parse))
+        repo = QuestTemplateRepository.load([template_file], cache_path=cache_path)
+
+        assert len(repo.find(category="social")) == 2
+
+    def test_cache_invalidated_when_yaml_changes(self, template_file, tmp_path):
+        cache_path = tmp_path / "templates.pickle"
+        QuestTemplateRepository.load([template_file], cache_path=cache_path)
+
+        template_file.write_text(TEMPLATE_YAML.split("  - id: dim_sum")[0])
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        repo = QuestTemplateRepository.load([template_file], cache_path=cache_path)
+        assert len(repo) == 1
+
+    def test_shipped_library_loads(self):
+        """The bundled config/quest_templates.yaml should parse."""
+        repo = QuestTemplateRepository.load([CONFIG_DIR / "quest_templates.yaml"], cache_path=None)
+        assert len(repo) > 0
+        assert repo.find(location="Inner Richmond")
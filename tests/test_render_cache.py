@@ -0,0 +1,74 @@
+"""Tests for the pre-rendered screen fragment cache."""
+
+import pytest
+from rich.console import Console
+from rich.panel import Panel
+
+from src.tui.render_cache import RenderCache, display_mode_for
+from src.tui.screens import MainMenuScreen
+
+
+def make_console(width=100, height=40):
+    return Console(record=True, width=width, height=height, force_terminal=True)
+
+
+class TestDisplayMode:
+    """Test picking a display mode from the terminal width."""
+
+    @pytest.mark.parametrize("width, mode", [(60, "tiny"), (79, "tiny"), (80, "small"), (128, "medium"), (240, "large")])
+    def test_modes(self, width, mode):
+        assert display_mode_for(width) == mode
+
+    def test_forced_mode(self):
+        assert RenderCache(mode="large").display_mode(make_console(width=60)) == "large"
+
+        with pytest.raises(ValueError):
+            RenderCache(mode="huge")
+
+
+class TestRenderCache:
+    """Test building, reusing and evicting fragments."""
+
+    def test_built_once_per_size_and_mode(self):
+        cache = RenderCache()
+        builds = []
+
+        def build(mode):
+            builds.append(mode)
+            return Panel("MOOdBBS")
+
+        console = make_console()
+        first = cache.get(console, "header", build)
+        assert cache.get(console, "header", build) is first
+        cache.get(make_console(width=60), "header", build)
+
+        assert builds == ["small", "tiny"]
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_replays_identical_output(self):
+        menu = MainMenuScreen()
+        direct, cached = make_console(), make_console()
+
+        direct.print(menu.build("small"))
+        cached.print(RenderCache().get(cached, "main_menu", menu.build))
+
+        assert cached.export_text(styles=True) == direct.export_text(styles=True)
+
+    def test_least_recently_used_evicted(self):
+        cache = RenderCache(max_entries=2)
+        console = make_console()
+
+        for name in ("a", "b", "a", "c"):
+            cache.get(console, name, lambda mode: name)
+
+        assert len(cache) == 2
+        cache.get(console, "a", lambda mode: "a")
+        assert cache.misses == 3  # a was kept, b was evicted
+
+    def test_tiny_main_menu_is_minimal(self):
+        console = make_console(width=60)
+        console.print(RenderCache().get(console, "main_menu", MainMenuScreen().build))
+        output = console.export_text()
+
+        assert "WanderMOO" in output
+        assert "View and manage your quests" not in output
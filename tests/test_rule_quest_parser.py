@@ -0,0 +1,128 @@
+"""Tests for the rule-based quest parser fast path."""
+
+import time
+
+import pytest
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.llm_quest_parser import LLMQuestParser
+from src.services.rule_quest_parser import RuleQuestParser
+
+
+@pytest.fixture
+def parser():
+    return RuleQuestParser()
+
+
+class TestRuleQuestParser:
+    """Test extraction on common phrasings."""
+
+    def test_weekly_day_of_week(self, parser):
+        result = parser.parse("Weekly game night on Fridays")
+
+        assert result.quest_data["title"] == "Weekly game night"
+        assert result.quest_data["category"] == "social"
+        assert result.quest_data["renewal_type"] == "weekly"
+        assert result.quest_data["constraint_type"] == "day_of_week"
+        assert result.quest_data["constraint_note"] == "Friday"
+        assert result.confidence >= LLMQuestParser.FAST_PATH_CONFIDENCE
+
+    def test_nth_weekday_and_description(self, parser):
+        result = parser.parse("First Friday Poetry at Coit Tower - go hear some spoken word in North Beach")
+
+        assert result.quest_data["title"] == "First Friday Poetry at Coit Tower"
+        assert result.quest_data["description"] == "go hear some spoken word in North Beach"
+        assert result.quest_data["category"] == "experiential"
+        assert result.quest_data["renewal_type"] == "monthly"
+        assert result.quest_data["constraint_type"] == "day_of_month"
+        assert result.quest_data["constraint_note"] == "first_friday"
+
+    def test_known_venue(self, parser):
+        result = parser.parse("Visit SFMOMA")
+
+        assert result.quest_data["category"] == "experiential"
+        assert result.quest_data["xp_reward"] == 25
+        assert result.quest_data["renewal_type"] == "seasonal"
+        assert result.confidence >= LLMQuestParser.FAST_PATH_CONFIDENCE
+
+    def test_daily(self, parser):
+        result = parser.parse("Daily morning walk around the block")
+
+        assert result.quest_data["category"] == "constitutional"
+        assert result.quest_data["renewal_type"] == "daily"
+        assert result.quest_data["xp_reward"] == 10
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Museum visit 10am-4:30pm", "10:00-16:30"),
+        ("Farmers market 8-1pm", "08:00-13:00"),
+        ("Open 10:00-17:00", "10:00-17:00"),
+    ])
+    def test_time_ranges(self, parser, text, expected):
+        result = parser.parse(text)
+
+        assert result.quest_data["constraint_type"] == "time_of_day"
+        assert result.quest_data["constraint_note"] == expected
+
+    def test_time_range_kept_alongside_day(self, parser):
+        result = parser.parse("Go to the farmers market every Saturday 8am-1pm")
+
+        assert result.quest_data["constraint_type"] == "day_of_week"
+        assert result.quest_data["constraint_note"] == "Saturday"
+        assert result.quest_data["time_note"] == "8am-1pm"
+
+    @pytest.mark.parametrize("text", [
+        "Call the dentist every Monday",
+        "Run errands every Saturday",
+    ])
+    def test_common_verb_and_weekday_is_not_enough(self, parser, text):
+        assert parser.parse(text).confidence < LLMQuestParser.FAST_PATH_CONFIDENCE
+
+    def test_vague_input_has_low_confidence(self, parser):
+        result = parser.parse("Learn to make sourdough")
+
+        assert result.confidence < LLMQuestParser.FAST_PATH_CONFIDENCE
+
+    def test_under_a_millisecond(self, parser):
+        text = "First Friday Poetry at Coit Tower - go hear some spoken word in North Beach"
+        start = time.perf_counter()
+        for _ in range(200):
+            parser.parse(text)
+        assert (time.perf_counter() - start) / 200 < 0.001
+
+
+class CountingSession:
+    def __init__(self):
+        self.calls = 0
+
+    def post(self, *args, **kwargs):
+        self.calls += 1
+        raise ConnectionError("should not be called")
+
+
+class TestFastPath:
+    """Test the fast path in front of the LLM."""
+
+    def test_confident_parse_skips_network(self):
+        session = CountingSession()
+        llm = LLMQuestParser(session=session, breaker=CircuitBreaker(), rule_parser=RuleQuestParser())
+        fields = []
+
+        result = llm.parse_quest("Weekly game night on Fridays", on_field=lambda k, v: fields.append(k))
+
+        assert result["constraint_note"] == "Friday"
+        assert "title" in fields
+        assert session.calls == 0
+
+    def test_low_confidence_falls_through(self):
+        session = CountingSession()
+        llm = LLMQuestParser(session=session, breaker=CircuitBreaker(), rule_parser=RuleQuestParser())
+
+        assert llm.parse_quest("Learn to make sourdough") is None
+        assert session.calls == 1
+
+    def test_common_verb_falls_through(self):
+        session = CountingSession()
+        llm = LLMQuestParser(session=session, breaker=CircuitBreaker(), rule_parser=RuleQuestParser())
+
+        assert llm.parse_quest("Call the dentist every Monday") is None
+        assert session.calls == 1
@@ -0,0 +1,116 @@
+"""Tests for running shell scripts in batch mode."""
+
+import sqlite3
+
+import pytest
+
+from src.engine import MOOdBBSEngine
+from src.shell.repl import MOOdBBSShell, main, split_command
+
+
+def count_rows(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestRunBatch:
+    """Test batch scripts against the shell."""
+
+    def test_script_runs_in_one_session(self, migrated_db):
+        shell = MOOdBBSShell(db_path=migrated_db)
+        script = [
+            "# morning routine",
+            "log custom \"Sunny day\" 3",
+            "",
+            "create quest Walk Ocean Beach category=constitutional xp=15",
+            "traits add Optimist 2 Sees the bright side",
+            "complete 1",
+        ]
+
+        assert shell.run_batch(script) == 0
+
+        engine = MOOdBBSEngine(db_path=migrated_db)
+        assert engine.get_user_stats()["total_xp"] == 15
+        assert [t.trait_name for t in engine.get_active_traits()] == ["Optimist"]
+        assert any(e.description == "Sunny day" for e in engine.get_active_mood_events())
+
+    def test_first_failure_rolls_back_everything(self, migrated_db, capsys):
+        shell = MOOdBBSShell(db_path=migrated_db)
+        events_before = count_rows(migrated_db, "mood_events")
+
+        status = shell.run_batch(["log custom Rain -2", "complete 99", "log custom Sun 2"], source="morning.txt")
+
+        assert status == 1
+        assert count_rows(migrated_db, "mood_events") == events_before
+        assert "morning.txt:2: complete 99" in capsys.readouterr().err
+
+    def test_prompts_fail_instead_of_reading_the_script(self, migrated_db):
+        shell = MOOdBBSShell(db_path=migrated_db)
+
+        status = shell.run_batch(["create quest Knit a scarf", "hide 1", "log custom Sun 2"])
+
+        assert status == 1
+        assert "batch mode" in shell.last_error
+        assert count_rows(migrated_db, "quests") == 0
+
+    def test_exit_stops_the_script(self, migrated_db):
+        shell = MOOdBBSShell(db_path=migrated_db)
+
+        assert shell.run_batch(["log custom Sun 2", "exit", "bogus"]) == 0
+        assert count_rows(migrated_db, "mood_events") >= 1
+
+    def test_main_exits_non_zero(self, migrated_db, tmp_path):
+        script = tmp_path / "script.txt"
+        script.write_text("log custom Sun 2\nfrobnicate\n")
+
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--db", migrated_db, "--batch", str(script)])
+
+        assert excinfo.value.code == 1
+
+
+class TestTransaction:
+    """Test grouping database operations into one transaction."""
+
+    def test_failed_operation_keeps_earlier_work(self, migrated_db):
+        engine = MOOdBBSEngine(db_path=migrated_db)
+
+        with engine.db.transaction():
+            engine.log_mood_event("custom", 2, "Sun")
+            with pytest.raises(sqlite3.Error):
+                with engine.db._get_connection() as conn:
+                    conn.execute(
+                        "INSERT INTO mood_events (event_type, modifier, description, created_at) "
+                        "VALUES ('custom', 1, 'Half written', '2026-01-01')"
+                    )
+                    conn.execute("INSERT INTO no_such_table VALUES (1)")
+            engine.log_mood_event("custom", 3, "More sun")
+
+        with sqlite3.connect(migrated_db) as conn:
+            descriptions = [row[0] for row in conn.execute("SELECT description FROM mood_events")]
+        assert "Sun" in descriptions and "More sun" in descriptions
+        assert "Half written" not in descriptions
+
+
+class TestUsageText:
+    """Test that optional arguments survive Rich markup."""
+
+    def test_help_shows_bracketed_arguments(self, migrated_db, capsys):
+        MOOdBBSShell(db_path=migrated_db).execute_command("help")
+
+        output = capsys.readouterr().out
+        assert "create ideas [file]" in output
+        assert "suggest [n]" in output
+        assert "[category=..]" in output
+
+    def test_usage_errors_show_bracketed_arguments(self, migrated_db):
+        shell = MOOdBBSShell(db_path=migrated_db, interactive=False)
+
+        shell.execute_command("suggest lots")
+
+        assert shell.last_error == "Usage: suggest [n]"
+
+
+def test_split_command():
+    assert split_command('log custom "Sunny day" 3') == ["log", "custom", "Sunny day", "3"]
+    assert split_command("log custom Mom's call 3") == ["log", "custom", "Mom's", "call", "3"]
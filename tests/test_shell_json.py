@@ -0,0 +1,93 @@
+"""Tests for the shell's JSON output modes."""
+
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+from src.domain.quests import RenewalPolicy
+from src.shell.json_output import to_jsonable
+from src.shell.repl import MOOdBBSShell, main
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def shell(migrated_db):
+    shell = MOOdBBSShell(db_path=migrated_db, interactive=False, output_format="json")
+    shell.engine.log_mood_event("custom", 3, "Sunny day")
+    shell.engine.create_quest(title="Walk Ocean Beach", xp_reward=15)
+    shell.engine.create_quest(title="Knit a scarf")
+    return shell
+
+
+class TestJsonOutput:
+    """Test commands writing JSON instead of Rich output."""
+
+    def test_mood(self, shell, capsys):
+        assert shell.execute_command("mood")
+
+        mood = json.loads(capsys.readouterr().out)
+        assert mood["score"] == 3
+        assert mood["active_events"][0]["description"] == "Sunny day"
+        assert mood["calculated_at"].endswith("+00:00")
+
+    def test_quests_as_array_or_lines(self, shell, capsys):
+        shell.execute_command("quests")
+        assert [q["title"] for q in json.loads(capsys.readouterr().out)] == ["Walk Ocean Beach", "Knit a scarf"]
+
+        shell.output_format = "jsonl"
+        shell.execute_command("quests")
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["xp_reward"] for line in lines] == [15, 10]
+
+    def test_stdout_stays_machine_readable(self, shell, capsys):
+        shell.execute_command("log custom Rain -2")
+        shell.execute_command("stats")
+        shell.execute_command("complete 99")
+
+        captured = capsys.readouterr()
+        assert json.loads(captured.out)["active_modifiers"] == 2
+        assert "Logged: Rain" in captured.err
+        assert "Quest 99 not found" in captured.err
+
+    def test_one_shot_exit_status(self, migrated_db, capsys):
+        with pytest.raises(SystemExit) as excinfo:
+            main(["mood", "--json", "--db", migrated_db])
+        assert excinfo.value.code == 0
+        assert json.loads(capsys.readouterr().out)["score"] == 0
+
+        with pytest.raises(SystemExit) as excinfo:
+            main(["complete", "99", "--json", "--db", migrated_db])
+        assert excinfo.value.code == 1
+
+    def test_one_shot_json_does_not_load_rich(self, migrated_db):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "shell.py", "--db", migrated_db, "mood", "--json"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+
+        assert json.loads(result.stdout)["face"]
+        assert "rich" not in result.stderr
+
+
+def test_to_jsonable():
+    class Phase(Enum):
+        BACKOFF = "backoff"
+
+    value = {
+        "policy": RenewalPolicy("seasonal", 30, active_months=[3, 4]),
+        "pair": (1, Phase.BACKOFF),
+        "at": datetime(2026, 3, 1, tzinfo=timezone.utc),
+    }
+
+    assert to_jsonable(value) == {
+        "policy": {"renewal_type": "seasonal", "cooldown_days": 30, "max_active_instances": 1,
+                   "active_months": [3, 4], "schedule": None},
+        "pair": [1, "backoff"],
+        "at": "2026-03-01T00:00:00+00:00",
+    }
@@ -0,0 +1,58 @@
+"""Tests for the startup import budget."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time for an entry point, in microseconds. The TUI
+# imports in ~50-90ms on a laptop; the budget leaves headroom for a
+# Pi Zero 2 W and a cold page cache, and fails if a heavy dependency
+# sneaks back onto the startup path.
+IMPORT_BUDGET_US = 250_000
+
+# Only needed once the user reaches the feature that uses them
+DEFERRED_MODULES = [
+    "requests",
+    "yaml",
+    "rich.layout",
+    "rich.pretty",
+    "src.services.llm_quest_parser",
+    "src.services.zipcode_validator",
+    "src.services.quest_dedup",
+]
+
+
+def import_times(module: str) -> dict:
+    """Import a module in a fresh interpreter and return cumulative times by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+@pytest.mark.parametrize("entry_point", ["src.tui.app", "src.shell.repl"])
+class TestStartupImports:
+    """Test what the entry points import at startup."""
+
+    def test_deferred_modules_not_imported(self, entry_point):
+        times = import_times(entry_point)
+
+        assert entry_point in times
+        assert [name for name in DEFERRED_MODULES if name in times] == []
+
+    def test_within_budget(self, entry_point):
+        # Best of three, so a busy machine doesn't fail the test
+        best = min(import_times(entry_point)[entry_point] for _ in range(3))
+
+        assert best < IMPORT_BUDGET_US
@@ -0,0 +1,112 @@
+"""Tests for the virtual scrolling list."""
+
+import io
+
+from rich.console import Console
+
+from src.engine import MOOdBBSEngine
+from src.tui.virtual_list import VirtualList
+
+
+class FakeHistory:
+    """Paginated source of numbered rows that counts fetches."""
+
+    def __init__(self, size):
+        self.size = size
+        self.fetches = 0
+
+    def __call__(self, cursor, limit):
+        self.fetches += 1
+        start = cursor or 0
+        rows = [f"Quest {i}" for i in range(start, min(start + limit, self.size))]
+        end = start + len(rows)
+        return rows, (end if end < self.size else None)
+
+
+def rendered_lines(virtual_list):
+    console = Console(file=io.StringIO(), width=80, record=True)
+    console.print(virtual_list.render())
+    return console.export_text().splitlines()
+
+
+class TestVirtualList:
+    """Test windowing, lazy fetching, jumping and searching."""
+
+    def test_opening_fetches_one_page_and_renders_one_window(self):
+        source = FakeHistory(100000)
+        history = VirtualList(source, str, height=10, page_size=50)
+
+        lines = rendered_lines(history)
+
+        assert source.fetches == 1
+        assert len(lines) == 11  # window plus position line
+        assert lines[0].strip() == "1 Quest 0"
+        assert lines[-1] == "1-10 of 50+"
+
+    def test_scrolling_fetches_only_when_needed(self):
+        source = FakeHistory(100000)
+        history = VirtualList(source, str, height=10, page_size=50)
+
+        for _ in range(4):
+            history.page_down()
+        assert source.fetches == 1
+        history.page_down()
+        assert source.fetches == 2
+        assert history.window()[0] == (50, "Quest 50")
+
+    def test_scrolls_stop_at_either_end(self):
+        history = VirtualList(FakeHistory(25), str, height=10, page_size=10)
+
+        history.page_up()
+        assert history.top == 0
+        for _ in range(5):
+            history.page_down()
+
+        assert history.top == 15
+        assert history.at_end
+        assert history.status() == "16-25 of 25"
+
+    def test_jump_and_search_across_pages(self):
+        source = FakeHistory(10000)
+        history = VirtualList(source, str, height=10, page_size=100)
+
+        assert history.navigate("g5001")
+        assert history.window()[0] == (5000, "Quest 5000")
+
+        assert history.navigate("/quest 9999")
+        assert history.selected == 9999
+        assert ">10000" in rendered_lines(history)[0].replace(" ", "")
+
+        assert not history.jump(20000)
+        assert not history.search("quest 42")  # Nothing after the selected row
+
+    def test_empty_list(self):
+        history = VirtualList(FakeHistory(0), str)
+
+        assert rendered_lines(history) == ["Nothing here yet"]
+        assert history.get(0) is None
+
+
+class TestMoodletPages:
+    """Test paging moodlets through the engine."""
+
+    def test_pages_cover_each_category_in_order(self, migrated_db):
+        engine = MOOdBBSEngine(db_path=migrated_db)
+        expected = {}
+        for moodlet in engine.get_all_event_moodlets():
+            expected.setdefault(moodlet['category'], []).append(moodlet)
+
+        categories = engine.get_event_moodlet_categories()
+        assert categories == [(category, len(rows)) for category, rows in sorted(expected.items())]
+
+        for category, rows in expected.items():
+            moodlets = VirtualList(
+                lambda cursor, limit: engine.get_event_moodlets_page(category, limit=limit, cursor=cursor),
+                str, page_size=3
+            )
+            moodlets.load_through(len(rows))
+
+            paged = moodlets.rows
+            assert sorted(m['id'] for m in paged) == sorted(m['id'] for m in rows)
+            assert [m['mood_value'] for m in paged] == sorted((m['mood_value'] for m in rows), reverse=True)
+            assert moodlets.exhausted